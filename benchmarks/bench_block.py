@@ -0,0 +1,27 @@
+"""try_block compared to the equivalent nested flatMap calls."""
+
+from tryingsnake import Success
+from tryingsnake.block import try_block
+from benchmarks.harness import timed
+
+A, B, C = Success(1), Success(2), Success(3)
+
+
+@timed("block.nested_flatMap")
+def nested_flat_map():
+    return A.flatMap(
+        lambda a: B.flatMap(lambda b: C.flatMap(lambda c: Success(a + b + c)))
+    )
+
+
+@try_block
+def _block():
+    a = yield A
+    b = yield B
+    c = yield C
+    return a + b + c
+
+
+@timed("block.try_block")
+def block():
+    return _block()
@@ -0,0 +1,41 @@
+"""Memory retained by failures under each traceback capture policy.
+
+Run with:
+
+    python -m benchmarks.bench_capture
+"""
+
+import tracemalloc
+from tryingsnake import Try_, Try
+
+
+def fail(x):
+    # Locals are kept alive by the traceback under the "full" policy
+    payload = list(range(16))
+    raise ValueError(x)
+
+
+def retained(policy, n):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        with Try_.capture(policy):
+            failures = [Try(fail, i) for i in range(n)]
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        del failures
+        tracemalloc.stop()
+
+
+def main(n=100_000):
+    for policy in ["full", "summary", "none"]:
+        size = retained(policy, n)
+        print(
+            "{0:<10}{1:>10.1f} MiB {2:>8.1f} B/failure".format(
+                policy, size / 2**20, size / n
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
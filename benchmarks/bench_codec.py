@@ -0,0 +1,50 @@
+"""tryingsnake.codec compared to plain pickle.
+
+Encoded sizes can be inspected with:
+
+    python -m benchmarks.bench_codec
+"""
+
+import pickle
+from tryingsnake import Success, Failure
+from tryingsnake import codec
+from benchmarks.harness import timed
+
+SUCCESS = Success(1)
+FAILURE = Failure(ValueError("e"))
+BATCH = [Success(i) for i in range(90)]
+BATCH += [Failure(ValueError(i)) for i in range(10)]
+
+CASES = [
+    ("pickle.success", lambda: pickle.dumps(SUCCESS, pickle.HIGHEST_PROTOCOL)),
+    ("codec.success", lambda: codec.dumps(SUCCESS)),
+    ("pickle.failure", lambda: pickle.dumps(FAILURE, pickle.HIGHEST_PROTOCOL)),
+    ("codec.failure", lambda: codec.dumps(FAILURE)),
+    ("pickle.batch", lambda: pickle.dumps(BATCH, pickle.HIGHEST_PROTOCOL)),
+    ("codec.batch", lambda: codec.dumps_batch(BATCH)),
+]
+
+for _name, _f in CASES:
+    timed("serialization." + _name, number=20_000)(_f)
+
+_SUCCESS_DATA = codec.dumps(SUCCESS)
+_BATCH_DATA = codec.dumps_batch(BATCH)
+
+
+@timed("serialization.codec.loads.success", number=20_000)
+def loads_success():
+    return codec.loads(_SUCCESS_DATA)
+
+
+@timed("serialization.codec.loads.batch", number=20_000)
+def loads_batch():
+    return codec.loads_batch(_BATCH_DATA)
+
+
+def main():
+    for name, f in CASES:
+        print("{0:<22}{1:>6} bytes".format(name, len(f())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Success / Failure combinators.
+
+Retained allocations per call can be inspected with:
+
+    python -m benchmarks.bench_combinators
+"""
+
+import tracemalloc
+from tryingsnake import Success, Failure
+from benchmarks.harness import timed
+
+SUCCESS = Success(1)
+FAILURE = Failure(Exception("e"))
+RESULT = Success(2)
+
+
+def identity(x):
+    return x
+
+
+def to_try(x):
+    return RESULT
+
+
+def always(x):
+    return True
+
+
+CASES = [
+    ("Success.map", lambda: SUCCESS.map(identity)),
+    ("Success.flatMap", lambda: SUCCESS.flatMap(to_try)),
+    ("Success.filter", lambda: SUCCESS.filter(always)),
+    ("Success.recover", lambda: SUCCESS.recover(identity)),
+    ("Success.recoverWith", lambda: SUCCESS.recoverWith(to_try)),
+    ("Failure.map", lambda: FAILURE.map(identity)),
+    ("Failure.flatMap", lambda: FAILURE.flatMap(to_try)),
+    ("Failure.filter", lambda: FAILURE.filter(always)),
+    ("Failure.recover", lambda: FAILURE.recover(identity)),
+    ("Failure.recoverWith", lambda: FAILURE.recoverWith(to_try)),
+]
+
+
+def blocks_per_call(f, n=10_000):
+    """Number of memory blocks retained by the results of n calls."""
+    results = [None] * n
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(n):
+            results[i] = f()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return sum(s.count_diff for s in stats if s.count_diff > 0) / n
+
+
+for _name, _f in CASES:
+    timed("combinators." + _name)(_f)
+
+
+def main():
+    for name, f in CASES:
+        print("{0:<22}{1:>6.2f} allocations".format(name, blocks_per_call(f)))
+
+
+if __name__ == "__main__":
+    main()
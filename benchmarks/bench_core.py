@@ -0,0 +1,144 @@
+"""Try, curried.Try and the generator paths compared to bare try / except."""
+
+import contextvars
+from operator import truediv
+from tryingsnake import Try_, Try, Success, Failure, _unhandled_exceptions
+from tryingsnake.curried import Try as CurriedTry, try_
+from benchmarks.harness import timed
+
+
+def identity(x):
+    return x
+
+
+def fail(x):
+    raise ValueError(x)
+
+
+@timed("baseline.call")
+def bare_call():
+    return identity(1)
+
+
+@timed("baseline.try_except.success")
+def bare_try_success():
+    try:
+        return identity(1)
+    except Exception as e:
+        return e
+
+
+@timed("baseline.try_except.failure")
+def bare_try_failure():
+    try:
+        return fail(1)
+    except Exception as e:
+        return e
+
+
+@timed("try.success")
+def try_success():
+    return Try(identity, 1)
+
+
+@timed("try.failure")
+def try_failure():
+    return Try(fail, 1)
+
+
+@timed("try.kwargs")
+def try_kwargs():
+    return Try(truediv, 1, 2)
+
+
+_curried_identity = CurriedTry(identity)
+_curried_fail = CurriedTry(fail)
+
+
+@timed("curried.success")
+def curried_success():
+    return _curried_identity(1)
+
+
+@timed("curried.failure")
+def curried_failure():
+    return _curried_fail(1)
+
+
+def _hand_written(f):
+    def _(x):
+        try:
+            return Success(f(x))
+        except Exception as e:
+            return Failure(e)
+
+    return _
+
+
+_hand_written_identity = _hand_written(identity)
+_hand_written_fail = _hand_written(fail)
+_decorated_identity = try_(identity)
+_decorated_fail = try_(fail)
+
+
+@timed("baseline.decorator.success")
+def hand_written_success():
+    return _hand_written_identity(1)
+
+
+@timed("baseline.decorator.failure")
+def hand_written_failure():
+    return _hand_written_fail(1)
+
+
+@timed("decorator.success")
+def decorator_success():
+    return _decorated_identity(1)
+
+
+@timed("decorator.failure")
+def decorator_failure():
+    return _decorated_fail(1)
+
+
+def _echo():
+    x = None
+    while True:
+        x = yield x
+
+
+_echo_generator = _echo()
+next(_echo_generator)
+
+
+@timed("try.generator.send")
+def generator_send():
+    return Try(_echo_generator, 1)
+
+
+@timed("try.generator.next")
+def generator_next():
+    return Try(_echo_generator)
+
+
+# Unhandled exceptions are looked up only when f raises, so the lookup
+# is measured on the failure path, with and without a scope set.
+_unscoped = contextvars.copy_context()
+_scoped = contextvars.copy_context()
+_scoped.run(_unhandled_exceptions.set, (KeyboardInterrupt,))
+
+
+@timed("try.failure.context")
+def try_failure_context():
+    return _unscoped.run(Try, fail, 1)
+
+
+@timed("try.failure.unhandled_scope")
+def try_failure_unhandled_scope():
+    return _scoped.run(Try, fail, 1)
+
+
+@timed("unhandled.scope.enter_exit")
+def unhandled_scope_enter_exit():
+    with Try_.unhandled(KeyboardInterrupt):
+        pass
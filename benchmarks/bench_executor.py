@@ -0,0 +1,52 @@
+"""Scaling of ProcessTryExecutor for a CPU-bound function.
+
+Run with:
+
+    python -m benchmarks.bench_executor
+"""
+
+import os
+import time
+from tryingsnake import Try
+from tryingsnake.executor import ProcessTryExecutor, ThreadTryExecutor
+
+
+def work(n):
+    if n % 97 == 0:
+        raise ValueError(n)
+    return sum(i * i for i in range(n))
+
+
+def sequential(xs):
+    return [Try(work, x) for x in xs]
+
+
+def parallel(executor_cls, workers, xs, chunksize):
+    with executor_cls(workers) as ex:
+        return list(ex.map(work, xs, chunksize=chunksize))
+
+
+def timed(f, *args):
+    start = time.perf_counter()
+    f(*args)
+    return time.perf_counter() - start
+
+
+def main(n=2000, size=20_000, chunksize=50):
+    xs = [size + i for i in range(n)]
+    base = timed(sequential, xs)
+    print("{0:<28}{1:>8.3f}s".format("sequential Try", base))
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    for executor_cls in [ThreadTryExecutor, ProcessTryExecutor]:
+        for w in workers:
+            t = timed(parallel, executor_cls, w, xs, chunksize)
+            print(
+                "{0:<28}{1:>8.3f}s  speedup {2:.2f}x".format(
+                    "{0}({1})".format(executor_cls.__name__, w), t, base / t
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""Memory used per Success / Failure instance."""
+
+from tryingsnake import Success, Failure
+from benchmarks.harness import allocated
+
+_e = Exception("e")
+
+allocated("memory.baseline.object")(object)
+allocated("memory.success")(lambda: Success(None))
+allocated("memory.failure")(lambda: Failure(_e))
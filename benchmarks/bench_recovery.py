@@ -0,0 +1,41 @@
+"""RecoveryTable dispatch compared to chained recover calls."""
+
+from tryingsnake import Failure
+from tryingsnake.recovery import RecoveryTable
+from benchmarks.harness import timed
+
+# The last of the handlers matches
+HANDLED = (KeyError, IndexError, TypeError, OSError, TimeoutError)
+FAILURE = Failure(TimeoutError("e"))
+HANDLERS = {cls: repr for cls in HANDLED}
+TABLE = RecoveryTable(HANDLERS)
+
+
+def _recover_if(cls):
+    def _(e):
+        if isinstance(e, cls):
+            return repr(e)
+        raise e.with_traceback(None)
+
+    return _
+
+
+_CHAIN = [_recover_if(cls) for cls in HANDLED]
+
+
+@timed("recovery.chained_recover", number=50_000)
+def chained_recover():
+    t = FAILURE
+    for f in _CHAIN:
+        t = t.recover(f)
+    return t
+
+
+@timed("recovery.table", number=50_000)
+def table():
+    return FAILURE.recoverBy(TABLE)
+
+
+@timed("recovery.dict", number=50_000)
+def dict_():
+    return FAILURE.recoverBy(HANDLERS)
@@ -0,0 +1,43 @@
+"""Try_.sequence and Try_.traverse compared to hand-written loops."""
+
+from tryingsnake import Try_, Try, Success
+from benchmarks.harness import timed
+
+N = 100
+TS = [Success(i) for i in range(N)]
+XS = list(range(N))
+
+
+def identity(x):
+    return x
+
+
+@timed("sequence.loop", number=20_000)
+def sequence_loop():
+    values = []
+    for t in TS:
+        if t.isFailure:
+            return t
+        values.append(t.get())
+    return Success(values)
+
+
+@timed("sequence.sequence", number=20_000)
+def sequence():
+    return Try_.sequence(TS)
+
+
+@timed("traverse.loop", number=20_000)
+def traverse_loop():
+    values = []
+    for x in XS:
+        t = Try(identity, x)
+        if t.isFailure:
+            return t
+        values.append(t.get())
+    return Success(values)
+
+
+@timed("traverse.traverse", number=20_000)
+def traverse():
+    return Try_.traverse(identity, XS)
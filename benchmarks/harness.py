@@ -0,0 +1,68 @@
+"""Minimal, dependency free benchmark registry.
+
+Benchmarks are registered by bench_* modules with one of the decorators
+below and executed by benchmarks.run.
+"""
+
+import timeit
+import tracemalloc
+
+REGISTRY = {}
+
+
+class Benchmark:
+    def __init__(self, name, measure, unit):
+        self.name = name
+        self.measure = measure
+        self.unit = unit
+
+    def run(self, quick=False):
+        return self.measure(quick)
+
+
+def _register(benchmark):
+    if benchmark.name in REGISTRY:
+        raise ValueError("Duplicate benchmark {0}".format(benchmark.name))
+    REGISTRY[benchmark.name] = benchmark
+    return benchmark
+
+
+def timed(name, number=200_000, repeat=5):
+    """Register a zero-argument callable timed in nanoseconds per call.
+
+    The result is the minimum over repeat runs of number calls.
+    """
+
+    def register(f):
+        def measure(quick):
+            n = max(number // 20, 1) if quick else number
+            return min(timeit.repeat(f, number=n, repeat=repeat)) / n * 1e9
+
+        _register(Benchmark(name, measure, "ns"))
+        return f
+
+    return register
+
+
+def allocated(name, number=100_000):
+    """Register a zero-argument factory measured in bytes
+    retained per created object.
+    """
+
+    def register(f):
+        def measure(quick):
+            n = max(number // 20, 1) if quick else number
+            results = [None] * n
+            tracemalloc.start()
+            try:
+                before = tracemalloc.get_traced_memory()[0]
+                for i in range(n):
+                    results[i] = f()
+                return (tracemalloc.get_traced_memory()[0] - before) / n
+            finally:
+                tracemalloc.stop()
+
+        _register(Benchmark(name, measure, "B"))
+        return f
+
+    return register
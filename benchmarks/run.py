@@ -0,0 +1,136 @@
+"""Run registered benchmarks and check them against stored results.
+
+Usage:
+
+    python -m benchmarks.run                       # run and print results
+    python -m benchmarks.run -k try.               # only names containing "try."
+    python -m benchmarks.run --save baseline.json  # store results
+    python -m benchmarks.run --compare benchmarks/baseline.json
+    python -m benchmarks.run --check               # enforce benchmarks/budgets.json
+
+Budgets are machine independent. Each entry either limits the ratio
+to another benchmark ("relative_to" and "max_ratio")
+or sets an absolute limit ("max").
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import sys
+
+import benchmarks
+from benchmarks.harness import REGISTRY
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BUDGETS = os.path.join(HERE, "budgets.json")
+
+
+def load_benchmarks():
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module("benchmarks." + module.name)
+    return REGISTRY
+
+
+def run(registry, pattern=None, quick=False):
+    results = {}
+    for name in sorted(registry):
+        if pattern and pattern not in name:
+            continue
+        benchmark = registry[name]
+        results[name] = {"value": benchmark.run(quick), "unit": benchmark.unit}
+        print(
+            "{0:<40}{1:>12.1f} {2}".format(name, results[name]["value"], benchmark.unit)
+        )
+    return results
+
+
+def compare(results, stored):
+    print()
+    print("{0:<40}{1:>12}{2:>12}{3:>9}".format("name", "stored", "current", "ratio"))
+    for name, result in sorted(results.items()):
+        if name not in stored:
+            continue
+        old, new = stored[name]["value"], result["value"]
+        print(
+            "{0:<40}{1:>12.1f}{2:>12.1f}{3:>8.2f}x".format(
+                name, old, new, new / old if old else float("nan")
+            )
+        )
+
+
+def check(results, budgets):
+    """Return a list of budget violations."""
+    violations = []
+    for name, budget in sorted(budgets.items()):
+        if name not in results:
+            continue
+        value = results[name]["value"]
+        if "max" in budget and value > budget["max"]:
+            violations.append("{0}: {1:.1f} > {2}".format(name, value, budget["max"]))
+        if "relative_to" in budget and budget["relative_to"] in results:
+            ratio = value / results[budget["relative_to"]]["value"]
+            if ratio > budget["max_ratio"]:
+                violations.append(
+                    "{0}: {1:.2f}x {2} > {3}x".format(
+                        name, ratio, budget["relative_to"], budget["max_ratio"]
+                    )
+                )
+    return violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="run only matching benchmarks")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations")
+    parser.add_argument("--save", help="write results to a JSON file")
+    parser.add_argument("--compare", help="compare with results in a JSON file")
+    parser.add_argument(
+        "--check", action="store_true", help="fail if budgets are exceeded"
+    )
+    parser.add_argument("--budgets", default=BUDGETS, help="budgets JSON file")
+    args = parser.parse_args(argv)
+
+    registry = load_benchmarks()
+    if args.check:
+        # Ratios need the reference benchmarks, even if filtered out
+        with open(args.budgets) as fr:
+            budgets = json.load(fr)
+        required = {b["relative_to"] for b in budgets.values() if "relative_to" in b}
+    results = run(registry, args.pattern, args.quick)
+    if args.check:
+        missing = required - set(results)
+        results.update(run({k: registry[k] for k in missing}, quick=args.quick))
+
+    if args.save:
+        with open(args.save, "w") as fw:
+            json.dump(
+                {
+                    "python": platform.python_implementation()
+                    + " "
+                    + platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                fw,
+                indent=2,
+                sort_keys=True,
+            )
+    if args.compare:
+        with open(args.compare) as fr:
+            compare(results, json.load(fr)["results"])
+    if args.check:
+        violations = check(results, budgets)
+        print()
+        for violation in violations:
+            print("OVER BUDGET " + violation)
+        print("{0} budget violation(s)".format(len(violations)))
+        return 1 if violations else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
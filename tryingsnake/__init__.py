@@ -1,15 +1,194 @@
 __version__ = "0.5.1"
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import pickle
+import threading
+import traceback
+
+_CAPTURE_POLICIES = ("full", "summary", "none")
+_capture_policy: ContextVar = ContextVar("capture_policy")
+_unhandled_exceptions: ContextVar = ContextVar("unhandled_exceptions")
+_CAPTURED_NOTE = "Traceback captured by tryingsnake (most recent call last):\n"
+
+
+def _check_capture_policy(policy):
+    if policy not in _CAPTURE_POLICIES:
+        raise ValueError(
+            "Invalid capture policy {0!r}, expected one of {1}".format(
+                policy, _CAPTURE_POLICIES
+            )
+        )
+    return policy
+
+
+def _summarize_traceback(tb):
+    return tuple(
+        (frame.f_code.co_filename, lineno, frame.f_code.co_name)
+        for frame, lineno in traceback.walk_tb(tb)
+    )
+
+
+def _strip_traceback(e, summarize):
+    """Drop tracebacks of e and all exceptions chained to it.
+
+    :return: a tuple of (filename, lineno, name) for each frame
+             of the traceback of e if summarize is True otherwise None
+    """
+    summary = _summarize_traceback(e.__traceback__) if summarize else None
+    seen = set()
+    pending = [e]
+    while pending:
+        e = pending.pop()
+        if e is None or id(e) in seen:
+            continue
+        seen.add(id(e))
+        e.__traceback__ = None
+        pending.extend((e.__cause__, e.__context__))
+    return summary
+
+
+# Observers installed by tryingsnake.metrics and tryingsnake.profile.
+# Each observer is a callable (stage, f) -> Callable, which can wrap f
+# in an instance of a _Observed subclass. The tuple is replaced,
+# never mutated, so it can be read without a lock.
+_observers: tuple = ()
+_observers_lock = threading.Lock()
+
+
+class _Observed:
+    """Base class of callables wrapped by observers."""
+
+    __slots__ = ()
+
+
+def _add_observer(observer):
+    global _observers
+    with _observers_lock:
+        if observer not in _observers:
+            _observers = _observers + (observer,)
+
+
+def _remove_observer(observer):
+    global _observers
+    with _observers_lock:
+        _observers = tuple(o for o in _observers if o is not observer)
+
+
+def _observe(stage, f):
+    # Combinators delegating to Try pass already observed callables
+    # through Try again.
+    if not callable(f) or isinstance(f, _Observed):
+        return f
+    for observer in _observers:
+        f = observer(stage, f)
+    return f
+
+
+def _type_name(cls):
+    if cls.__module__ == "builtins":
+        return cls.__qualname__
+    return "{0}.{1}".format(cls.__module__, cls.__qualname__)
+
+
+def _failure_frames(failure):
+    if failure._tb is not None:
+        return failure._tb
+    return _summarize_traceback(failure._v.__traceback__)
+
+
+def _failure_state(failure):
+    """Portable state of a Failure.
+
+    :return: a tuple of the pickled exception (or None if it
+             cannot be pickled), the name of its type,
+             reprs of its args and the summary of its traceback
+    """
+    e = failure._v
+    try:
+        payload = pickle.dumps(e, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        payload = None
+    args = tuple(repr(a) for a in e.args)
+    return payload, _type_name(type(e)), args, _failure_frames(failure)
+
+
+def _restore_failure(payload, type_name, args, frames):
+    e = None
+    if payload is not None:
+        try:
+            e = pickle.loads(payload)
+        except Exception:
+            pass
+    if not isinstance(e, Exception):
+        e = RemoteFailure(type_name, *args)
+    failure = Failure(e)
+    # Failures without captured frames keep using the traceback
+    # of the exception, as the original ones
+    failure._tb = tuple(map(tuple, frames)) or None
+    return failure
+
+
+class RemoteFailure(Exception):
+    """Stand-in for an exception which couldn't be serialized
+    or restored, for example when a Failure is sent to another process.
+
+    :param type_name: qualified name of the type of the original exception
+    :param args: reprs of the args of the original exception
+
+    >>> RemoteFailure("mod.Error", "'a'")
+    RemoteFailure('mod.Error', "'a'")
+    >>> str(RemoteFailure("mod.Error", "'a'"))
+    "mod.Error('a')"
+    """
+
+    def __init__(self, type_name, *args):
+        super().__init__(type_name, *args)
+        self.type_name = type_name
+
+    def __str__(self):
+        return "{0}({1})".format(self.type_name, ", ".join(self.args[1:]))
+
+
+try:
+    ExceptionGroup = ExceptionGroup
+except NameError:  # pragma: no cover
+
+    class ExceptionGroup(Exception):  # type: ignore
+        """Minimal replacement of the built-in ExceptionGroup
+        for Python < 3.11
+        """
+
+        def __init__(self, message, exceptions):
+            exceptions = tuple(exceptions)
+            super().__init__(message, exceptions)
+            self.message = message
+            self.exceptions = exceptions
+
+        def __str__(self):
+            return "{0} ({1} sub-exceptions)".format(self.message, len(self.exceptions))
+
+
+def _stack_summary(frames):
+    return traceback.StackSummary.from_list(
+        [(filename, lineno, name, None) for filename, lineno, name in frames]
+    )
 
 
 class Try_:
+    __slots__ = ("_v",)
     _unhandled = ()
+    _capture = "full"
+    _fmt: str
 
     @staticmethod
     def set_unhandled(es=None):
         """Set a list of the unhandled exceptions.
 
+        This is a process wide default, which can be overridden
+        for the current thread or asyncio task with Try_.unhandled.
+
         :param es: an iterable of exceptions or None
 
         >>> from operator import getitem
@@ -26,13 +205,78 @@ class Try_:
         """
         Try_._unhandled = tuple(es) if es is not None else tuple()
 
-    @property
-    def _v(self):
-        raise NotImplementedError  # pragma: no cover
+    @staticmethod
+    @contextmanager
+    def unhandled(*es):
+        """Set unhandled exceptions for the current context.
 
-    @property
-    def _fmt(self):
-        raise NotImplementedError  # pragma: no cover
+        Exceptions listed here are raised instead of being wrapped
+        in Failure. The scope replaces the default set with
+        Try_.set_unhandled and is local to the current thread
+        or asyncio task.
+
+        :param es: exception classes
+
+        >>> from operator import getitem
+        >>> with Try_.unhandled(IndexError):
+        ...     Try(getitem, [], 0)  # doctest:+ELLIPSIS
+        Traceback (most recent call last):
+            ...
+        IndexError: ...
+        >>> Try(getitem, [], 0)  # doctest:+ELLIPSIS
+        Failure(IndexError(...))
+        """
+        token = _unhandled_exceptions.set(es)
+        try:
+            yield
+        finally:
+            _unhandled_exceptions.reset(token)
+
+    @staticmethod
+    def set_capture(policy="full"):
+        """Set how much of the traceback is retained by Failure.
+
+        - "full" keeps the exception with its traceback,
+          and with it all frames and their local variables.
+        - "summary" replaces the traceback with a summary, which doesn't
+          reference any frames (see Failure.stack). On Python 3.11+
+          it is attached as a note to the exception raised by Failure.get.
+        - "none" drops the traceback.
+
+        The policy applies to exceptions with a traceback and can be
+        overridden for a context with Try_.capture.
+
+        :param policy: one of "full", "summary", "none"
+
+        >>> Try_.set_capture("none")
+        >>> Try(int, "a").stack
+        []
+        >>> Try_.set_capture()
+        """
+        Try_._capture = _check_capture_policy(policy)
+
+    @staticmethod
+    @contextmanager
+    def capture(policy):
+        """Set traceback capture policy for the current context.
+
+        See Try_.set_capture for a description of the policies.
+
+        :param policy: one of "full", "summary", "none"
+
+        >>> def f(): raise ValueError()
+        >>> with Try_.capture("summary"):
+        ...     failure = Try(f)
+        >>> failure.stack[-1].name
+        'f'
+        >>> failure._v.__traceback__ is None
+        True
+        """
+        token = _capture_policy.set(_check_capture_policy(policy))
+        try:
+            yield
+        finally:
+            _capture_policy.reset(token)
 
     @staticmethod
     def _identity_if_try_or_raise(v, msg="Invalid return type for f: {0}"):
@@ -45,6 +289,92 @@ class Try_:
         if not isinstance(e, Exception):
             raise TypeError(msg.format(type(e)))
 
+    @staticmethod
+    def sequence(ts, accumulate=False):
+        """Convert an iterable of Try_ into Try_ of a list.
+
+        By default iteration stops at the first Failure, which
+        is returned. If accumulate is True all elements are consumed
+        and exceptions of all failures are returned as an ExceptionGroup.
+
+        :param ts: an iterable of Try_
+        :param accumulate: collect all failures
+        :return: Try_[List[T]]
+
+        >>> Try_.sequence([Success(1), Success(2)])
+        Success([1, 2])
+        >>> Try_.sequence(
+        ...     [Success(1), Failure(ValueError("a")), Failure(KeyError("b"))]
+        ... )
+        Failure(ValueError('a'))
+        >>> Try_.sequence(
+        ...     [Success(1), Failure(ValueError("a")), Failure(KeyError("b"))],
+        ...     accumulate=True,
+        ... ).failed().get().exceptions
+        (ValueError('a'), KeyError('b'))
+        """
+        values = []
+        errors = None
+        for t in ts:
+            if isinstance(t, Success):
+                if errors is None:
+                    values.append(t._v)
+                continue
+            Try_._identity_if_try_or_raise(t, "Invalid type for element: {0}")
+            if not accumulate:
+                return t
+            if errors is None:
+                errors = []
+                values = None
+            errors.append(t._v)
+        return Success(values) if errors is None else Try_._group(errors)
+
+    @staticmethod
+    def traverse(f, xs, accumulate=False):
+        """Apply f to each element of xs and collect results in Try_ of a list.
+
+        Same as Try_.sequence(Try(f, x) for x in xs),
+        without creating Try_ for each element.
+
+        :param f: function to be applied
+        :param xs: an iterable
+        :param accumulate: collect all failures
+        :return: Try_[List[U]]
+
+        >>> Try_.traverse(int, ["1", "2"])
+        Success([1, 2])
+        >>> Try_.traverse(int, ["1", "a", "b"])
+        Failure(ValueError("invalid literal for int() with base 10: 'a'"))
+        >>> len(Try_.traverse(int, ["1", "a", "b"], accumulate=True)._v.exceptions)
+        2
+        """
+        if _observers:
+            f = _observe("Try", f)
+        values = []
+        errors = None
+        for x in xs:
+            try:
+                v = f(x)
+            except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+                raise e
+            except Exception as e:
+                if not accumulate:
+                    return Failure(e)
+                if errors is None:
+                    errors = []
+                    values = None
+                errors.append(e)
+                continue
+            if errors is None:
+                values.append(v)
+        return Success(values) if errors is None else Try_._group(errors)
+
+    @staticmethod
+    def _group(errors):
+        return Failure(
+            ExceptionGroup("{0} of the elements failed".format(len(errors)), errors)
+        )
+
     def __init__(self, _):
         raise NotImplementedError(
             "Use Try function or Success/Failure instead."
@@ -103,6 +433,36 @@ class Try_:
         """
         raise NotImplementedError  # pragma: no cover
 
+    def getOrElseLazy(self, f):
+        """If this is a Success get stored value otherwise
+        return the result of f
+
+        :param f: function without arguments computing the default,
+                  called only if this is a Failure
+        :return:
+
+        >>> Success(1).getOrElseLazy(lambda: 1 / 0)
+        1
+        >>> Failure(Exception("e")).getOrElseLazy(lambda: 0)
+        0
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def orElseLazy(self, f):
+        """If this is a Success return self otherwise
+        the result of f
+
+        :param f: function without arguments returning Try_,
+                  called only if this is a Failure
+        :return:
+
+        >>> Success(1).orElseLazy(lambda: Try(lambda: 1 / 0))
+        Success(1)
+        >>> Failure(Exception("e")).orElseLazy(lambda: Success(0))
+        Success(0)
+        """
+        raise NotImplementedError  # pragma: no cover
+
     def map(self, f):
         """Apply function to the value.
 
@@ -169,6 +529,28 @@ class Try_:
         """
         raise NotImplementedError  # pragma: no cover
 
+    def recoverBy(self, handlers):
+        """If this is a Failure apply the handler registered
+        for the type of its exception, see tryingsnake.recovery.RecoveryTable
+
+        A dict is compiled to a new RecoveryTable on each call,
+        so on hot paths pass a prebuilt RecoveryTable instead.
+
+        :param handlers: RecoveryTable or a dict mapping exception
+                         classes (or tuples of classes) to functions
+        :return: self if there is no matching handler,
+                 otherwise Try_ as for recover
+
+        >>> handlers = {KeyError: lambda e: 0, (TypeError, ValueError): lambda e: 1}
+        >>> Success(1).recoverBy(handlers)
+        Success(1)
+        >>> Failure(ValueError("e")).recoverBy(handlers)
+        Success(1)
+        >>> Failure(IndexError("e")).recoverBy(handlers)
+        Failure(IndexError('e'))
+        """
+        raise NotImplementedError  # pragma: no cover
+
     def recoverWith(self, f):
         """If this is a Failure apply f to self otherwise
         return this
@@ -183,6 +565,26 @@ class Try_:
         """
         raise NotImplementedError  # pragma: no cover
 
+    def chain(self, steps):
+        """Apply functions returning Try_ one after another.
+
+        Equivalent to self.flatMap(f1).flatMap(f2)..., evaluated
+        in a loop, so chains of any length run in constant stack depth.
+        Steps are consumed lazily and iteration stops at the first Failure.
+
+        See tryingsnake.trampoline for chains built from continuations.
+
+        :param steps: an iterable of functions returning Try_
+        :return: Try_
+
+        >>> from itertools import repeat
+        >>> Success(0).chain(repeat(lambda x: Success(x + 1), 1000))
+        Success(1000)
+        >>> Success(0).chain([lambda x: Try(lambda: 1 / x)])  # doctest:+ELLIPSIS
+        Failure(ZeroDivisionError(...))
+        """
+        raise NotImplementedError  # pragma: no cover
+
     def failed(self):
         """Inverts this Try_.
 
@@ -224,7 +626,7 @@ class Try_:
 class Success(Try_):
     """Represents a successful computation"""
 
-    __slots__ = ("_v",)
+    __slots__ = ()
     _fmt = "Success({0})"
 
     @staticmethod
@@ -251,24 +653,53 @@ class Success(Try_):
         except TypeError as e:
             raise TypeError("Cannot hash try with unhashable value") from e
 
+    def __reduce__(self):
+        """
+        >>> import pickle
+        >>> pickle.loads(pickle.dumps(Success(1)))
+        Success(1)
+        """
+        return Success, (self._v,)
+
     def get(self):
         return self._v
 
     def getOrElse(self, default):
-        return self.get()
+        return self._v
 
     def orElse(self, default):
         return self
 
+    def getOrElseLazy(self, f):
+        return self._v
+
+    def orElseLazy(self, f):
+        return self
+
     def map(self, f):
+        if _observers:
+            f = _observe("map", f)
         return Try(f, self._v)
 
     def flatMap(self, f):
-        v = Try(f, self._v)
-        return Try_._identity_if_try_or_raise(v if v.isFailure else v.get())
+        if not callable(f):
+            # Generators are sent the value, as in Try
+            v = Try(f, self._v)
+            return Try_._identity_if_try_or_raise(v._v if v else v)
+        if _observers:
+            f = _observe("flatMap", f)
+        try:
+            v = f(self._v)
+        except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+            raise e
+        except Exception as e:
+            return Failure(e)
+        return Try_._identity_if_try_or_raise(v)
 
     def filter(self, f, exception_cls=Exception, msg=None):
-        if f(self.get()):
+        if _observers:
+            f = _observe("filter", f)
+        if f(self._v):
             return self
         else:
             return Failure(exception_cls(msg if msg else repr(f)))
@@ -279,6 +710,17 @@ class Success(Try_):
     def recoverWith(self, f):
         return self
 
+    def recoverBy(self, handlers):
+        return self
+
+    def chain(self, steps):
+        t = self
+        for f in steps:
+            t = t.flatMap(f)
+            if not t:
+                break
+        return t
+
     def failed(self):
         return Failure(TypeError())
 
@@ -286,7 +728,7 @@ class Success(Try_):
 class Failure(Try_):
     """Represents a unsuccessful computation"""
 
-    __slots__ = ("_v",)
+    __slots__ = ("_tb",)
     _fmt = "Failure({0})"
 
     @staticmethod
@@ -296,6 +738,28 @@ class Failure(Try_):
     def __init__(self, e):
         Try_._raise_if_not_exception(e)
         self._v: Exception = e
+        self._tb = None
+        if e.__traceback__ is not None:
+            policy = _capture_policy.get(Try_._capture)
+            if policy != "full":
+                self._tb = _strip_traceback(e, policy == "summary")
+
+    @property
+    def stack(self):
+        """Stack summary of the stored exception.
+
+        Available under every capture policy, but empty if
+        the traceback has been dropped.
+
+        :return: traceback.StackSummary
+
+        >>> def f(): raise ValueError()
+        >>> [frame.name for frame in Try(f).stack]
+        ['Try', 'f']
+        """
+        if self._tb is not None:
+            return _stack_summary(self._tb)
+        return traceback.extract_tb(self._v.__traceback__)
 
     def __eq__(self, other):
         """
@@ -321,8 +785,26 @@ class Failure(Try_):
         except TypeError as e:
             raise TypeError("Cannot hash try with unhashable value") from e
 
+    def __reduce__(self):
+        """Pickle the exception with a summary of its traceback.
+
+        Exceptions, which cannot be pickled or unpickled,
+        are replaced with RemoteFailure.
+
+        >>> import pickle
+        >>> class Local(Exception): pass
+        >>> pickle.loads(pickle.dumps(Failure(Local("e"))))
+        Failure(RemoteFailure('tryingsnake.Local', "'e'"))
+        """
+        return _restore_failure, _failure_state(self)
+
     def get(self):
-        raise self._v
+        e = self._v
+        if self._tb is not None and hasattr(e, "add_note"):
+            note = _CAPTURED_NOTE + "".join(self.stack.format()).rstrip()
+            if note not in getattr(e, "__notes__", ()):
+                e.add_note(note)
+        raise e
 
     def getOrElse(self, default):
         return default
@@ -330,20 +812,49 @@ class Failure(Try_):
     def orElse(self, default):
         return Try_._identity_if_try_or_raise(default)
 
+    def getOrElseLazy(self, f):
+        return f()
+
+    def orElseLazy(self, f):
+        return Try_._identity_if_try_or_raise(f())
+
     def map(self, f):
-        return Failure(self._v)
+        return self
 
     def flatMap(self, f):
-        return Failure(self._v)
+        return self
 
     def filter(self, f, exception_cls=Exception, msg=None):
         return self
 
     def recover(self, f):
-        return Success(self._v).map(f)
+        if _observers:
+            f = _observe("recover", f)
+        return Try(f, self._v)
 
     def recoverWith(self, f):
-        return Success(self._v).flatMap(f)
+        if not callable(f):
+            # Generators are sent the value, as in Try
+            v = Try(f, self._v)
+            return Try_._identity_if_try_or_raise(v._v if v else v)
+        if _observers:
+            f = _observe("recoverWith", f)
+        try:
+            v = f(self._v)
+        except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+            raise e
+        except Exception as e:
+            return Failure(e)
+        return Try_._identity_if_try_or_raise(v)
+
+    def recoverBy(self, handlers):
+        if isinstance(handlers, dict):
+            handlers = RecoveryTable(handlers)
+        f = handlers.resolve(type(self._v))
+        return self if f is None else self.recover(f)
+
+    def chain(self, steps):
+        return self
 
     def failed(self):
         return Success(self._v)
@@ -368,20 +879,28 @@ def Try(f, *args, **kwargs):
     Failure(ZeroDivisionError(...))
     >>> Try(add, 1, 2)
     Success(3)
+    >>> Try(iter([]))  # doctest:+ELLIPSIS
+    Failure(StopIteration(...))
     """
+    if _observers:
+        f = _observe("Try", f)
     try:
         if callable(f):
             return Success(f(*args, **kwargs))
         elif isinstance(f, Generator) and len(args) == 1 and not kwargs:
             return Success(f.send(args[0]))
-        elif isinstance(f, Generator) and not args and not kwargs:
+        elif isinstance(f, Iterator) and not args and not kwargs:
             return Success(next(f))
         else:
             raise TypeError(
                 "Don't know how to try {} with {} and {}".format(type(f), args, kwargs)
             )
 
-    except Try_._unhandled as e:  # type: ignore
+    except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
         raise e
     except Exception as e:
         return Failure(e)
+
+
+# Imported last, tryingsnake.recovery depends on the classes above
+from tryingsnake.recovery import RecoveryTable  # noqa: E402
@@ -1,3 +1,5 @@
+from contextlib import AbstractContextManager
+from traceback import StackSummary
 from typing import (
     overload,
     Any,
@@ -6,24 +8,51 @@ from typing import (
     Generic,
     Iterable,
     Iterator,
+    List,
+    Mapping,
     Optional,
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
+from tryingsnake.recovery import RecoveryTable
 
 T = TypeVar("T")
 U = TypeVar("U")
+V = TypeVar("V")
+
+_Handlers = Union[
+    RecoveryTable,
+    Mapping[
+        Union[Type[BaseException], Tuple[Type[BaseException], ...]],
+        Callable[[Any], Any],
+    ],
+]
 
 class Try_(Generic[T]):
     _unhandled: Tuple[Exception, ...]
     @staticmethod
     def set_unhandled(es: Iterable[Exception] = ...) -> None: ...
+    @staticmethod
+    def unhandled(*es: Type[BaseException]) -> AbstractContextManager[None]: ...
+    @staticmethod
+    def set_capture(policy: str = ...) -> None: ...
+    @staticmethod
+    def capture(policy: str) -> AbstractContextManager[None]: ...
+    @staticmethod
+    def sequence(ts: Iterable[Try_[U]], accumulate: bool = ...) -> Try_[List[U]]: ...
+    @staticmethod
+    def traverse(
+        f: Callable[[V], U], xs: Iterable[V], accumulate: bool = ...
+    ) -> Try_[List[U]]: ...
     def __init__(self, _: Any) -> None: ...
     def __ne__(self, other: Any) -> bool: ...
     def get(self) -> T: ...
     def getOrElse(self, default: T) -> T: ...
     def orElse(self, default: Try_[T]) -> Try_[T]: ...
+    def getOrElseLazy(self, f: Callable[[], T]) -> T: ...
+    def orElseLazy(self, f: Callable[[], Try_[T]]) -> Try_[T]: ...
     def map(self, f: Callable[[T], U]) -> Try_[U]: ...
     def flatMap(self, f: Callable[[T], Try_[U]]) -> Try_[U]: ...
     def filter(
@@ -34,12 +63,18 @@ class Try_(Generic[T]):
     ) -> Try_[T]: ...
     def recover(self, f: Callable[[Exception], T]) -> Try_[T]: ...
     def recoverWith(self, f: Callable[[Exception], Try_[T]]) -> Try_[T]: ...
+    def recoverBy(self, handlers: _Handlers) -> Try_[Any]: ...
+    def chain(self, steps: Iterable[Callable[[Any], Try_[Any]]]) -> Try_[Any]: ...
     def failed(self) -> Try_[Exception]: ...
     @property
     def isFailure(self) -> bool: ...
     @property
     def isSuccess(self) -> bool: ...
 
+class RemoteFailure(Exception):
+    type_name: str
+    def __init__(self, type_name: str, *args: str) -> None: ...
+
 class Success(Try_[T]):
     @staticmethod
     def __len__() -> int: ...
@@ -49,6 +84,8 @@ class Success(Try_[T]):
     def get(self) -> T: ...
     def getOrElse(self, default: T) -> T: ...
     def orElse(self, default: Try_[T]) -> Try_[T]: ...
+    def getOrElseLazy(self, f: Callable[[], T]) -> T: ...
+    def orElseLazy(self, f: Callable[[], Try_[T]]) -> Try_[T]: ...
     def map(self, f: Callable[[T], U]) -> Try_[U]: ...
     def flatMap(self, f: Callable[[T], Try_[U]]) -> Try_[U]: ...
     def filter(
@@ -59,17 +96,23 @@ class Success(Try_[T]):
     ) -> Try_[T]: ...
     def recover(self, f: Callable[[Exception], T]) -> Try_[T]: ...
     def recoverWith(self, f: Callable[[Exception], Try_[T]]) -> Try_[T]: ...
+    def recoverBy(self, handlers: _Handlers) -> Try_[Any]: ...
+    def chain(self, steps: Iterable[Callable[[Any], Try_[Any]]]) -> Try_[Any]: ...
     def failed(self) -> Try_[Exception]: ...
 
 class Failure(Try_[T]):
     @staticmethod
     def __len__() -> int: ...
     def __init__(self, e: Any): ...
+    @property
+    def stack(self) -> StackSummary: ...
     def __eq__(self, other: Any) -> bool: ...
     def __hash__(self) -> int: ...
     def get(self) -> T: ...
     def getOrElse(self, default: T) -> T: ...
     def orElse(self, default: Try_[T]) -> Try_[T]: ...
+    def getOrElseLazy(self, f: Callable[[], T]) -> T: ...
+    def orElseLazy(self, f: Callable[[], Try_[T]]) -> Try_[T]: ...
     def map(self, f: Callable[[T], U]) -> Failure[U]: ...
     def flatMap(self, f: Callable[[T], Try_[U]]) -> Failure[U]: ...
     def filter(
@@ -80,6 +123,8 @@ class Failure(Try_[T]):
     ) -> Failure[T]: ...
     def recover(self, f: Callable[[Exception], U]) -> Try_[U]: ...
     def recoverWith(self, f: Callable[[Exception], Try_[U]]) -> Try_[U]: ...
+    def recoverBy(self, handlers: _Handlers) -> Try_[Any]: ...
+    def chain(self, steps: Iterable[Callable[[Any], Try_[Any]]]) -> Failure[Any]: ...
     def failed(self) -> Try_[Exception]: ...
 
 @overload
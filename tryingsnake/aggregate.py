@@ -0,0 +1,284 @@
+import json
+import random
+import re
+from tryingsnake import Try_, Success
+from tryingsnake.metrics import _qualified_name, _write_atomic
+
+# Numbers, addresses and quoted values which vary between
+# otherwise identical messages
+_VARIABLE = re.compile(r"0x[0-9a-fA-F]+|\d+(?:\.\d+)?|'[^']*'|\"[^\"]*\"")
+_MAX_MESSAGE = 200
+
+
+def _normalize(message):
+    return _VARIABLE.sub("<*>", message)[:_MAX_MESSAGE]
+
+
+def _raise_site(failure):
+    if failure._tb is not None:
+        frames = failure._tb
+        if not frames:
+            return "<unknown>"
+        filename, lineno, name = frames[-1]
+        return "{0}:{1} in {2}".format(filename, lineno, name)
+    tb = failure._v.__traceback__
+    if tb is None:
+        return "<unknown>"
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    code = tb.tb_frame.f_code
+    return "{0}:{1} in {2}".format(code.co_filename, tb.tb_lineno, code.co_name)
+
+
+class _Group:
+    __slots__ = ("count", "error", "seen", "samples")
+
+    def __init__(self, count=0, error=0):
+        # count may overestimate the number of failures by at most error
+        self.count = count
+        self.error = error
+        # number of failures offered to the reservoir
+        self.seen = 0
+        self.samples = []
+
+
+class FailureAggregator:
+    """Bounded-memory summary of failures.
+
+    Failures are grouped by the type of the exception, its normalized
+    message (with numbers and quoted values replaced by <*>) and
+    the location where it has been raised.
+
+    At most max_groups groups are kept. When a new group doesn't fit,
+    the smallest one is replaced (Space-Saving algorithm), so counts of
+    the most frequent groups are exact or overestimated by at most the
+    reported error. Each group keeps a uniform sample of at most
+    samples failures (reservoir sampling).
+
+    Aggregators can be pickled and merged, for example
+    to combine results of worker processes.
+
+    :param max_groups: maximum number of groups
+    :param samples: number of failures sampled per group
+    :param random: function returning floats from [0, 1) used for sampling
+
+    >>> from tryingsnake import Try
+    >>> aggregator = FailureAggregator()
+    >>> _ = aggregator.update(Try(int, x) for x in ["1", "a", "b", "2.0"])
+    >>> [(g["type"], g["message"], g["count"]) for g in aggregator.groups()]
+    [('ValueError', 'invalid literal for int() with base <*>: <*>', 3)]
+    """
+
+    def __init__(self, max_groups=100, samples=5, random=random.random):
+        if max_groups < 1:
+            raise ValueError("max_groups must be at least 1")
+        if samples < 0:
+            raise ValueError("samples must be non-negative")
+        self.max_groups = max_groups
+        self.samples = samples
+        self._random = random
+        self._groups = {}
+        self.successes = 0
+        self.failures = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Sampling function might not be picklable
+        del state["_random"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._random = random.random
+
+    def add(self, t):
+        """Record a single Try_.
+
+        :param t: Try_
+        """
+        if isinstance(t, Success):
+            self.successes += 1
+            return
+        Try_._identity_if_try_or_raise(t, "Invalid type for t: {0}")
+        self.failures += 1
+        e = t._v
+        key = (_qualified_name(type(e)), _normalize(str(e)), _raise_site(t))
+        group = self._groups.get(key)
+        if group is None:
+            group = self._make_room(key)
+        group.count += 1
+        group.seen += 1
+        self._sample(group, t)
+
+    def update(self, ts):
+        """Record each Try_ of an iterable.
+
+        :param ts: an iterable of Try_
+        :return: self
+        """
+        add = self.add
+        for t in ts:
+            add(t)
+        return self
+
+    def _make_room(self, key):
+        groups = self._groups
+        if len(groups) < self.max_groups:
+            group = groups[key] = _Group()
+            return group
+        smallest_key = min(groups, key=lambda k: groups[k].count)
+        smallest = groups.pop(smallest_key)
+        group = groups[key] = _Group(smallest.count, smallest.count)
+        return group
+
+    def _sample(self, group, t):
+        if len(group.samples) < self.samples:
+            group.samples.append(t)
+        elif self.samples:
+            i = int(self._random() * group.seen)
+            if i < self.samples:
+                group.samples[i] = t
+
+    def merge(self, other):
+        """Add failures recorded by other aggregator.
+
+        Summaries are merged as in the mergeable Space-Saving algorithm,
+        so counts still overestimate the true counts
+        by at most the reported error.
+
+        :param other: FailureAggregator
+        :return: self
+        """
+        self.successes += other.successes
+        self.failures += other.failures
+        groups, theirs = self._groups, other._groups
+        # A full summary could have counted any group it doesn't track
+        # up to its smallest count
+        ours_min = self._min_count()
+        theirs_min = other._min_count()
+        for key in groups.keys() - theirs.keys():
+            group = groups[key]
+            group.count += theirs_min
+            group.error += theirs_min
+        for key, their in theirs.items():
+            ours = groups.get(key)
+            if ours is None:
+                ours = groups[key] = _Group(ours_min, ours_min)
+            ours.samples = self._merge_samples(ours, their)
+            ours.count += their.count
+            ours.error += their.error
+            ours.seen += their.seen
+        if len(groups) > self.max_groups:
+            keys = sorted(groups, key=lambda k: groups[k].count, reverse=True)
+            for key in keys[self.max_groups :]:
+                del groups[key]
+        return self
+
+    def _min_count(self):
+        groups = self._groups
+        if len(groups) < self.max_groups:
+            return 0
+        return min(group.count for group in groups.values())
+
+    def _merge_samples(self, ours, theirs):
+        # Draw from both samples in proportion to the number
+        # of failures each of them represents
+        a, b = list(ours.samples), list(theirs.samples)
+        total = ours.seen + theirs.seen
+        merged = []
+        while len(merged) < self.samples and (a or b):
+            source = a if a and (not b or self._random() * total < ours.seen) else b
+            merged.append(source.pop(int(self._random() * len(source))))
+        return merged
+
+    def groups(self):
+        """Recorded groups, the most frequent first.
+
+        :return: a list of dicts with "type", "message", "site", "count",
+                 "error" and "samples" (a list of Failure) keys
+        """
+        return [
+            {
+                "type": type_name,
+                "message": message,
+                "site": site,
+                "count": group.count,
+                "error": group.error,
+                "samples": list(group.samples),
+            }
+            for (type_name, message, site), group in sorted(
+                self._groups.items(), key=lambda item: (-item[1].count, item[0])
+            )
+        ]
+
+    def report(self):
+        """Recorded values as a JSON compatible dict.
+
+        Samples are represented with their repr and stack.
+
+        :return: dict
+        """
+        groups = self.groups()
+        for group in groups:
+            group["samples"] = [
+                {"repr": repr(failure._v), "stack": failure.stack.format()}
+                for failure in group["samples"]
+            ]
+        return {
+            "successes": self.successes,
+            "failures": self.failures,
+            "groups": groups,
+        }
+
+    def to_json(self, indent=None):
+        """Recorded values as a JSON document
+
+        :return: str
+        """
+        return json.dumps(self.report(), indent=indent)
+
+    def to_text(self):
+        """Recorded values as a human readable report
+
+        :return: str
+
+        >>> from tryingsnake import Failure
+        >>> aggregator = FailureAggregator(samples=1)
+        >>> _ = aggregator.update([Failure(KeyError("a")), Success(1)])
+        >>> print(aggregator.to_text(), end="")
+        1 failures, 1 successes, 1 groups
+        <BLANKLINE>
+        1  KeyError: <*>
+           at <unknown>
+           KeyError('a')
+        """
+        lines = [
+            "{0} failures, {1} successes, {2} groups".format(
+                self.failures, self.successes, len(self._groups)
+            )
+        ]
+        for group in self.groups():
+            count = str(group["count"])
+            if group["error"]:
+                count += " (±{0})".format(group["error"])
+            lines.append("")
+            lines.append("{0}  {1}: {2}".format(count, group["type"], group["message"]))
+            indent = " " * (len(count) + 2)
+            lines.append("{0}at {1}".format(indent, group["site"]))
+            for failure in group["samples"]:
+                lines.append(indent + repr(failure._v))
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, format="text"):
+        """Write the report to a file.
+
+        :param path: destination path
+        :param format: "text" or "json"
+        """
+        if format == "text":
+            content = self.to_text()
+        elif format == "json":
+            content = self.to_json(indent=2)
+        else:
+            raise ValueError("Unknown format {0!r}".format(format))
+        _write_atomic(path, content)
@@ -0,0 +1,22 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from tryingsnake import Try_
+
+class FailureAggregator:
+    max_groups: int
+    samples: int
+    successes: int
+    failures: int
+    def __init__(
+        self,
+        max_groups: int = ...,
+        samples: int = ...,
+        random: Callable[[], float] = ...,
+    ) -> None: ...
+    def add(self, t: Try_[Any]) -> None: ...
+    def update(self, ts: Iterable[Try_[Any]]) -> FailureAggregator: ...
+    def merge(self, other: FailureAggregator) -> FailureAggregator: ...
+    def groups(self) -> List[Dict[str, Any]]: ...
+    def report(self) -> Dict[str, Any]: ...
+    def to_json(self, indent: Optional[int] = ...) -> str: ...
+    def to_text(self) -> str: ...
+    def write(self, path: str, format: str = ...) -> None: ...
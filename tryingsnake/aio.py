@@ -0,0 +1,146 @@
+import asyncio
+from inspect import isawaitable
+from tryingsnake import Try_, Success, Failure, _unhandled_exceptions
+
+
+async def _evaluate(f, args, kwargs):
+    try:
+        if isawaitable(f) and not args and not kwargs:
+            v = await f
+        else:
+            v = f(*args, **kwargs)
+            if isawaitable(v):
+                v = await v
+    except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+        raise e
+    except Exception as e:
+        return Failure(e)
+    return Success(v)
+
+
+class AsyncTry:
+    """Asynchronous counterpart of Try.
+
+    AsyncTry(f, *args, **kwargs) is an awaitable, which evaluates f
+    with provided arguments on first await and wraps the result
+    using either Success or Failure. If f returns an awaitable,
+    it is awaited as well, so f can be a coroutine function.
+    If f is an awaitable and no arguments are given, it is awaited directly.
+
+    Combinators accept both sync and async callables
+    and return a new AsyncTry.
+
+    >>> async def fetch(x):
+    ...     return 1 / x
+    >>> async def main():
+    ...     return [
+    ...         await AsyncTry(fetch, 2).map(lambda x: x + 1),
+    ...         await AsyncTry(fetch, 0).recover(lambda e: 0.0),
+    ...     ]
+    >>> asyncio.run(main())
+    [Success(1.5), Success(0.0)]
+    """
+
+    __slots__ = ("_factory", "_task")
+
+    def __init__(self, f, *args, **kwargs):
+        self._factory = lambda: _evaluate(f, args, kwargs)
+        self._task = None
+
+    @classmethod
+    def _from(cls, factory):
+        t = cls.__new__(cls)
+        t._factory = factory
+        t._task = None
+        return t
+
+    def __await__(self):
+        # The outcome is memoized, so an AsyncTry can be awaited many times
+        # while f is evaluated only once.
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._factory())
+        return self._task.__await__()
+
+    def __repr__(self):
+        if self._task is not None and self._task.done():
+            return "AsyncTry({0!r})".format(self._task.result())
+        return "AsyncTry(<pending>)"
+
+    async def _map(self, f):
+        t = await self
+        return await _evaluate(f, (t._v,), {}) if t else t
+
+    async def _flatMap(self, f):
+        t = await self
+        return _flatten(await _evaluate(f, (t._v,), {})) if t else t
+
+    async def _recover(self, f):
+        t = await self
+        return t if t else await _evaluate(f, (t._v,), {})
+
+    async def _recoverWith(self, f):
+        t = await self
+        return t if t else _flatten(await _evaluate(f, (t._v,), {}))
+
+    def map(self, f):
+        """Apply function to the value.
+
+        :param f: sync or async function to be applied
+        :return: AsyncTry
+        """
+        return AsyncTry._from(lambda: self._map(f))
+
+    def flatMap(self, f):
+        """Apply function returning Try_ or an awaitable of Try_ to the value.
+
+        :param f: sync or async function to be applied
+        :return: AsyncTry
+
+        >>> async def main():
+        ...     return await AsyncTry(abs, -1).flatMap(lambda x: AsyncTry(divmod, x, 0))
+        >>> asyncio.run(main())  # doctest:+ELLIPSIS
+        Failure(ZeroDivisionError(...))
+        """
+        return AsyncTry._from(lambda: self._flatMap(f))
+
+    def recover(self, f):
+        """If this is a Failure apply f to the exception.
+
+        :param f: sync or async function to be applied
+        :return: AsyncTry
+        """
+        return AsyncTry._from(lambda: self._recover(f))
+
+    def recoverWith(self, f):
+        """If this is a Failure apply function returning Try_ or an awaitable
+        of Try_ to the exception.
+
+        :param f: sync or async function to be applied
+        :return: AsyncTry
+        """
+        return AsyncTry._from(lambda: self._recoverWith(f))
+
+
+def _flatten(t):
+    return Try_._identity_if_try_or_raise(t._v) if t else t
+
+
+async def gather_tries(*aws):
+    """Run awaitables concurrently and collect the outcomes.
+
+    Unlike asyncio.gather, a failure of one awaitable
+    doesn't affect the others.
+
+    :param aws: awaitables
+    :return: List[Try_]
+
+    >>> async def inv(x):
+    ...     return 1 / x
+    >>> asyncio.run(gather_tries(inv(1), inv(0), AsyncTry(inv, 2)))  # doctest:+ELLIPSIS
+    [Success(1.0), Failure(ZeroDivisionError(...)), Success(0.5)]
+    """
+    return list(
+        await asyncio.gather(
+            *(a if isinstance(a, AsyncTry) else _evaluate(a, (), {}) for a in aws)
+        )
+    )
@@ -0,0 +1,23 @@
+from typing import Any, Awaitable, Callable, Generator, Generic, List, TypeVar, Union
+from tryingsnake import Try_
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+class AsyncTry(Generic[T]):
+    def __init__(
+        self, f: Union[Callable[..., Any], Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> None: ...
+    def __await__(self) -> Generator[Any, None, Try_[T]]: ...
+    def map(self, f: Callable[[T], Union[U, Awaitable[U]]]) -> AsyncTry[U]: ...
+    def flatMap(
+        self, f: Callable[[T], Union[Try_[U], Awaitable[Try_[U]]]]
+    ) -> AsyncTry[U]: ...
+    def recover(
+        self, f: Callable[[Exception], Union[T, Awaitable[T]]]
+    ) -> AsyncTry[T]: ...
+    def recoverWith(
+        self, f: Callable[[Exception], Union[Try_[T], Awaitable[Try_[T]]]]
+    ) -> AsyncTry[T]: ...
+
+async def gather_tries(*aws: Awaitable[Any]) -> List[Try_[Any]]: ...
@@ -0,0 +1,344 @@
+from tryingsnake import Try_, Success, Failure, _unhandled_exceptions
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _is_array(xs):
+    return np is not None and isinstance(xs, np.ndarray)
+
+
+def _apply(f, xs, failures):
+    """Apply f to each element of xs not listed in failures.
+
+    :return: a list of values (None for failures) and the updated failures
+    """
+    values = []
+    append = values.append
+    new_failures = dict(failures)
+    for i, x in enumerate(xs):
+        if failures and i in failures:
+            append(None)
+            continue
+        try:
+            append(f(x))
+        except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+            raise e
+        except Exception as e:
+            append(None)
+            new_failures[i] = e
+    return values, new_failures
+
+
+def _call_vectorized(f, xs):
+    """Apply f to an array at once.
+
+    :return: an array of the same length or None if f raises
+             or returns anything else
+    """
+    try:
+        values = f(xs)
+    except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+        raise e
+    except Exception:
+        return None
+    if isinstance(values, np.ndarray) and values.shape[:1] == xs.shape[:1]:
+        return values
+    return None
+
+
+def _apply_vectorized(f, xs, failures):
+    """Apply f to a whole array at once.
+
+    If the call fails, the array is split in halves and each half
+    is tried again, down to single elements, which are evaluated
+    as Try(f, x). A few failing elements cost a logarithmic number
+    of vectorized calls, and the result is an array.
+    """
+    values = _call_vectorized(f, xs)
+    if values is not None:
+        return values, dict(failures)
+    n = len(xs)
+    new_failures = dict(failures)
+    # (start, values, is_single_element)
+    chunks = []
+    pending = [(0, n)]
+    while pending:
+        start, stop = pending.pop()
+        mid = (start + stop) // 2
+        for lo, hi in ((mid, stop), (start, mid)):
+            if hi - lo > 1:
+                values = _call_vectorized(f, xs[lo:hi])
+                if values is None:
+                    pending.append((lo, hi))
+                else:
+                    chunks.append((lo, values, False))
+            elif hi - lo == 1 and lo not in failures:
+                try:
+                    chunks.append((lo, f(xs[lo]), True))
+                except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+                    raise e
+                except Exception as e:
+                    new_failures[lo] = e
+    return _column(n, chunks), new_failures
+
+
+def _dtype_of(v):
+    if isinstance(v, (np.ndarray, np.generic)):
+        return v.dtype, v.shape
+    try:
+        v = np.asarray(v)
+    except ValueError:
+        # Ragged sequences
+        return np.dtype(object), ()
+    return v.dtype, v.shape
+
+
+def _common_dtype(dtypes):
+    """Find a dtype which can hold values of all dtypes without loss.
+
+    :return: numpy.dtype, object if there is no such numeric dtype
+    """
+    dtypes = set(dtypes)
+    if len(dtypes) == 1:
+        return dtypes.pop()
+    try:
+        dtype = np.result_type(*dtypes)
+    except TypeError:
+        return np.dtype(object)
+    if dtype.kind in "SUV" and any(d.kind not in "SUV" for d in dtypes):
+        # Numbers would be converted to strings
+        return np.dtype(object)
+    if all(np.can_cast(d, dtype, "safe") for d in dtypes):
+        return dtype
+    return np.dtype(object)
+
+
+def _column(n, chunks):
+    """Assemble an array of length n from chunks of values."""
+    dtypes, shapes = [], set()
+    for _, values, single in chunks:
+        if single:
+            dtype, shape = _dtype_of(values)
+        else:
+            dtype, shape = values.dtype, values.shape[1:]
+        dtypes.append(dtype)
+        shapes.add(shape)
+    dtype = _common_dtype(dtypes) if dtypes else np.dtype(object)
+    if len(shapes) > 1 or dtype == object:
+        column = np.empty(n, dtype=object)
+        for start, values, single in chunks:
+            if single:
+                column[start] = values
+            else:
+                for i, v in enumerate(values, start):
+                    column[i] = v
+        return column
+    column = np.empty((n,) + shapes.pop(), dtype=dtype)
+    for start, values, single in chunks:
+        if single:
+            column[start] = values
+        else:
+            column[start : start + len(values)] = values
+    return column
+
+
+def _fit(values, v):
+    """Upcast an array of values, if necessary, so v can be stored without loss."""
+    dtype, shape = _dtype_of(v)
+    if shape != values.shape[1:]:
+        return list(values)
+    if np.can_cast(dtype, values.dtype, "safe"):
+        return values
+    return values.astype(_common_dtype([values.dtype, dtype]))
+
+
+class TryBatch:
+    """Columnar representation of a sequence of Try_ values.
+
+    Successful values are stored in a single array (a list or, when
+    the vectorized path has been used, a numpy.ndarray), while failures
+    are kept in a sparse mapping from index to exception.
+    Slots of failed elements in values are unspecified.
+
+    >>> batch = map_batch(lambda x: 1 / x, [1, 0, 2])
+    >>> list(batch)  # doctest:+ELLIPSIS
+    [Success(1.0), Failure(ZeroDivisionError(...)), Success(0.5)]
+    >>> batch.failures  # doctest:+ELLIPSIS
+    {1: ZeroDivisionError(...)}
+    >>> list(batch.recover(lambda e: 0.0).successes())
+    [1.0, 0.0, 0.5]
+    """
+
+    __slots__ = ("values", "failures")
+
+    def __init__(self, values, failures=None):
+        self.values = values
+        self.failures = failures if failures is not None else {}
+
+    @classmethod
+    def from_tries(cls, tries):
+        """Convert an iterable of Try_ to TryBatch
+
+        :param tries: Iterable[Try_]
+        :return: TryBatch
+
+        >>> TryBatch.from_tries([Success(1), Failure(Exception("e"))]).failures
+        {1: Exception('e')}
+        """
+        values = []
+        failures = {}
+        for i, t in enumerate(tries):
+            t = Try_._identity_if_try_or_raise(t, "Invalid type for element: {0}")
+            if t.isSuccess:
+                values.append(t._v)
+            else:
+                values.append(None)
+                failures[i] = t._v
+        return cls(values, failures)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if i in self.failures:
+            return Failure(self.failures[i])
+        return Success(self.values[i])
+
+    def __iter__(self):
+        failures = self.failures
+        for i, v in enumerate(self.values):
+            yield Failure(failures[i]) if i in failures else Success(v)
+
+    def __repr__(self):
+        return "TryBatch(size={0}, failures={1})".format(len(self), len(self.failures))
+
+    @property
+    def mask(self):
+        """Success mask.
+
+        :return: numpy boolean array if values is an array, bytearray otherwise
+
+        >>> map_batch(int, ["1", "a", "3"]).mask
+        bytearray(b'\\x01\\x00\\x01')
+        """
+        if _is_array(self.values):
+            mask = np.ones(len(self), dtype=bool)
+        else:
+            mask = bytearray(b"\x01") * len(self)
+        for i in self.failures:
+            mask[i] = 0
+        return mask
+
+    def successes(self):
+        """Iterate over successful values
+
+        >>> list(map_batch(int, ["1", "a", "3"]).successes())
+        [1, 3]
+        """
+        failures = self.failures
+        if not failures:
+            return iter(self.values)
+        return (v for i, v in enumerate(self.values) if i not in failures)
+
+    def map(self, f):
+        """Apply f to every successful value.
+
+        :param f: function to be applied
+        :return: TryBatch
+
+        >>> map_batch(int, ["1", "a"]).map(lambda x: x + 1)[0]
+        Success(2)
+        """
+        if _is_array(self.values):
+            return TryBatch(*_apply_vectorized(f, self.values, self.failures))
+        return TryBatch(*_apply(f, self.values, self.failures))
+
+    def filter(self, f, exception_cls=Exception, msg=None):
+        """Convert elements for which f evaluates to False to failures.
+
+        If values is an array, f is first called with the whole array,
+        and if it returns a boolean array, it is used as a mask.
+        Otherwise f is applied to each successful value.
+
+        :param f: predicate
+        :param exception_cls: optional exception class to use
+        :param msg: optional message
+        :return: TryBatch
+
+        >>> map_batch(int, ["1", "-1"]).filter(lambda x: x > 0).failures  # doctest:+ELLIPSIS
+        {1: Exception('<function <lambda> at ...>')}
+        """
+        values, failures = self.values, self.failures
+        mask = _call_vectorized(f, values) if _is_array(values) else None
+        if mask is not None and mask.dtype == bool and mask.ndim == 1:
+            rejected = (i for i in np.flatnonzero(~mask).tolist() if i not in failures)
+        else:
+            rejected = (
+                i for i, v in enumerate(values) if i not in failures and not f(v)
+            )
+        failures = dict(failures)
+        for i in rejected:
+            failures[i] = exception_cls(msg if msg else repr(f))
+        return TryBatch(values, failures)
+
+    def recover(self, f):
+        """Apply f to every failure.
+
+        f is called only for failures, and values are copied only
+        if at least one of them has been recovered.
+
+        :param f: function to be applied
+        :return: TryBatch
+
+        >>> list(map_batch(int, ["1", "a"]).recover(lambda e: -1).successes())
+        [1, -1]
+        """
+        if not self.failures:
+            return self
+        values, copied = self.values, False
+        failures = {}
+        for i, e in self.failures.items():
+            try:
+                v = f(e)
+            except _unhandled_exceptions.get(Try_._unhandled) as e_:  # type: ignore
+                raise e_
+            except Exception as e_:
+                failures[i] = e_
+                continue
+            if _is_array(values):
+                fitted = _fit(values, v)
+                copied = copied or fitted is not values
+                values = fitted
+            if not copied:
+                values = values.copy()
+                copied = True
+            values[i] = v
+        return TryBatch(values, failures)
+
+
+def map_batch(f, xs, vectorize=True):
+    """Evaluate f over all elements of xs without allocating
+    a Try_ per element.
+
+    If numpy is available, xs is a numpy.ndarray and vectorize is True,
+    f is called once with the whole array. If the call fails, failing
+    elements are located by calling f on halves of the array, and
+    evaluated as Try(f, x), so they fail with the same exceptions.
+    Values are kept in an array, upcast if necessary.
+
+    :param f: function to be applied
+    :param xs: an iterable
+    :param vectorize: whether to try vectorized evaluation first
+    :return: TryBatch
+
+    >>> map_batch(int, ["1", "a", "3"])
+    TryBatch(size=3, failures=1)
+    """
+    if vectorize and _is_array(xs):
+        return TryBatch(*_apply_vectorized(f, xs, {}))
+    return TryBatch(*_apply(f, xs, {}))
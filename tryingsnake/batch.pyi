@@ -0,0 +1,43 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+from tryingsnake import Try_
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+class TryBatch(Generic[T]):
+    values: Any
+    failures: Dict[int, Exception]
+    def __init__(
+        self, values: Any, failures: Optional[Dict[int, Exception]] = ...
+    ) -> None: ...
+    @classmethod
+    def from_tries(cls, tries: Iterable[Try_[T]]) -> TryBatch[T]: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, i: int) -> Try_[T]: ...
+    def __iter__(self) -> Iterator[Try_[T]]: ...
+    @property
+    def mask(self) -> Any: ...
+    def successes(self) -> Iterator[T]: ...
+    def map(self, f: Callable[[T], U]) -> TryBatch[U]: ...
+    def filter(
+        self,
+        f: Callable[[T], bool],
+        exception_cls: Type[Exception] = ...,
+        msg: Optional[str] = ...,
+    ) -> TryBatch[T]: ...
+    def recover(self, f: Callable[[Exception], T]) -> TryBatch[T]: ...
+
+def map_batch(
+    f: Callable[[Any], T], xs: Iterable[Any], vectorize: bool = ...
+) -> TryBatch[T]: ...
@@ -0,0 +1,61 @@
+from functools import wraps
+from inspect import isgeneratorfunction
+from tryingsnake import Try_, Success, Failure, _unhandled_exceptions
+
+
+def try_block(f):
+    """Run a generator function as a do-block over Try_ values.
+
+    Inside the block ``x = yield t`` unwraps t if it is a Success
+    or stops the block if it is a Failure, which then becomes the result.
+    The value returned by the block is wrapped with Success, and
+    exceptions raised by the block are wrapped with Failure.
+
+    The result is the same as for the equivalent nested flatMap calls,
+    but the generator is driven by a single loop, without
+    a closure or an intermediate Try_ per step.
+
+    When the block is stopped by a Failure, the generator is closed,
+    so its finally clauses are executed.
+
+    :param f: generator function yielding Try_
+    :return: function returning Try_
+
+    >>> from tryingsnake import Try
+    >>> @try_block
+    ... def div(x, y):
+    ...     a = yield Try(float, x)
+    ...     b = yield Try(float, y)
+    ...     return a / b
+    >>> div("1", "2")
+    Success(0.5)
+    >>> div("1", "a")  # doctest:+ELLIPSIS
+    Failure(ValueError(...))
+    >>> div("1", "0")  # doctest:+ELLIPSIS
+    Failure(ZeroDivisionError(...))
+    """
+    if not isgeneratorfunction(f):
+        raise TypeError("Expected a generator function, got {0!r}".format(f))
+
+    @wraps(f)
+    def _(*args, **kwargs):
+        return _run(f(*args, **kwargs))
+
+    return _
+
+
+def _run(gen):
+    try:
+        send = gen.send
+        t = send(None)
+        while isinstance(t, Success):
+            t = send(t._v)
+        gen.close()
+    except StopIteration as e:
+        return Success(e.value)
+    except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+        raise e
+    except Exception as e:
+        return Failure(e)
+    # Same as Try_.flatMap with a function not returning Try_
+    return Try_._identity_if_try_or_raise(t, "Invalid yielded type: {0}")
@@ -0,0 +1,8 @@
+from typing import Any, Callable, Generator, TypeVar
+from tryingsnake import Try_
+
+T = TypeVar("T")
+
+def try_block(
+    f: Callable[..., Generator[Try_[Any], Any, T]],
+) -> Callable[..., Try_[T]]: ...
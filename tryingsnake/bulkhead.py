@@ -0,0 +1,300 @@
+import asyncio
+from collections import deque, namedtuple
+import threading
+import time
+from tryingsnake import Try, Failure
+from tryingsnake.aio import AsyncTry, _evaluate
+
+BulkheadStats = namedtuple(
+    "BulkheadStats",
+    [
+        "active",
+        "queued",
+        "peak_active",
+        "peak_queued",
+        "accepted",
+        "rejected",
+        "timed_out",
+        "total_wait",
+        "max_wait",
+    ],
+)
+BulkheadStats.__doc__ = """Occupancy and queue counters of a bulkhead.
+
+:param active: calls currently in flight
+:param queued: calls currently waiting for a slot
+:param peak_active: the largest number of calls in flight
+:param peak_queued: the largest number of waiting calls
+:param accepted: calls which have been given a slot
+:param rejected: calls rejected because the queue was full
+:param timed_out: calls rejected after waiting timeout seconds
+:param total_wait: total number of seconds accepted calls spent in the queue
+:param max_wait: the longest time in seconds an accepted call spent in the queue
+"""
+
+
+class BulkheadFullError(Exception):
+    """Raised (wrapped in Failure) for calls rejected by a full bulkhead"""
+
+
+class _Counters:
+    def __init__(self, max_concurrent, max_queued, timeout, clock):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if max_queued < 0:
+            raise ValueError("max_queued must be non-negative")
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must be non-negative")
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.timeout = timeout
+        self._clock = clock
+        self._active = 0
+        self._peak_active = 0
+        self._peak_queued = 0
+        self._accepted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def __repr__(self):
+        return "{0}(max_concurrent={1}, max_queued={2})".format(
+            type(self).__name__, self.max_concurrent, self.max_queued
+        )
+
+    def _enter(self):
+        self._active += 1
+        self._accepted += 1
+        if self._active > self._peak_active:
+            self._peak_active = self._active
+
+    def _waited(self, start):
+        wait = self._clock() - start
+        self._total_wait += wait
+        if wait > self._max_wait:
+            self._max_wait = wait
+
+    def _enqueued(self, queued):
+        if queued > self._peak_queued:
+            self._peak_queued = queued
+
+    def _full(self):
+        self._rejected += 1
+        return Failure(BulkheadFullError("Bulkhead is full"))
+
+    def _expired(self):
+        self._timed_out += 1
+        return Failure(
+            BulkheadFullError("Timed out after {0} seconds".format(self.timeout))
+        )
+
+    def _stats(self, queued):
+        return BulkheadStats(
+            self._active,
+            queued,
+            self._peak_active,
+            self._peak_queued,
+            self._accepted,
+            self._rejected,
+            self._timed_out,
+            self._total_wait,
+            self._max_wait,
+        )
+
+
+class _Waiter:
+    __slots__ = ("ready", "granted")
+
+    def __init__(self, lock):
+        self.ready = threading.Condition(lock)
+        self.granted = False
+
+
+class Bulkhead(_Counters):
+    """Concurrency limiter for Try calls made from multiple threads.
+
+    At most max_concurrent calls are in flight at the same time.
+    Further calls wait for a slot in a FIFO queue of at most max_queued
+    calls, for up to timeout seconds (indefinitely if timeout is None).
+    Calls which don't fit in the queue are rejected immediately, and calls
+    which time out are rejected after waiting, both with
+    Failure(BulkheadFullError) and without calling f.
+
+    A single bulkhead can be shared by any number of functions (for example
+    all calls to the same backend). For asyncio code use AsyncBulkhead.
+
+    :param max_concurrent: maximum number of calls in flight
+    :param max_queued: maximum number of calls waiting for a slot
+    :param timeout: optional maximum number of seconds a call waits for a slot
+    :param clock: monotonic clock returning seconds
+
+    >>> bulkhead = Bulkhead(max_concurrent=1)
+    >>> bulkhead.Try(bulkhead.Try, int, "1")  # doctest:+ELLIPSIS
+    Success(Failure(BulkheadFullError(...)))
+    >>> bulkhead.stats()  # doctest:+ELLIPSIS
+    BulkheadStats(active=0, queued=0, peak_active=1, ..., rejected=1, ...)
+    """
+
+    def __init__(
+        self, max_concurrent=10, max_queued=0, timeout=None, clock=time.monotonic
+    ):
+        super().__init__(max_concurrent, max_queued, timeout, clock)
+        self._lock = threading.Lock()
+        self._waiters = deque()
+
+    def stats(self):
+        """Current counters
+
+        :return: BulkheadStats
+        """
+        with self._lock:
+            return self._stats(len(self._waiters))
+
+    def _acquire(self):
+        """Take a slot.
+
+        :return: None if the slot has been taken, Failure otherwise
+        """
+        with self._lock:
+            waiters = self._waiters
+            if self._active < self.max_concurrent and not waiters:
+                self._enter()
+                return None
+            if len(waiters) >= self.max_queued:
+                return self._full()
+            waiter = _Waiter(self._lock)
+            waiters.append(waiter)
+            self._enqueued(len(waiters))
+            start = self._clock()
+            try:
+                waiter.ready.wait_for(lambda: waiter.granted, self.timeout)
+            except BaseException:
+                if waiter.granted:
+                    self._pass()
+                else:
+                    waiters.remove(waiter)
+                raise
+            if not waiter.granted:
+                waiters.remove(waiter)
+                return self._expired()
+            # The slot has been passed by _release, so active is unchanged
+            self._accepted += 1
+            self._waited(start)
+            return None
+
+    def _pass(self):
+        # Hand the slot over to the first waiter, or free it
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            waiter.ready.notify()
+        else:
+            self._active -= 1
+
+    def _release(self):
+        with self._lock:
+            self._pass()
+
+    def _invoke(self, call, *args, **kwargs):
+        rejection = self._acquire()
+        if rejection is not None:
+            return rejection
+        try:
+            return call(*args, **kwargs)
+        finally:
+            self._release()
+
+    def Try(self, f, *args, **kwargs):
+        """Equivalent of Try(f, *args, **kwargs) guarded by this bulkhead.
+
+        :return: Try_, Failure(BulkheadFullError) if the call has been rejected
+        """
+        return self._invoke(Try, f, *args, **kwargs)
+
+
+class AsyncBulkhead(_Counters):
+    """Concurrency limiter for AsyncTry calls.
+
+    Same as Bulkhead, but calls wait for a slot without blocking
+    the event loop. AsyncBulkhead should be used from a single event loop.
+
+    :param max_concurrent: maximum number of calls in flight
+    :param max_queued: maximum number of calls waiting for a slot
+    :param timeout: optional maximum number of seconds a call waits for a slot
+    :param clock: monotonic clock returning seconds
+
+    >>> async def main():
+    ...     bulkhead = AsyncBulkhead(max_concurrent=1)
+    ...     return await asyncio.gather(
+    ...         bulkhead.AsyncTry(asyncio.sleep, 0.01, "a"),
+    ...         bulkhead.AsyncTry(asyncio.sleep, 0.01, "b"),
+    ...     )
+    >>> asyncio.run(main())  # doctest:+ELLIPSIS
+    [Success('a'), Failure(BulkheadFullError(...))]
+    """
+
+    def __init__(
+        self, max_concurrent=10, max_queued=0, timeout=None, clock=time.monotonic
+    ):
+        super().__init__(max_concurrent, max_queued, timeout, clock)
+        self._waiters = deque()
+
+    def stats(self):
+        """Current counters
+
+        :return: BulkheadStats
+        """
+        return self._stats(len(self._waiters))
+
+    async def _acquire(self):
+        waiters = self._waiters
+        if self._active < self.max_concurrent and not waiters:
+            self._enter()
+            return None
+        if len(waiters) >= self.max_queued:
+            return self._full()
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        self._enqueued(len(waiters))
+        start = self._clock()
+        try:
+            await asyncio.wait_for(waiter, self.timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has been passed just before timeout or cancellation
+                self._release()
+            elif waiter in waiters:
+                waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                return self._expired()
+            raise
+        self._accepted += 1
+        self._waited(start)
+        return None
+
+    def _release(self):
+        waiters = self._waiters
+        while waiters:
+            waiter = waiters.popleft()
+            # Skip waiters cancelled, but not yet removed from the queue
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    async def _invoke_async(self, f, args, kwargs):
+        rejection = await self._acquire()
+        if rejection is not None:
+            return rejection
+        try:
+            return await _evaluate(f, args, kwargs)
+        finally:
+            self._release()
+
+    def AsyncTry(self, f, *args, **kwargs):
+        """Equivalent of AsyncTry(f, *args, **kwargs) guarded by this bulkhead.
+
+        :return: AsyncTry
+        """
+        return AsyncTry._from(lambda: self._invoke_async(f, args, kwargs))
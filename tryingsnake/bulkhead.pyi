@@ -0,0 +1,46 @@
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+from tryingsnake import Try_
+from tryingsnake.aio import AsyncTry
+
+T = TypeVar("T")
+
+class BulkheadStats(NamedTuple):
+    active: int
+    queued: int
+    peak_active: int
+    peak_queued: int
+    accepted: int
+    rejected: int
+    timed_out: int
+    total_wait: float
+    max_wait: float
+
+class BulkheadFullError(Exception): ...
+
+class Bulkhead:
+    max_concurrent: int
+    max_queued: int
+    timeout: Optional[float]
+    def __init__(
+        self,
+        max_concurrent: int = ...,
+        max_queued: int = ...,
+        timeout: Optional[float] = ...,
+        clock: Callable[[], float] = ...,
+    ) -> None: ...
+    def stats(self) -> BulkheadStats: ...
+    def Try(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> Try_[T]: ...
+
+class AsyncBulkhead:
+    max_concurrent: int
+    max_queued: int
+    timeout: Optional[float]
+    def __init__(
+        self,
+        max_concurrent: int = ...,
+        max_queued: int = ...,
+        timeout: Optional[float] = ...,
+        clock: Callable[[], float] = ...,
+    ) -> None: ...
+    def stats(self) -> BulkheadStats: ...
+    def AsyncTry(self, f: Any, *args: Any, **kwargs: Any) -> AsyncTry[Any]: ...
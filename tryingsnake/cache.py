@@ -0,0 +1,177 @@
+from collections import OrderedDict, namedtuple
+import threading
+import time
+from tryingsnake import Try
+
+CacheStats = namedtuple(
+    "CacheStats", ["hits", "misses", "bypasses", "evictions", "size"]
+)
+CacheStats.__doc__ = """Counters of a TryCache.
+
+:param hits: calls answered from the cache (including waits for a call in flight)
+:param misses: calls which evaluated f
+:param bypasses: calls with unhashable arguments
+:param evictions: entries removed to respect maxsize
+:param size: current number of entries
+"""
+
+_KWARGS_MARK = object()
+
+
+class _Flight:
+    __slots__ = ("event", "result")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+
+
+class TryCache:
+    """Memoize outcomes of Try calls.
+
+    Successes are cached for ttl seconds and, if failure_ttl
+    is greater than zero, failures for failure_ttl seconds.
+    The cache holds at most maxsize entries and evicts the least
+    recently used ones.
+
+    Concurrent calls with the same arguments are de-duplicated,
+    only the first one evaluates f and the others wait for its outcome.
+    Calls with unhashable arguments bypass the cache.
+    Arguments of different types are cached separately,
+    even if they compare equal.
+
+    :param maxsize: maximum number of entries
+    :param ttl: lifetime of cached successes in seconds, None for no limit
+    :param failure_ttl: lifetime of cached failures in seconds,
+                        0 disables caching of failures
+    :param clock: monotonic clock returning seconds
+
+    >>> cache = TryCache(maxsize=2)
+    >>> cache.Try(int, "1")
+    Success(1)
+    >>> cache.Try(int, "1")
+    Success(1)
+    >>> cache.stats()
+    CacheStats(hits=1, misses=1, bypasses=0, evictions=0, size=1)
+    """
+
+    def __init__(self, maxsize=128, ttl=None, failure_ttl=0, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._hits = self._misses = self._bypasses = self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Current counters
+
+        :return: CacheStats
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._bypasses,
+                self._evictions,
+                len(self._entries),
+            )
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _key(call, args, kwargs):
+        key = (call,) + args
+        if kwargs:
+            items = sorted(kwargs.items())
+            key += (_KWARGS_MARK,) + tuple(items)
+            types = tuple(type(v) for _, v in items)
+        else:
+            types = ()
+        # Equal arguments of different types, like 1, 1.0 and True,
+        # are cached separately, as with functools.lru_cache(typed=True)
+        key += tuple(type(v) for v in args) + types
+        hash(key)
+        return key
+
+    def _lookup(self, key):
+        """Find a fresh entry or join / start a flight.
+
+        :return: (result, flight, leader)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires = entry
+                if expires is None or expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return result, None, False
+                del self._entries[key]
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._hits += 1
+                return None, flight, False
+            flight = self._flights[key] = _Flight()
+            self._misses += 1
+            return None, flight, True
+
+    def _store(self, key, flight, result):
+        ttl = self.ttl if result.isSuccess else self.failure_ttl
+        with self._lock:
+            del self._flights[key]
+            if ttl is None or ttl > 0:
+                expires = None if ttl is None else self._clock() + ttl
+                self._entries[key] = (result, expires)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        flight.result = result
+        flight.event.set()
+
+    def _invoke(self, call, *args, **kwargs):
+        try:
+            key = self._key(call, args, kwargs)
+        except TypeError:
+            with self._lock:
+                self._bypasses += 1
+            return call(*args, **kwargs)
+
+        result, flight, leader = self._lookup(key)
+        if flight is None:
+            return result
+        if not leader:
+            flight.event.wait()
+            if flight.result is None:
+                # The leader raised an unhandled exception, try on our own
+                return call(*args, **kwargs)
+            return flight.result
+
+        try:
+            result = call(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+            raise
+        self._store(key, flight, result)
+        return result
+
+    def Try(self, f, *args, **kwargs):
+        """Equivalent of Try(f, *args, **kwargs) answered from the cache
+        if possible.
+
+        :return: Try_
+        """
+        return self._invoke(Try, f, *args, **kwargs)
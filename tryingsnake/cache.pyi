@@ -0,0 +1,27 @@
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+from tryingsnake import Try_
+
+T = TypeVar("T")
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    bypasses: int
+    evictions: int
+    size: int
+
+class TryCache:
+    maxsize: int
+    ttl: Optional[float]
+    failure_ttl: Optional[float]
+    def __init__(
+        self,
+        maxsize: int = ...,
+        ttl: Optional[float] = ...,
+        failure_ttl: Optional[float] = ...,
+        clock: Callable[[], float] = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def stats(self) -> CacheStats: ...
+    def clear(self) -> None: ...
+    def Try(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> Try_[T]: ...
@@ -0,0 +1,220 @@
+from collections import deque
+import threading
+import time
+from tryingsnake import Try, Failure
+from tryingsnake.aio import AsyncTry, _evaluate
+from tryingsnake.bulkhead import BulkheadFullError
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class CircuitOpenError(Exception):
+    """Raised (wrapped in Failure) for calls rejected by an open circuit"""
+
+
+class CircuitBreaker:
+    """Circuit breaker for Try calls.
+
+    While closed, outcomes of the last window calls are tracked and
+    the circuit opens once at least min_calls have been recorded and
+    the failure rate reaches failure_rate. An open circuit rejects
+    calls with Failure(CircuitOpenError) without calling f.
+    After cooldown seconds the circuit becomes half-open and lets
+    up to half_open_calls probes through. A successful probe closes
+    the circuit, a failed one opens it again. Outcomes of calls admitted
+    before the last change of state are ignored, so calls still in flight
+    when the circuit opened can't close it or use up its probes.
+    Rejected calls share a single Failure per open period.
+
+    A single breaker can be shared by any number of functions (for example
+    all calls to the same backend) and is safe to use from multiple threads
+    and asyncio tasks.
+
+    :param failure_rate: failure rate (0 - 1) which opens the circuit
+    :param window: number of recent calls used to compute the failure rate
+    :param min_calls: minimum number of recorded calls required to open
+    :param cooldown: number of seconds the circuit stays open
+    :param half_open_calls: number of probe calls allowed while half-open
+    :param record: exception classes counted as failures
+    :param clock: monotonic clock returning seconds
+
+    >>> breaker = CircuitBreaker(window=2, min_calls=2, cooldown=60)
+    >>> [breaker.Try(int, "a").isFailure for _ in range(2)]
+    [True, True]
+    >>> breaker.state
+    'open'
+    >>> breaker.Try(int, "1")  # doctest:+ELLIPSIS
+    Failure(CircuitOpenError(...))
+    """
+
+    def __init__(
+        self,
+        failure_rate=0.5,
+        window=20,
+        min_calls=10,
+        cooldown=30.0,
+        half_open_calls=1,
+        record=(Exception,),
+        clock=time.monotonic,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if min_calls > window:
+            raise ValueError("min_calls cannot be larger than window")
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.half_open_calls = half_open_calls
+        self._record_on = record
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=window)
+        self._failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._generation = 0
+        self._rejected_with = None
+        self.rejected = 0
+
+    def __repr__(self):
+        return "CircuitBreaker(state={0!r})".format(self.state)
+
+    @property
+    def state(self):
+        """Current state, one of "closed", "open", "half-open" """
+        with self._lock:
+            if self._state == OPEN and self._cooled_down():
+                return HALF_OPEN
+            return self._state
+
+    def _cooled_down(self):
+        return self._clock() - self._opened_at >= self.cooldown
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._generation += 1
+        # Shared by all calls rejected until the circuit closes again
+        self._rejected_with = Failure(CircuitOpenError("Circuit is open"))
+
+    def _close(self):
+        self._state = CLOSED
+        self._generation += 1
+        self._outcomes.clear()
+        self._failures = 0
+
+    def _acquire(self):
+        """Admit a call.
+
+        :return: None if the call has been rejected, otherwise a ticket
+                 to pass to _record or _release once the call finishes.
+                 Tickets of calls admitted before the last change of state
+                 are stale and their outcomes are ignored.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return self._generation
+            if self._state == OPEN:
+                if not self._cooled_down():
+                    self.rejected += 1
+                    return None
+                self._state = HALF_OPEN
+                self._generation += 1
+                self._probes = 0
+            if self._probes < self.half_open_calls:
+                self._probes += 1
+                return self._generation
+            self.rejected += 1
+            return None
+
+    def _record(self, ticket, failed):
+        with self._lock:
+            if ticket != self._generation:
+                return
+            if self._state == HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self._close()
+            elif self._state == CLOSED:
+                outcomes = self._outcomes
+                if len(outcomes) == outcomes.maxlen:
+                    self._failures -= outcomes[0]
+                outcomes.append(failed)
+                self._failures += failed
+                n = len(outcomes)
+                if n >= self.min_calls and self._failures >= self.failure_rate * n:
+                    self._open()
+
+    def _release(self, ticket):
+        # Interrupted probe calls don't count as an outcome
+        with self._lock:
+            if ticket == self._generation and self._state == HALF_OPEN:
+                self._probes -= 1
+
+    def _failed(self, result):
+        return result.isFailure and isinstance(result._v, self._record_on)
+
+    def _outcome(self, ticket, result):
+        # Calls rejected by a bulkhead say nothing about the backend
+        if result.isFailure and isinstance(result._v, BulkheadFullError):
+            self._release(ticket)
+        else:
+            self._record(ticket, self._failed(result))
+        return result
+
+    def _rejection(self):
+        rejection = self._rejected_with
+        # Don't let tracebacks of earlier get() calls pile up
+        rejection._v.__traceback__ = None
+        return rejection
+
+    def _invoke(self, call, *args, **kwargs):
+        ticket = self._acquire()
+        if ticket is None:
+            return self._rejection()
+        try:
+            result = call(*args, **kwargs)
+        except Exception:
+            # Unhandled exceptions count as failures
+            self._record(ticket, True)
+            raise
+        except BaseException:
+            self._release(ticket)
+            raise
+        return self._outcome(ticket, result)
+
+    def Try(self, f, *args, **kwargs):
+        """Equivalent of Try(f, *args, **kwargs) guarded by this breaker.
+
+        :return: Try_, Failure(CircuitOpenError) if the call has been rejected
+        """
+        return self._invoke(Try, f, *args, **kwargs)
+
+    async def _invoke_async(self, f, args, kwargs):
+        ticket = self._acquire()
+        if ticket is None:
+            return self._rejection()
+        try:
+            result = await _evaluate(f, args, kwargs)
+        except Exception:
+            self._record(ticket, True)
+            raise
+        except BaseException:
+            self._release(ticket)
+            raise
+        return self._outcome(ticket, result)
+
+    def AsyncTry(self, f, *args, **kwargs):
+        """Equivalent of AsyncTry(f, *args, **kwargs) guarded by this breaker.
+
+        :return: AsyncTry
+
+        >>> import asyncio
+        >>> async def main():
+        ...     return await CircuitBreaker().AsyncTry(divmod, 7, 2)
+        >>> asyncio.run(main())
+        Success((3, 1))
+        """
+        return AsyncTry._from(lambda: self._invoke_async(f, args, kwargs))
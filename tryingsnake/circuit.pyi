@@ -0,0 +1,32 @@
+from typing import Any, Callable, Tuple, Type, TypeVar
+from tryingsnake import Try_
+from tryingsnake.aio import AsyncTry
+
+T = TypeVar("T")
+
+CLOSED: str
+OPEN: str
+HALF_OPEN: str
+
+class CircuitOpenError(Exception): ...
+
+class CircuitBreaker:
+    failure_rate: float
+    min_calls: int
+    cooldown: float
+    half_open_calls: int
+    rejected: int
+    def __init__(
+        self,
+        failure_rate: float = ...,
+        window: int = ...,
+        min_calls: int = ...,
+        cooldown: float = ...,
+        half_open_calls: int = ...,
+        record: Tuple[Type[BaseException], ...] = ...,
+        clock: Callable[[], float] = ...,
+    ) -> None: ...
+    @property
+    def state(self) -> str: ...
+    def Try(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> Try_[T]: ...
+    def AsyncTry(self, f: Any, *args: Any, **kwargs: Any) -> AsyncTry[Any]: ...
@@ -0,0 +1,176 @@
+import builtins
+import pickle
+from tryingsnake import (
+    Success,
+    Failure,
+    RemoteFailure,
+    _failure_frames,
+    _failure_state,
+    _restore_failure,
+    _type_name,
+)
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+_BACKENDS = ("pickle", "msgpack")
+_SUCCESS, _FAILURE = 0, 1
+
+
+def _check_backend(backend):
+    if backend not in _BACKENDS:
+        raise ValueError(
+            "Invalid backend {0!r}, expected one of {1}".format(backend, _BACKENDS)
+        )
+    if backend == "msgpack" and msgpack is None:
+        raise ImportError("msgpack backend requires msgpack package")
+    return backend
+
+
+def _encode(t):
+    if isinstance(t, Success):
+        return (_SUCCESS, t._v)
+    elif isinstance(t, Failure):
+        return (_FAILURE,) + _failure_state(t)
+    raise TypeError("Invalid type for t: {0}".format(type(t)))
+
+
+def _decode(item):
+    if item[0] == _SUCCESS:
+        return Success(item[1])
+    return _restore_failure(*item[1:])
+
+
+def _resolve(type_name, types):
+    """Find an exception type by its qualified name.
+
+    Only built-in exceptions and types listed in types are resolved,
+    so decoding data never imports modules.
+    """
+    for cls in types:
+        if _type_name(cls) == type_name:
+            return cls
+    if "." not in type_name:
+        obj = getattr(builtins, type_name, None)
+        if isinstance(obj, type) and issubclass(obj, Exception):
+            return obj
+    return None
+
+
+def _encode_msgpack(t):
+    if isinstance(t, Success):
+        return [_SUCCESS, t._v]
+    elif isinstance(t, Failure):
+        e = t._v
+        try:
+            msgpack.packb(e.args)
+            portable = True
+        except (TypeError, ValueError, OverflowError):
+            portable = False
+        args = list(e.args) if portable else [repr(a) for a in e.args]
+        frames = [list(frame) for frame in _failure_frames(t)]
+        return [_FAILURE, _type_name(type(e)), args, portable, frames]
+    raise TypeError("Invalid type for t: {0}".format(type(t)))
+
+
+def _decode_msgpack(item, types=()):
+    if item[0] == _SUCCESS:
+        return Success(item[1])
+    _, type_name, args, portable, frames = item
+    e = None
+    if portable:
+        cls = _resolve(type_name, types)
+        if cls is not None:
+            try:
+                e = cls(*args)
+            except Exception:
+                pass
+        if e is None:
+            args = [repr(a) for a in args]
+    if e is None:
+        e = RemoteFailure(type_name, *args)
+    failure = Failure(e)
+    failure._tb = tuple(map(tuple, frames)) or None
+    return failure
+
+
+def dumps(t, backend="pickle"):
+    """Serialize Success or Failure.
+
+    Failures are encoded with the type and args of the exception
+    and the summary of its traceback (see Failure.stack).
+    Exceptions which cannot be encoded or restored
+    are decoded as RemoteFailure.
+
+    The "msgpack" backend requires msgpack package, and can encode
+    only values and exception args supported by msgpack.
+    Exceptions are restored from their type name and args,
+    see loads.
+
+    :param t: Try_
+    :param backend: one of "pickle", "msgpack"
+    :return: bytes
+
+    >>> loads(dumps(Success(1)))
+    Success(1)
+    >>> loads(dumps(Failure(ValueError("e"))))
+    Failure(ValueError('e'))
+    >>> len(dumps(Success(1))) < len(pickle.dumps(Success(1)))
+    True
+    """
+    if _check_backend(backend) == "pickle":
+        return pickle.dumps(_encode(t), pickle.HIGHEST_PROTOCOL)
+    return msgpack.packb(_encode_msgpack(t))
+
+
+def loads(data, backend="pickle", types=()):
+    """Deserialize Success or Failure encoded with dumps.
+
+    As with pickle, data with the "pickle" backend must come
+    from a trusted source.
+
+    With the "msgpack" backend only built-in exceptions and exception
+    types listed in types are restored, other exceptions
+    are decoded as RemoteFailure.
+
+    :param data: bytes
+    :param backend: one of "pickle", "msgpack"
+    :param types: exception classes which can be restored
+                  by the "msgpack" backend
+    :return: Try_
+    """
+    if _check_backend(backend) == "pickle":
+        return _decode(pickle.loads(data))
+    return _decode_msgpack(msgpack.unpackb(data), tuple(types))
+
+
+def dumps_batch(ts, backend="pickle"):
+    """Serialize an iterable of Try_ as a single message.
+
+    :param ts: an iterable of Try_
+    :param backend: one of "pickle", "msgpack"
+    :return: bytes
+
+    >>> loads_batch(dumps_batch([Success(1), Failure(ValueError("e"))]))
+    [Success(1), Failure(ValueError('e'))]
+    """
+    if _check_backend(backend) == "pickle":
+        return pickle.dumps([_encode(t) for t in ts], pickle.HIGHEST_PROTOCOL)
+    return msgpack.packb([_encode_msgpack(t) for t in ts])
+
+
+def loads_batch(data, backend="pickle", types=()):
+    """Deserialize a list of Try_ encoded with dumps_batch.
+
+    :param data: bytes
+    :param backend: one of "pickle", "msgpack"
+    :param types: exception classes which can be restored
+                  by the "msgpack" backend, see loads
+    :return: a list of Try_
+    """
+    if _check_backend(backend) == "pickle":
+        return [_decode(item) for item in pickle.loads(data)]
+    types = tuple(types)
+    return [_decode_msgpack(item, types) for item in msgpack.unpackb(data)]
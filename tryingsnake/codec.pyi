@@ -0,0 +1,15 @@
+from typing import Any, Iterable, List, Type
+from tryingsnake import Try_
+
+def dumps(t: Try_[Any], backend: str = ...) -> bytes: ...
+def loads(
+    data: bytes,
+    backend: str = ...,
+    types: Iterable[Type[Exception]] = ...,
+) -> Try_[Any]: ...
+def dumps_batch(ts: Iterable[Try_[Any]], backend: str = ...) -> bytes: ...
+def loads_batch(
+    data: bytes,
+    backend: str = ...,
+    types: Iterable[Type[Exception]] = ...,
+) -> List[Try_[Any]]: ...
@@ -1,10 +1,32 @@
+import functools
+import inspect
 import tryingsnake
+from tryingsnake.bulkhead import Bulkhead
+from tryingsnake.stream import try_iter
 
 
-def Try(f):
+def Try(f, *, capture=None, timeout=None, bulkhead=None, breaker=None, cache=None):
     """A curried version of Try.
 
+    Options are applied in the order of the parameters, so for example
+    cached outcomes don't go through the circuit breaker, and calls
+    rejected by the breaker don't take bulkhead slots. Calls rejected
+    by the bulkhead are not recorded by the breaker.
+
     :param f: Callable[..., T]
+    :param capture: optional traceback capture policy used for each call,
+                    see Try_.set_capture
+    :param timeout: optional time limit in seconds for each call,
+                    see tryingsnake.deadline
+    :param bulkhead: optional tryingsnake.bulkhead.Bulkhead (AsyncBulkhead
+                     is not supported), can be shared between many
+                     functions. With timeout,
+                     a call keeps its slot until f returns, even after
+                     it has timed out, and time spent waiting for a slot
+                     doesn't count towards timeout (see Bulkhead timeout)
+    :param breaker: optional tryingsnake.circuit.CircuitBreaker,
+                    can be shared between many functions
+    :param cache: optional tryingsnake.cache.TryCache
     :return: Callable[..., Try_[T]]
 
     >>> from operator import add, truediv
@@ -14,9 +36,234 @@ def Try(f):
     >>> try_add = Try(add)
     >>> try_add(1, 2)
     Success(3)
+    >>> Try(truediv, capture="none")(1, 0).stack
+    []
+    >>> import time
+    >>> Try(time.sleep, timeout=0.05)(1)  # doctest:+ELLIPSIS
+    Failure(TimeoutError(...))
     """
 
+    if bulkhead is not None and not isinstance(bulkhead, Bulkhead):
+        raise TypeError(
+            "bulkhead must be a Bulkhead, got {0}".format(type(bulkhead).__name__)
+        )
+
     def _(*args, **kwargs):
         return tryingsnake.Try(f, *args, **kwargs)
 
+    if capture is not None:
+        _ = _with_capture(_, tryingsnake._check_capture_policy(capture))
+    if timeout is not None:
+        _ = _with_timeout(_, timeout, bulkhead)
+    elif bulkhead is not None:
+        _ = _with_policy(_, bulkhead)
+    if breaker is not None:
+        _ = _with_policy(_, breaker)
+    if cache is not None:
+        _ = _with_policy(_, cache)
+    return _
+
+
+def _with_capture(call, policy):
+    def _(*args, **kwargs):
+        token = tryingsnake._capture_policy.set(policy)
+        try:
+            return call(*args, **kwargs)
+        finally:
+            tryingsnake._capture_policy.reset(token)
+
     return _
+
+
+def _with_timeout(call, timeout, bulkhead=None):
+    from tryingsnake.deadline import _call_in_thread
+
+    if bulkhead is None:
+
+        def _(*args, **kwargs):
+            return _call_in_thread(timeout, call, args, kwargs)
+
+        return _
+
+    def _(*args, **kwargs):
+        # The slot is released by the worker thread, so calls abandoned
+        # after the timeout still count towards the limit
+        rejection = bulkhead._acquire()
+        if rejection is not None:
+            return rejection
+        return _call_in_thread(timeout, call, args, kwargs, bulkhead._release)
+
+    return _
+
+
+def _with_policy(call, policy):
+    def _(*args, **kwargs):
+        return policy._invoke(call, *args, **kwargs)
+
+    return _
+
+
+_TEMPLATE = """\
+def _try_wrapper({params}):
+    _try_g = _try_f
+    if _try_tryingsnake._observers:
+        _try_g = _try_tryingsnake._observe("Try", _try_g)
+    try:
+        return {body}
+{unhandled}\
+    except Exception as _try_e:
+        return _try_Failure(_try_e)
+"""
+
+_UNHANDLED_TEMPLATE = """\
+    except {0} as _try_e:
+        raise _try_e
+"""
+
+_DYNAMIC_UNHANDLED = "_try_unhandled_exceptions.get(_try_Try_._unhandled)"
+
+
+def try_(f=None, *, unhandled=None, dynamic=False):
+    """Decorate a function to return Try_ instead of raising exceptions.
+
+    Unlike Try, the wrapper is generated for f when it is decorated,
+    with the same signature as f and a single try / except block.
+    It keeps the name, docstring and annotations of f.
+
+    Unhandled exceptions are fixed when f is decorated,
+    and default to the ones set for the current context
+    (see Try_.set_unhandled and Try_.unhandled).
+    If dynamic is True, they are looked up for each call, as in Try.
+
+    If f is a generator function, the wrapper returns an iterator,
+    which wraps each item with Success and yields the first exception
+    raised by the generator as a Failure (see stream.try_iter).
+
+    :param f: Callable[..., T]
+    :param unhandled: optional iterable of exceptions which are raised
+    :param dynamic: look up unhandled exceptions for each call
+    :return: Callable[..., Try_[T]]
+
+    >>> @try_
+    ... def inv(x: float) -> float:
+    ...     return 1 / x
+    >>> inv(2)
+    Success(0.5)
+    >>> inv(0)  # doctest:+ELLIPSIS
+    Failure(ZeroDivisionError(...))
+    >>> import inspect
+    >>> inspect.signature(inv)
+    <Signature (x: float) -> float>
+    >>> @try_
+    ... def items():
+    ...     yield 1
+    ...     raise ValueError("e")
+    >>> list(items())
+    [Success(1), Failure(ValueError('e'))]
+    """
+    if f is None:
+        return lambda f: try_(f, unhandled=unhandled, dynamic=dynamic)
+    if dynamic:
+        if unhandled is not None:
+            raise ValueError("unhandled cannot be set if dynamic is True")
+        handler = _DYNAMIC_UNHANDLED
+        es = ()
+    else:
+        es = tuple(
+            tryingsnake._unhandled_exceptions.get(tryingsnake.Try_._unhandled)
+            if unhandled is None
+            else unhandled
+        )
+        handler = "_try_unhandled" if es else None
+
+    namespace = {
+        "_try_f": f,
+        "_try_unhandled": es,
+        "_try_tryingsnake": tryingsnake,
+        "_try_Try_": tryingsnake.Try_,
+        "_try_Success": tryingsnake.Success,
+        "_try_Failure": tryingsnake.Failure,
+        "_try_unhandled_exceptions": tryingsnake._unhandled_exceptions,
+        "_try_iter": _try_iter,
+    }
+    params, args, defaults = _parameters(f)
+    namespace.update(defaults)
+    if inspect.isgeneratorfunction(f):
+        body = "_try_iter(_try_g({0}), {1})".format(
+            args, "None" if dynamic else "_try_unhandled"
+        )
+    else:
+        body = "_try_Success(_try_g({0}))".format(args)
+    source = _TEMPLATE.format(
+        params=params,
+        body=body,
+        unhandled=_UNHANDLED_TEMPLATE.format(handler) if handler else "",
+    )
+    exec(source, namespace)
+    return functools.wraps(f)(namespace["_try_wrapper"])
+
+
+def _parameters(f):
+    """Render parameters of f and arguments passing them to f.
+
+    :return: a tuple of parameters, arguments and a dict of defaults
+             referenced by the parameters
+    """
+    try:
+        parameters = inspect.signature(f).parameters.values()
+    except (TypeError, ValueError):
+        parameters = None
+    if parameters is None or any(p.name.startswith("_try_") for p in parameters):
+        return "*_try_args, **_try_kwargs", "*_try_args, **_try_kwargs", {}
+
+    params, args, defaults = [], [], {}
+    star = False
+    for i, p in enumerate(parameters):
+        if params and p.kind != p.POSITIONAL_ONLY and prev_kind == p.POSITIONAL_ONLY:
+            params.append("/")
+        prev_kind = p.kind
+        if p.kind == p.VAR_POSITIONAL:
+            params.append("*" + p.name)
+            args.append("*" + p.name)
+            star = True
+            continue
+        if p.kind == p.VAR_KEYWORD:
+            params.append("**" + p.name)
+            args.append("**" + p.name)
+            continue
+        if p.kind == p.KEYWORD_ONLY:
+            if not star:
+                params.append("*")
+                star = True
+            args.append("{0}={0}".format(p.name))
+        else:
+            args.append(p.name)
+        if p.default is p.empty:
+            params.append(p.name)
+        else:
+            default = "_try_default_{0}".format(i)
+            defaults[default] = p.default
+            params.append("{0}={1}".format(p.name, default))
+    if params and prev_kind == inspect.Parameter.POSITIONAL_ONLY:
+        params.append("/")
+    return ", ".join(params), ", ".join(args), defaults
+
+
+def _try_iter(it, unhandled):
+    if unhandled is None:
+        return try_iter(it)
+    return _try_iter_fixed(it, unhandled)
+
+
+def _try_iter_fixed(it, unhandled):
+    while True:
+        try:
+            v = next(it)
+        except StopIteration:
+            return
+        except unhandled as e:
+            raise e
+        except Exception as e:
+            yield tryingsnake.Failure(e)
+            return
+        yield tryingsnake.Success(v)
@@ -1,6 +1,31 @@
 import tryingsnake
-from typing import Callable, TypeVar
+from tryingsnake.bulkhead import Bulkhead
+from tryingsnake.cache import TryCache
+from tryingsnake.circuit import CircuitBreaker
+from typing import Callable, Iterable, Optional, Type, TypeVar, overload
 
 T = TypeVar("T")
 
-def Try(f: Callable[..., T]) -> Callable[..., tryingsnake.Try_[T]]: ...
+def Try(
+    f: Callable[..., T],
+    *,
+    capture: Optional[str] = ...,
+    timeout: Optional[float] = ...,
+    bulkhead: Optional[Bulkhead] = ...,
+    breaker: Optional[CircuitBreaker] = ...,
+    cache: Optional[TryCache] = ...,
+) -> Callable[..., tryingsnake.Try_[T]]: ...
+@overload
+def try_(
+    f: Callable[..., T],
+    *,
+    unhandled: Optional[Iterable[Type[BaseException]]] = ...,
+    dynamic: bool = ...,
+) -> Callable[..., tryingsnake.Try_[T]]: ...
+@overload
+def try_(
+    f: None = ...,
+    *,
+    unhandled: Optional[Iterable[Type[BaseException]]] = ...,
+    dynamic: bool = ...,
+) -> Callable[[Callable[..., T]], Callable[..., tryingsnake.Try_[T]]]: ...
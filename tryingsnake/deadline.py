@@ -0,0 +1,156 @@
+import asyncio
+import contextvars
+import threading
+import time
+from tryingsnake import Try, Failure
+from tryingsnake.aio import AsyncTry, _evaluate
+
+
+def _timeout_failure(timeout):
+    return Failure(TimeoutError("Deadline of {0:.3f}s exceeded".format(timeout)))
+
+
+def _call_in_thread(timeout, call, args, kwargs, on_exit=None):
+    """Evaluate call(*args, **kwargs) in a daemon thread and wait
+    at most timeout seconds for the outcome.
+
+    call has to return Try_. The thread inherits a copy of the current
+    context and exceptions propagated by call (unhandled exceptions)
+    are re-raised in the calling thread.
+
+    on_exit, if provided, is called once call finishes, also if it
+    finishes after the timeout, or immediately if call is not started.
+    """
+    if timeout <= 0:
+        if on_exit is not None:
+            on_exit()
+        return _timeout_failure(timeout)
+    outcome = []
+    context = contextvars.copy_context()
+
+    def target():
+        try:
+            outcome.append((True, context.run(call, *args, **kwargs)))
+        except BaseException as e:
+            outcome.append((False, e))
+        finally:
+            if on_exit is not None:
+                on_exit()
+
+    thread = threading.Thread(target=target, name="tryingsnake-deadline", daemon=True)
+    try:
+        thread.start()
+    except BaseException:
+        if on_exit is not None:
+            on_exit()
+        raise
+    thread.join(timeout)
+    if not outcome:
+        return _timeout_failure(timeout)
+    ok, v = outcome[0]
+    if not ok:
+        raise v
+    return v
+
+
+async def _wait_for(timeout, f, args, kwargs):
+    if timeout <= 0:
+        return _timeout_failure(timeout)
+    try:
+        return await asyncio.wait_for(_evaluate(f, args, kwargs), timeout)
+    except asyncio.TimeoutError:
+        # Before Python 3.11 asyncio.TimeoutError is not a builtin TimeoutError
+        return _timeout_failure(timeout)
+
+
+class Deadline:
+    """A latency budget shared by a number of calls.
+
+    Sync callables are evaluated in a daemon thread, which is abandoned,
+    not interrupted, once the budget is spent. Coroutines are cancelled.
+
+    :param timeout: budget in seconds, starting now
+    :param clock: monotonic clock returning seconds
+
+    >>> import time
+    >>> d = Deadline(0.05)
+    >>> d.Try(time.sleep, 1)  # doctest:+ELLIPSIS
+    Failure(TimeoutError(...))
+    >>> d.expired
+    True
+    """
+
+    __slots__ = ("expires", "_clock")
+
+    def __init__(self, timeout, clock=time.monotonic):
+        self._clock = clock
+        self.expires = clock() + timeout
+
+    def __repr__(self):
+        return "Deadline(remaining={0:.3f})".format(self.remaining())
+
+    def remaining(self):
+        """Number of seconds left, never negative"""
+        return max(self.expires - self._clock(), 0.0)
+
+    @property
+    def expired(self):
+        return self.remaining() == 0
+
+    def Try(self, f, *args, **kwargs):
+        """Equivalent of Try(f, *args, **kwargs) bounded by this deadline.
+
+        :return: Try_, Failure(TimeoutError) if the deadline has passed
+
+        >>> Deadline(1).Try(divmod, 7, 2)
+        Success((3, 1))
+        """
+        return _call_in_thread(self.remaining(), Try, (f,) + args, kwargs)
+
+    def wrap(self, f):
+        """A curried version of Deadline.Try
+
+        Useful for sharing the deadline across a chain of calls.
+
+        :param f: Callable[..., T]
+        :return: Callable[..., Try_[T]]
+
+        >>> d = Deadline(1)
+        >>> d.Try(abs, -2).flatMap(d.wrap(str))
+        Success('2')
+        """
+
+        def _(*args, **kwargs):
+            return self.Try(f, *args, **kwargs)
+
+        return _
+
+    def AsyncTry(self, f, *args, **kwargs):
+        """Equivalent of AsyncTry(f, *args, **kwargs) bounded by this deadline.
+
+        The budget is checked when the result is awaited for the first time.
+
+        :return: AsyncTry
+
+        >>> async def main():
+        ...     d = Deadline(0.05)
+        ...     return await d.AsyncTry(asyncio.sleep, 1)
+        >>> asyncio.run(main())  # doctest:+ELLIPSIS
+        Failure(TimeoutError(...))
+        """
+        return AsyncTry._from(lambda: _wait_for(self.remaining(), f, args, kwargs))
+
+
+def with_deadline(timeout, f, *args, **kwargs):
+    """Evaluate Try(f, *args, **kwargs) in at most timeout seconds.
+
+    :param timeout: number of seconds
+    :return: Try_, Failure(TimeoutError) if timeout has been exceeded
+
+    >>> import time
+    >>> with_deadline(0.05, time.sleep, 1)  # doctest:+ELLIPSIS
+    Failure(TimeoutError(...))
+    >>> with_deadline(1, divmod, 7, 2)
+    Success((3, 1))
+    """
+    return _call_in_thread(timeout, Try, (f,) + args, kwargs)
@@ -0,0 +1,19 @@
+from typing import Any, Callable, TypeVar
+from tryingsnake import Try_
+from tryingsnake.aio import AsyncTry
+
+T = TypeVar("T")
+
+class Deadline:
+    expires: float
+    def __init__(self, timeout: float, clock: Callable[[], float] = ...) -> None: ...
+    def remaining(self) -> float: ...
+    @property
+    def expired(self) -> bool: ...
+    def Try(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> Try_[T]: ...
+    def wrap(self, f: Callable[..., T]) -> Callable[..., Try_[T]]: ...
+    def AsyncTry(self, f: Any, *args: Any, **kwargs: Any) -> AsyncTry[Any]: ...
+
+def with_deadline(
+    timeout: float, f: Callable[..., T], *args: Any, **kwargs: Any
+) -> Try_[T]: ...
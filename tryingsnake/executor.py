@@ -0,0 +1,186 @@
+import concurrent.futures as cf
+import contextvars
+from itertools import islice
+from tryingsnake import Try_, Try, Failure, _unhandled_exceptions
+
+
+def _call_in_process(f, args, kwargs, unhandled):
+    # Worker processes don't share Try_ state with the parent,
+    # so unhandled exceptions have to be passed explicitly.
+    with Try_.unhandled(*unhandled):
+        return Try(f, *args, **kwargs)
+
+
+def _map_chunk(f, chunk, unhandled=None):
+    if unhandled is None:
+        return [Try(f, *args) for args in chunk]
+    with Try_.unhandled(*unhandled):
+        return [Try(f, *args) for args in chunk]
+
+
+def _current_unhandled():
+    return _unhandled_exceptions.get(Try_._unhandled)
+
+
+def _chunks(it, n):
+    it = iter(it)
+    while True:
+        chunk = list(islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _submitted(future, unhandled):
+    # Remember which exceptions were unhandled when the call was submitted,
+    # so results are consumed with the same policy as the worker used.
+    future._try_unhandled = unhandled  # type: ignore
+    return future
+
+
+def _result(future, size=None):
+    """Get the result of a future submitted by TryExecutor.
+
+    Exceptions unhandled when the call has been submitted are raised,
+    other errors raised by the executor itself (for example
+    if f cannot be pickled) are converted to Failure.
+    """
+    try:
+        return future.result()
+    except future._try_unhandled as e:  # type: ignore
+        raise e
+    except Exception as e:
+        return Failure(e) if size is None else [Failure(e)] * size
+
+
+class TryExecutor:
+    """Wrapper around concurrent.futures.Executor, which returns
+    Try_ objects instead of raising exceptions in Future.result.
+
+    Exceptions which are unhandled when a call is submitted
+    (see Try_.set_unhandled and Try_.unhandled) are propagated
+    as for a Try call in that context, even if results are consumed
+    elsewhere.
+
+    :param executor: concurrent.futures.Executor
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with TryExecutor(ThreadPoolExecutor(2)) as ex:
+    ...     list(ex.map(lambda x: 1 / x, [1, 0]))  # doctest:+ELLIPSIS
+    [Success(1.0), Failure(ZeroDivisionError(...))]
+    """
+
+    _in_process = False
+
+    def __init__(self, executor):
+        self._executor = executor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown(wait=True)
+        return False
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def submit(self, f, *args, **kwargs):
+        """Schedule Try(f, *args, **kwargs)
+
+        :return: concurrent.futures.Future[Try_]
+
+        >>> with ThreadTryExecutor(1) as ex:
+        ...     ex.submit(divmod, 7, 2).result()
+        Success((3, 1))
+        """
+        unhandled = _current_unhandled()
+        if self._in_process:
+            future = self._executor.submit(_call_in_process, f, args, kwargs, unhandled)
+        else:
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, Try, f, *args, **kwargs)
+        return _submitted(future, unhandled)
+
+    def map(self, f, *iterables, chunksize=1, ordered=True):
+        """Equivalent of map(curried.Try(f), *iterables) executed concurrently.
+
+        :param f: function to be applied
+        :param iterables: iterables of arguments
+        :param chunksize: number of calls sent to a worker at once
+        :param ordered: if False results are yielded as soon as they are ready
+        :return: Iterator[Try_]
+
+        >>> with ThreadTryExecutor(2) as ex:
+        ...     sorted(ex.map(abs, [-1, 2, -3], ordered=False), key=lambda t: t.get())
+        [Success(1), Success(2), Success(3)]
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        futures = [
+            (self._submit_chunk(f, chunk), len(chunk))
+            for chunk in _chunks(zip(*iterables), chunksize)
+        ]
+        return self._iter_chunks(futures, ordered)
+
+    def _submit_chunk(self, f, chunk):
+        unhandled = _current_unhandled()
+        if self._in_process:
+            future = self._executor.submit(_map_chunk, f, chunk, unhandled)
+        else:
+            # A context cannot be entered by two threads at once, so each chunk
+            # gets its own copy.
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, _map_chunk, f, chunk)
+        return _submitted(future, unhandled)
+
+    @staticmethod
+    def _iter_chunks(futures, ordered):
+        if not ordered:
+            sizes = dict(futures)
+            futures = ((future, sizes[future]) for future in cf.as_completed(sizes))
+        for future, size in futures:
+            yield from _result(future, size)
+
+    @staticmethod
+    def as_completed(fs, timeout=None):
+        """Yield results of futures created by submit as they complete.
+
+        :param fs: futures created by TryExecutor.submit
+        :param timeout: maximum number of seconds to wait
+        :return: Iterator[Try_]
+
+        >>> with ThreadTryExecutor(2) as ex:
+        ...     fs = [ex.submit(int, x) for x in ["1", "1"]]
+        ...     list(TryExecutor.as_completed(fs))
+        [Success(1), Success(1)]
+        """
+        for future in cf.as_completed(fs, timeout=timeout):
+            yield _result(future)
+
+
+class ThreadTryExecutor(TryExecutor):
+    """TryExecutor backed by concurrent.futures.ThreadPoolExecutor
+
+    :param max_workers: maximum number of threads
+    :param kwargs: passed to ThreadPoolExecutor
+    """
+
+    def __init__(self, max_workers=None, **kwargs):
+        super().__init__(cf.ThreadPoolExecutor(max_workers, **kwargs))
+
+
+class ProcessTryExecutor(TryExecutor):
+    """TryExecutor backed by concurrent.futures.ProcessPoolExecutor
+
+    Functions, arguments and results have to be picklable.
+    Use chunksize in map to amortize inter-process communication costs.
+
+    :param max_workers: maximum number of processes
+    :param kwargs: passed to ProcessPoolExecutor
+    """
+
+    _in_process = True
+
+    def __init__(self, max_workers=None, **kwargs):
+        super().__init__(cf.ProcessPoolExecutor(max_workers, **kwargs))
@@ -0,0 +1,31 @@
+import concurrent.futures as cf
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+from tryingsnake import Try_
+
+T = TypeVar("T")
+
+class TryExecutor:
+    def __init__(self, executor: cf.Executor) -> None: ...
+    def __enter__(self) -> TryExecutor: ...
+    def __exit__(self, *exc_info: Any) -> bool: ...
+    def shutdown(self, wait: bool = ...) -> None: ...
+    def submit(
+        self, f: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> cf.Future[Try_[T]]: ...
+    def map(
+        self,
+        f: Callable[..., T],
+        *iterables: Iterable[Any],
+        chunksize: int = ...,
+        ordered: bool = ...,
+    ) -> Iterator[Try_[T]]: ...
+    @staticmethod
+    def as_completed(
+        fs: Iterable[cf.Future[Try_[T]]], timeout: Optional[float] = ...
+    ) -> Iterator[Try_[T]]: ...
+
+class ThreadTryExecutor(TryExecutor):
+    def __init__(self, max_workers: Optional[int] = ..., **kwargs: Any) -> None: ...
+
+class ProcessTryExecutor(TryExecutor):
+    def __init__(self, max_workers: Optional[int] = ..., **kwargs: Any) -> None: ...
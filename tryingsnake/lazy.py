@@ -0,0 +1,160 @@
+import threading
+from tryingsnake import Try_, Try, Failure
+
+_PENDING = object()
+
+
+class LazyTry:
+    """Try evaluated on the first access.
+
+    The outcome is memoized, and f is called at most once,
+    even if LazyTry is accessed from many threads at the same time.
+    Unhandled exceptions (see Try_.set_unhandled) are raised on access
+    and are not memoized. If f forces its own LazyTry, the inner access
+    gets Failure(RuntimeError) instead of deadlocking.
+
+    LazyTry provides the same methods as Try_. Combinators return
+    a new LazyTry, so whole chains can be deferred, and functions passed
+    to flatMap, recoverWith and orElseLazy can return either Try_ or LazyTry.
+
+    :param f: Callable[..., T]
+    :param args: args which should be passed to f
+    :param kwargs: kwargs which should be passed to f
+
+    >>> calls = []
+    >>> def lookup(key):
+    ...     calls.append(key)
+    ...     return {"a": 1}[key]
+    >>> t = LazyTry(lookup, "a").map(str)
+    >>> calls
+    []
+    >>> t.get(), t.get()
+    ('1', '1')
+    >>> calls
+    ['a']
+    """
+
+    __slots__ = ("_thunk", "_result", "_lock", "_forcing")
+
+    def __init__(self, f, *args, **kwargs):
+        self._thunk = lambda: Try(f, *args, **kwargs)
+        self._result = _PENDING
+        self._lock = threading.RLock()
+        self._forcing = False
+
+    @staticmethod
+    def _defer(thunk):
+        t = LazyTry.__new__(LazyTry)
+        t._thunk = thunk
+        t._result = _PENDING
+        t._lock = threading.RLock()
+        t._forcing = False
+        return t
+
+    def __repr__(self):
+        result = self._result
+        return "LazyTry({0})".format(
+            "<pending>" if result is _PENDING else repr(result)
+        )
+
+    @property
+    def evaluated(self):
+        """Check if the outcome has been already computed."""
+        return self._result is not _PENDING
+
+    def force(self):
+        """Evaluate if necessary and return the outcome.
+
+        :return: Try_
+
+        >>> LazyTry(int, "a").force()  # doctest:+ELLIPSIS
+        Failure(ValueError(...))
+        """
+        result = self._result
+        if result is _PENDING:
+            with self._lock:
+                result = self._result
+                if result is _PENDING:
+                    # Only the evaluating thread can get past the lock here
+                    if self._forcing:
+                        return Failure(RuntimeError("recursive force"))
+                    self._forcing = True
+                    try:
+                        result = Try_._identity_if_try_or_raise(
+                            self._thunk(), "Invalid type for result: {0}"
+                        )
+                    finally:
+                        self._forcing = False
+                    self._result = result
+                    # Release arguments and closures
+                    self._thunk = None
+        return result
+
+    def __bool__(self):
+        return bool(self.force())
+
+    def __eq__(self, other):
+        if isinstance(other, LazyTry):
+            other = other.force()
+        return self.force() == other
+
+    def __hash__(self):
+        return hash(self.force())
+
+    @property
+    def isSuccess(self):
+        return self.force().isSuccess
+
+    @property
+    def isFailure(self):
+        return self.force().isFailure
+
+    def get(self):
+        return self.force().get()
+
+    def getOrElse(self, default):
+        return self.force().getOrElse(default)
+
+    def getOrElseLazy(self, f):
+        return self.force().getOrElseLazy(f)
+
+    def orElse(self, default):
+        """Same as Try_.orElse, evaluated eagerly.
+
+        Forces this LazyTry and returns Try_, see orElseLazy
+        for a deferred fallback.
+
+        :return: Try_
+        """
+        return self.force().orElse(default)
+
+    def orElseLazy(self, f):
+        """Lazy equivalent of Try_.orElseLazy.
+
+        f may return Try_ or LazyTry.
+
+        :return: LazyTry
+        """
+        return LazyTry._defer(lambda: self.force().orElseLazy(lambda: _force(f())))
+
+    def map(self, f):
+        return LazyTry._defer(lambda: self.force().map(f))
+
+    def flatMap(self, f):
+        return LazyTry._defer(lambda: self.force().flatMap(lambda v: _force(f(v))))
+
+    def filter(self, f, exception_cls=Exception, msg=None):
+        return LazyTry._defer(lambda: self.force().filter(f, exception_cls, msg))
+
+    def recover(self, f):
+        return LazyTry._defer(lambda: self.force().recover(f))
+
+    def recoverWith(self, f):
+        return LazyTry._defer(lambda: self.force().recoverWith(lambda e: _force(f(e))))
+
+    def failed(self):
+        return LazyTry._defer(lambda: self.force().failed())
+
+
+def _force(t):
+    return t.force() if isinstance(t, LazyTry) else t
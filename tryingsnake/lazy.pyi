@@ -0,0 +1,36 @@
+from typing import Any, Callable, Generic, Optional, Type, TypeVar, Union
+from tryingsnake import Try_
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+class LazyTry(Generic[T]):
+    def __init__(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> None: ...
+    @property
+    def evaluated(self) -> bool: ...
+    def force(self) -> Try_[T]: ...
+    def __bool__(self) -> bool: ...
+    def __eq__(self, other: Any) -> bool: ...
+    def __hash__(self) -> int: ...
+    @property
+    def isSuccess(self) -> bool: ...
+    @property
+    def isFailure(self) -> bool: ...
+    def get(self) -> T: ...
+    def getOrElse(self, default: T) -> T: ...
+    def getOrElseLazy(self, f: Callable[[], T]) -> T: ...
+    def orElse(self, default: Try_[T]) -> Try_[T]: ...
+    def orElseLazy(self, f: Callable[[], Union[Try_[T], LazyTry[T]]]) -> LazyTry[T]: ...
+    def map(self, f: Callable[[T], U]) -> LazyTry[U]: ...
+    def flatMap(self, f: Callable[[T], Union[Try_[U], LazyTry[U]]]) -> LazyTry[U]: ...
+    def filter(
+        self,
+        f: Callable[[T], bool],
+        exception_cls: Type[Exception] = ...,
+        msg: Optional[str] = ...,
+    ) -> LazyTry[T]: ...
+    def recover(self, f: Callable[[Exception], T]) -> LazyTry[T]: ...
+    def recoverWith(
+        self, f: Callable[[Exception], Union[Try_[T], LazyTry[T]]]
+    ) -> LazyTry[T]: ...
+    def failed(self) -> LazyTry[Exception]: ...
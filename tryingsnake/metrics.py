@@ -0,0 +1,324 @@
+from bisect import bisect_left
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tryingsnake
+from tryingsnake import Try_
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Stages where f returns Try_ and a returned Failure is a failure of the call
+_FLAT_STAGES = ("flatMap", "recoverWith")
+
+
+def _qualified_name(obj):
+    # Name functions wrapped by other observers
+    while isinstance(obj, tryingsnake._Observed):
+        obj = obj._f
+    name = getattr(obj, "__qualname__", None) or type(obj).__qualname__
+    module = getattr(obj, "__module__", None)
+    if module is None or module == "builtins":
+        return name
+    return "{0}.{1}".format(module, name)
+
+
+def _is_internal(frame):
+    name = frame.f_globals.get("__name__", "")
+    return name == "tryingsnake" or (
+        name.startswith("tryingsnake.") and not name.startswith("tryingsnake.test")
+    )
+
+
+def _call_site():
+    """Location of the first frame outside of tryingsnake"""
+    frame = sys._getframe(1)
+    while frame is not None and _is_internal(frame):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    return "{0}:{1}".format(frame.f_code.co_filename, frame.f_lineno)
+
+
+class _Series:
+    __slots__ = ("successes", "failures", "exceptions", "counts", "total")
+
+    def __init__(self, buckets):
+        self.successes = 0
+        self.failures = 0
+        self.exceptions = {}
+        self.counts = None if buckets is None else [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+
+class _Probe(tryingsnake._Observed):
+    __slots__ = ("_registry", "_f", "_key", "_flat")
+
+    def __init__(self, registry, f, key):
+        self._registry = registry
+        self._f = f
+        self._key = key
+        self._flat = key[0] in _FLAT_STAGES
+
+    def __repr__(self):
+        return repr(self._f)
+
+    def __call__(self, *args, **kwargs):
+        registry = self._registry
+        start = time.perf_counter() if registry.buckets is not None else None
+        try:
+            v = self._f(*args, **kwargs)
+        except BaseException as e:
+            registry._record(self._key, type(e), start)
+            raise
+        if self._flat and isinstance(v, Try_) and v.isFailure:
+            registry._record(self._key, type(v._v), start)
+        else:
+            registry._record(self._key, None, start)
+        return v
+
+
+class MetricsRegistry:
+    """In-process registry of Try outcomes.
+
+    Once enabled, Try, the combinators of Success and Failure
+    and curried.Try record a success or a failure for each evaluated
+    function, labelled with the stage ("Try", "map", "flatMap", "filter",
+    "recover", "recoverWith") and the qualified name of the function.
+    Failures are broken down by exception type. For flatMap and recoverWith
+    a returned Failure counts as a failure.
+
+    The instrumentation is process wide. While no registry is enabled
+    Try pays only for a single check of a module global.
+
+    :param sample: fraction of calls (0 - 1] which are recorded,
+                   counts are not scaled
+    :param buckets: optional upper bounds (in seconds) of latency
+                    histogram buckets, latencies are not measured if None
+    :param call_sites: if True calls are also labelled with the location
+                       (file:line) of the calling code
+    :param random: function returning floats from [0, 1) used for sampling
+
+    >>> from tryingsnake import Try
+    >>> registry = MetricsRegistry()
+    >>> with registry:
+    ...     _ = Try(int, "1").map(abs).flatMap(lambda x: Try(int, "a"))
+    >>> [(s["stage"], s["function"], s["successes"], s["failures"])
+    ...  for s in registry.snapshot()["series"]]  # doctest:+NORMALIZE_WHITESPACE
+    [('Try', 'int', 1, 1), ('flatMap', 'tryingsnake.metrics.<lambda>', 0, 1),
+     ('map', 'abs', 1, 0)]
+    """
+
+    def __init__(
+        self, sample=1.0, buckets=None, call_sites=False, random=random.random
+    ):
+        if not 0 < sample <= 1:
+            raise ValueError("sample must be in (0, 1]")
+        self.sample = sample
+        self.buckets = None if buckets is None else tuple(sorted(buckets))
+        self.call_sites = call_sites
+        self._random = random
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def __call__(self, stage, f):
+        if self.sample < 1 and self._random() >= self.sample:
+            return f
+        site = _call_site() if self.call_sites else None
+        return _Probe(self, f, (stage, _qualified_name(f), site))
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, *exc_info):
+        self.disable()
+        return False
+
+    def enable(self):
+        """Start recording Try outcomes
+
+        :return: self
+        """
+        tryingsnake._add_observer(self)
+        return self
+
+    def disable(self):
+        """Stop recording Try outcomes, recorded values are kept"""
+        tryingsnake._remove_observer(self)
+
+    def reset(self):
+        """Drop all recorded values"""
+        with self._lock:
+            self._series.clear()
+
+    def _record(self, key, exception_cls, start):
+        elapsed = None if start is None else time.perf_counter() - start
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self.buckets)
+            if exception_cls is None:
+                series.successes += 1
+            else:
+                series.failures += 1
+                name = _qualified_name(exception_cls)
+                series.exceptions[name] = series.exceptions.get(name, 0) + 1
+            if elapsed is not None:
+                series.counts[bisect_left(self.buckets, elapsed)] += 1
+                series.total += elapsed
+
+    def snapshot(self):
+        """Recorded values as a JSON compatible dict
+
+        :return: dict
+        """
+        with self._lock:
+            items = sorted(
+                self._series.items(), key=lambda item: tuple(map(str, item[0]))
+            )
+            series = []
+            for (stage, function, site), s in items:
+                entry = {
+                    "stage": stage,
+                    "function": function,
+                    "successes": s.successes,
+                    "failures": s.failures,
+                    "exceptions": dict(sorted(s.exceptions.items())),
+                }
+                if site is not None:
+                    entry["site"] = site
+                if s.counts is not None:
+                    entry["latency"] = {
+                        "buckets": list(self.buckets),
+                        "counts": list(s.counts),
+                        "sum": s.total,
+                    }
+                series.append(entry)
+        return {"sample": self.sample, "series": series}
+
+    def to_json(self, indent=None):
+        """Recorded values as a JSON document
+
+        :return: str
+        """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self):
+        """Recorded values in the Prometheus text exposition format
+
+        :return: str
+
+        >>> from tryingsnake import Try
+        >>> registry = MetricsRegistry()
+        >>> with registry:
+        ...     _ = Try(int, "a")
+        >>> print(registry.to_prometheus(), end="")
+        # HELP tryingsnake_sample_rate Fraction of recorded calls.
+        # TYPE tryingsnake_sample_rate gauge
+        tryingsnake_sample_rate 1.0
+        # HELP tryingsnake_calls_total Number of recorded calls.
+        # TYPE tryingsnake_calls_total counter
+        tryingsnake_calls_total{stage="Try",function="int",outcome="success"} 0
+        tryingsnake_calls_total{stage="Try",function="int",outcome="failure"} 1
+        # HELP tryingsnake_failures_total Number of recorded failures by exception type.
+        # TYPE tryingsnake_failures_total counter
+        tryingsnake_failures_total{stage="Try",function="int",exception="ValueError"} 1
+        """
+        series = self.snapshot()["series"]
+        lines = [
+            "# HELP tryingsnake_sample_rate Fraction of recorded calls.",
+            "# TYPE tryingsnake_sample_rate gauge",
+            "tryingsnake_sample_rate {0}".format(float(self.sample)),
+            "# HELP tryingsnake_calls_total Number of recorded calls.",
+            "# TYPE tryingsnake_calls_total counter",
+        ]
+        for s in series:
+            for outcome, n in (("success", s["successes"]), ("failure", s["failures"])):
+                lines.append(
+                    "tryingsnake_calls_total{{{0}}} {1}".format(
+                        _labels(s, outcome=outcome), n
+                    )
+                )
+        lines += [
+            "# HELP tryingsnake_failures_total "
+            "Number of recorded failures by exception type.",
+            "# TYPE tryingsnake_failures_total counter",
+        ]
+        for s in series:
+            for exception, n in s["exceptions"].items():
+                lines.append(
+                    "tryingsnake_failures_total{{{0}}} {1}".format(
+                        _labels(s, exception=exception), n
+                    )
+                )
+        if self.buckets is not None:
+            lines += [
+                "# HELP tryingsnake_call_duration_seconds Latency of recorded calls.",
+                "# TYPE tryingsnake_call_duration_seconds histogram",
+            ]
+            for s in series:
+                latency = s["latency"]
+                cumulative = 0
+                bounds = [repr(float(b)) for b in latency["buckets"]] + ["+Inf"]
+                for bound, n in zip(bounds, latency["counts"]):
+                    cumulative += n
+                    lines.append(
+                        "tryingsnake_call_duration_seconds_bucket{{{0}}} {1}".format(
+                            _labels(s, le=bound), cumulative
+                        )
+                    )
+                lines.append(
+                    "tryingsnake_call_duration_seconds_sum{{{0}}} {1!r}".format(
+                        _labels(s), latency["sum"]
+                    )
+                )
+                lines.append(
+                    "tryingsnake_call_duration_seconds_count{{{0}}} {1}".format(
+                        _labels(s), cumulative
+                    )
+                )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, format="prometheus"):
+        """Write recorded values to a file.
+
+        The file is replaced atomically, so it can be read
+        for example by the node exporter textfile collector.
+
+        :param path: destination path
+        :param format: "prometheus" or "json"
+        """
+        if format == "prometheus":
+            content = self.to_prometheus()
+        elif format == "json":
+            content = self.to_json(indent=2)
+        else:
+            raise ValueError("Unknown format {0!r}".format(format))
+        _write_atomic(path, content)
+
+
+def _write_atomic(path, content):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tryingsnake-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(series, **extra):
+    labels = [("stage", series["stage"]), ("function", series["function"])]
+    if "site" in series:
+        labels.append(("site", series["site"]))
+    labels.extend(extra.items())
+    return ",".join('{0}="{1}"'.format(k, _escape(v)) for k, v in labels)
@@ -0,0 +1,27 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_BUCKETS: Tuple[float, ...]
+
+class MetricsRegistry:
+    sample: float
+    buckets: Optional[Tuple[float, ...]]
+    call_sites: bool
+    def __init__(
+        self,
+        sample: float = ...,
+        buckets: Optional[Iterable[float]] = ...,
+        call_sites: bool = ...,
+        random: Callable[[], float] = ...,
+    ) -> None: ...
+    def __call__(self, stage: str, f: Callable[..., T]) -> Callable[..., T]: ...
+    def __enter__(self) -> MetricsRegistry: ...
+    def __exit__(self, *exc_info: Any) -> bool: ...
+    def enable(self) -> MetricsRegistry: ...
+    def disable(self) -> None: ...
+    def reset(self) -> None: ...
+    def snapshot(self) -> Dict[str, Any]: ...
+    def to_json(self, indent: Optional[int] = ...) -> str: ...
+    def to_prometheus(self) -> str: ...
+    def write(self, path: str, format: str = ...) -> None: ...
@@ -0,0 +1,147 @@
+from tryingsnake import Try_, Success, Failure, _unhandled_exceptions
+
+_MAP, _FLATMAP, _FILTER, _RECOVER, _RECOVER_WITH = range(5)
+
+
+class TryPipeline:
+    """A reusable chain of Try_ combinators evaluated in a single pass.
+
+    Stages are recorded, not executed, and applying the pipeline
+    runs all of them in one loop with a single exception handler,
+    allocating only the final Success or Failure.
+
+    Results are the same as for the equivalent chain of eager calls.
+
+    >>> inc = lambda x: x + 1
+    >>> inv = lambda x: 1 / x
+    >>> p = TryPipeline().map(inc).map(inv).recover(lambda e: 0.0)
+    >>> p(1)
+    Success(0.5)
+    >>> p(-1)
+    Success(0.0)
+    >>> p.apply(Failure(Exception("e")))
+    Success(0.0)
+    """
+
+    __slots__ = ("_stages",)
+
+    def __init__(self, stages=()):
+        self._stages = tuple(stages)
+
+    def _append(self, kind, f, exception_cls=None, msg=None):
+        return TryPipeline(self._stages + ((kind, f, exception_cls, msg),))
+
+    def __len__(self):
+        return len(self._stages)
+
+    def __repr__(self):
+        names = ("map", "flatMap", "filter", "recover", "recoverWith")
+        return "TryPipeline({0})".format(
+            ", ".join("{0}({1!r})".format(names[k], f) for k, f, _, _ in self._stages)
+        )
+
+    def map(self, f):
+        """Add Try_.map stage.
+
+        >>> TryPipeline().map(str)(1)
+        Success('1')
+        """
+        return self._append(_MAP, f)
+
+    def flatMap(self, f):
+        """Add Try_.flatMap stage.
+
+        >>> from tryingsnake import Try
+        >>> TryPipeline().flatMap(lambda x: Try(divmod, x, 0))(1)  # doctest:+ELLIPSIS
+        Failure(ZeroDivisionError(...))
+        """
+        return self._append(_FLATMAP, f)
+
+    def filter(self, f, exception_cls=Exception, msg=None):
+        """Add Try_.filter stage.
+
+        >>> TryPipeline().filter(lambda x: x > 0, ValueError, "negative")(-1)
+        Failure(ValueError('negative'))
+        """
+        return self._append(_FILTER, f, exception_cls, msg)
+
+    def recover(self, f):
+        """Add Try_.recover stage.
+
+        >>> TryPipeline().map(int).recover(lambda e: -1)("a")
+        Success(-1)
+        """
+        return self._append(_RECOVER, f)
+
+    def recoverWith(self, f):
+        """Add Try_.recoverWith stage.
+
+        >>> TryPipeline().map(int).recoverWith(lambda e: Success(-1))("a")
+        Success(-1)
+        """
+        return self._append(_RECOVER_WITH, f)
+
+    def __call__(self, v):
+        """Apply this pipeline to Success(v).
+
+        :param v: input value
+        :return: Either Success or Failure
+        """
+        return self._run(True, v)
+
+    def apply(self, t):
+        """Apply this pipeline to an existing Try_.
+
+        :param t: Try_
+        :return: Either Success or Failure
+        """
+        t = Try_._identity_if_try_or_raise(t, "Invalid type for t: {0}")
+        return self._run(t.isSuccess, t._v)
+
+    def _run(self, ok, v):
+        stages = self._stages
+        n = len(stages)
+        i = 0
+        # Errors which escape eager combinators (failing filter predicates,
+        # continuations not returning Try_) have to escape here as well.
+        escape = False
+        while i < n:
+            try:
+                while i < n:
+                    kind, f, exception_cls, msg = stages[i]
+                    i += 1
+                    if ok:
+                        if kind == _MAP:
+                            v = f(v)
+                        elif kind == _FLATMAP:
+                            r = f(v)
+                            if not isinstance(r, Try_):
+                                escape = True
+                                raise TypeError(
+                                    "Invalid return type for f: {0}".format(type(r))
+                                )
+                            ok, v = r.isSuccess, r._v
+                        elif kind == _FILTER:
+                            escape = True
+                            keep = f(v)
+                            escape = False
+                            if not keep:
+                                ok, v = False, exception_cls(msg if msg else repr(f))
+                    elif kind == _RECOVER:
+                        ok, v = True, f(v)
+                    elif kind == _RECOVER_WITH:
+                        r = f(v)
+                        if not isinstance(r, Try_):
+                            escape = True
+                            raise TypeError(
+                                "Invalid return type for f: {0}".format(type(r))
+                            )
+                        ok, v = r.isSuccess, r._v
+            except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+                raise e
+            except Exception as e:
+                if escape:
+                    raise
+                ok, v = False, e
+
+        return Success(v) if ok else Failure(v)
@@ -0,0 +1,22 @@
+from typing import Any, Callable, Generic, Iterable, Optional, Tuple, Type, TypeVar
+from tryingsnake import Try_
+
+T = TypeVar("T")
+U = TypeVar("U")
+V = TypeVar("V")
+
+class TryPipeline(Generic[T, U]):
+    def __init__(self, stages: Iterable[Tuple[Any, ...]] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def map(self, f: Callable[[U], V]) -> TryPipeline[T, V]: ...
+    def flatMap(self, f: Callable[[U], Try_[V]]) -> TryPipeline[T, V]: ...
+    def filter(
+        self,
+        f: Callable[[U], bool],
+        exception_cls: Type[Exception] = ...,
+        msg: Optional[str] = ...,
+    ) -> TryPipeline[T, U]: ...
+    def recover(self, f: Callable[[Exception], U]) -> TryPipeline[T, U]: ...
+    def recoverWith(self, f: Callable[[Exception], Try_[U]]) -> TryPipeline[T, U]: ...
+    def __call__(self, v: T) -> Try_[U]: ...
+    def apply(self, t: Try_[T]) -> Try_[U]: ...
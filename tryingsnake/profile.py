@@ -0,0 +1,186 @@
+import threading
+import time
+import tryingsnake
+from tryingsnake import Try_
+from tryingsnake.metrics import _FLAT_STAGES, _qualified_name, _write_atomic
+
+
+class _Stats:
+    __slots__ = ("calls", "failures", "time")
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.time = 0
+
+
+class _Probe(tryingsnake._Observed):
+    __slots__ = ("_profiler", "_f", "_frame", "_flat")
+
+    def __init__(self, profiler, f, frame):
+        self._profiler = profiler
+        self._f = f
+        self._frame = frame
+        self._flat = frame[0] in _FLAT_STAGES
+
+    def __repr__(self):
+        return repr(self._f)
+
+    def __call__(self, *args, **kwargs):
+        profiler = self._profiler
+        local = profiler._local
+        stack = getattr(local, "stack", None)
+        if stack is None:
+            stack = local.stack = []
+        path = (stack[-1][0] if stack else ()) + (self._frame,)
+        # [path, time spent in nested observed calls]
+        entry = [path, 0]
+        stack.append(entry)
+        failed = True
+        start = time.perf_counter_ns()
+        try:
+            v = self._f(*args, **kwargs)
+            failed = self._flat and isinstance(v, Try_) and v.isFailure
+            return v
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+            profiler._record(path, elapsed, elapsed - entry[1], failed)
+
+
+class Profiler:
+    """Per-stage profiler of Try chains.
+
+    Once enabled, each function evaluated by Try, the combinators
+    of Success and Failure and curried.Try is timed. Results are
+    aggregated by the stage ("Try", "map", "flatMap", "filter", "recover",
+    "recoverWith") and the qualified name of the function. For flatMap
+    and recoverWith a returned Failure counts as a failure.
+
+    Nested calls, like Try inside a function passed to flatMap,
+    are tracked per thread, so the results can be exported as collapsed
+    stacks.
+
+    The instrumentation is process wide. While no profiler is enabled
+    Try pays only for a single check of a module global.
+
+    >>> from tryingsnake import Try
+    >>> profiler = Profiler()
+    >>> with profiler:
+    ...     for _ in range(3):
+    ...         _ = Try(int, "1").map(abs).flatMap(lambda x: Try(int, "a"))
+    >>> [(s["stage"], s["function"], s["calls"], s["failures"])
+    ...  for s in sorted(profiler.stats(), key=lambda s: s["stage"])]
+    ... # doctest:+NORMALIZE_WHITESPACE
+    [('Try', 'int', 6, 3), ('flatMap', 'tryingsnake.profile.<lambda>', 3, 3),
+     ('map', 'abs', 3, 0)]
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stages = {}
+        self._stacks = {}
+
+    def __call__(self, stage, f):
+        return _Probe(self, f, (stage, _qualified_name(f)))
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, *exc_info):
+        self.disable()
+        return False
+
+    def enable(self):
+        """Start profiling
+
+        :return: self
+        """
+        tryingsnake._add_observer(self)
+        return self
+
+    def disable(self):
+        """Stop profiling, recorded values are kept"""
+        tryingsnake._remove_observer(self)
+
+    def reset(self):
+        """Drop all recorded values"""
+        with self._lock:
+            self._stages.clear()
+            self._stacks.clear()
+
+    def _record(self, path, elapsed, self_time, failed):
+        with self._lock:
+            stats = self._stages.get(path[-1])
+            if stats is None:
+                stats = self._stages[path[-1]] = _Stats()
+            stats.calls += 1
+            stats.time += elapsed
+            if failed:
+                stats.failures += 1
+            self._stacks[path] = self._stacks.get(path, 0) + self_time
+
+    def stats(self):
+        """Recorded values per stage, slowest first.
+
+        Time (in seconds) includes nested calls.
+
+        :return: a list of dicts with "stage", "function", "calls",
+                 "failures" and "time" keys
+        """
+        with self._lock:
+            items = list(self._stages.items())
+        stats = [
+            {
+                "stage": stage,
+                "function": function,
+                "calls": s.calls,
+                "failures": s.failures,
+                "time": s.time / 1e9,
+            }
+            for (stage, function), s in items
+        ]
+        stats.sort(key=lambda s: (-s["time"], s["stage"], s["function"]))
+        return stats
+
+    def to_collapsed(self):
+        """Recorded values as collapsed stacks.
+
+        Each line contains semicolon separated frames,
+        formatted as stage:function, followed by time
+        spent in the last frame in nanoseconds. The output
+        can be passed directly to flamegraph.pl or speedscope.
+
+        :return: str
+
+        >>> from tryingsnake import Try
+        >>> with Profiler() as profiler:
+        ...     _ = Try(int, "1").flatMap(lambda x: Try(int, "a"))
+        >>> for line in profiler.to_collapsed().splitlines():
+        ...     print(line.rsplit(" ", 1)[0])
+        Try:int
+        flatMap:tryingsnake.profile.<lambda>
+        flatMap:tryingsnake.profile.<lambda>;Try:int
+        """
+        with self._lock:
+            items = sorted(self._stacks.items())
+        return "".join(
+            "{0} {1}\n".format(
+                ";".join(
+                    "{0}:{1}".format(stage, function.replace(";", ":"))
+                    for stage, function in path
+                ),
+                max(self_time, 0),
+            )
+            for path, self_time in items
+        )
+
+    def write(self, path):
+        """Write collapsed stacks to a file.
+
+        :param path: destination path
+        """
+        _write_atomic(path, self.to_collapsed())
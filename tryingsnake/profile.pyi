@@ -0,0 +1,15 @@
+from typing import Any, Callable, Dict, List, TypeVar
+
+T = TypeVar("T")
+
+class Profiler:
+    def __init__(self) -> None: ...
+    def __call__(self, stage: str, f: Callable[..., T]) -> Callable[..., T]: ...
+    def __enter__(self) -> Profiler: ...
+    def __exit__(self, *exc_info: Any) -> bool: ...
+    def enable(self) -> Profiler: ...
+    def disable(self) -> None: ...
+    def reset(self) -> None: ...
+    def stats(self) -> List[Dict[str, Any]]: ...
+    def to_collapsed(self) -> str: ...
+    def write(self, path: str) -> None: ...
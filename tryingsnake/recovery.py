@@ -0,0 +1,116 @@
+from tryingsnake import Try_, Success
+
+
+class RecoveryTable:
+    """Mapping from exception types to handlers.
+
+    The handler for an exception is the one registered for the nearest
+    class in the MRO of its type, as for a chain of except clauses
+    ordered from the most specific class. Resolution is cached per type,
+    so dispatch doesn't depend on the number of handlers.
+
+    :param handlers: a dict mapping an exception class or a tuple
+                     of exception classes to a function
+
+    >>> table = RecoveryTable({
+    ...     KeyError: lambda e: "missing",
+    ...     (OSError, TimeoutError): lambda e: "io",
+    ...     Exception: lambda e: "other",
+    ... })
+    >>> from tryingsnake import Try
+    >>> Try(lambda: {}["a"]).recoverBy(table)
+    Success('missing')
+    >>> Try(open, "/nonexistent").recoverBy(table)
+    Success('io')
+    >>> Try(int, "a").recoverBy(table)
+    Success('other')
+    """
+
+    __slots__ = ("_handlers", "_cache")
+
+    def __init__(self, handlers):
+        self._handlers = {}
+        for key, f in dict(handlers).items():
+            for cls in key if isinstance(key, tuple) else (key,):
+                if not (isinstance(cls, type) and issubclass(cls, BaseException)):
+                    raise TypeError("Invalid exception class: {0!r}".format(cls))
+                if cls in self._handlers:
+                    raise ValueError("Duplicate handler for {0!r}".format(cls))
+                self._handlers[cls] = f
+        self._cache = {}
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def __repr__(self):
+        return "RecoveryTable({0!r})".format(self._handlers)
+
+    def resolve(self, cls):
+        """Find the handler for an exception type.
+
+        :param cls: exception type
+        :return: handler or None if there is no matching handler
+
+        >>> table = RecoveryTable({LookupError: repr})
+        >>> table.resolve(KeyError)
+        <built-in function repr>
+        >>> table.resolve(ValueError) is None
+        True
+        """
+        try:
+            return self._cache[cls]
+        except KeyError:
+            pass
+        handlers = self._handlers
+        f = next((handlers[c] for c in cls.__mro__ if c in handlers), None)
+        self._cache[cls] = f
+        return f
+
+    def recover(self, t):
+        """Same as t.recoverBy(self).
+
+        :param t: Try_
+        :return: Try_
+        """
+        return t.recoverBy(self)
+
+    def route(self, ts, on_success=None, on_unmatched=None):
+        """Dispatch a stream of Try_ to sinks in a single pass.
+
+        The exception of each Failure is passed to its handler,
+        or to on_unmatched if there is none. Values of each Success
+        are passed to on_success. Results of the sinks are ignored.
+
+        :param ts: an iterable of Try_
+        :param on_success: optional function called with values of Success
+        :param on_unmatched: optional function called with exceptions
+                             without handler
+        :return: number of unmatched failures
+
+        >>> from tryingsnake import Failure
+        >>> missing, values = [], []
+        >>> table = RecoveryTable({KeyError: missing.append})
+        >>> table.route(
+        ...     [Success(1), Failure(KeyError("a")), Failure(ValueError("b"))],
+        ...     on_success=values.append,
+        ... )
+        1
+        >>> missing, values
+        ([KeyError('a')], [1])
+        """
+        resolve = self.resolve
+        unmatched = 0
+        for t in ts:
+            if isinstance(t, Success):
+                if on_success is not None:
+                    on_success(t._v)
+                continue
+            Try_._identity_if_try_or_raise(t, "Invalid type for element: {0}")
+            e = t._v
+            f = resolve(type(e))
+            if f is None:
+                unmatched += 1
+                f = on_unmatched
+            if f is not None:
+                f(e)
+        return unmatched
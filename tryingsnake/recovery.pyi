@@ -0,0 +1,16 @@
+from typing import Any, Callable, Iterable, Mapping, Optional, Tuple, Type, Union
+from tryingsnake import Try_
+
+_Key = Union[Type[BaseException], Tuple[Type[BaseException], ...]]
+
+class RecoveryTable:
+    def __init__(self, handlers: Mapping[_Key, Callable[[Any], Any]]) -> None: ...
+    def __len__(self) -> int: ...
+    def resolve(self, cls: Type[BaseException]) -> Optional[Callable[[Any], Any]]: ...
+    def recover(self, t: Try_[Any]) -> Try_[Any]: ...
+    def route(
+        self,
+        ts: Iterable[Try_[Any]],
+        on_success: Optional[Callable[[Any], Any]] = ...,
+        on_unmatched: Optional[Callable[[Exception], Any]] = ...,
+    ) -> int: ...
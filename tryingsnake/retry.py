@@ -0,0 +1,238 @@
+import concurrent.futures as cf
+import contextvars
+from collections import deque, namedtuple
+import random
+import threading
+import time
+from tryingsnake import Try
+
+RetryResult = namedtuple("RetryResult", ["result", "attempts", "elapsed"])
+RetryResult.__doc__ = """Outcome of a retried or hedged call.
+
+:param result: final Try_
+:param attempts: number of attempts made
+:param elapsed: total time in seconds
+"""
+
+
+class RetryPolicy:
+    """Retry Try(f, ...) with exponential backoff and jitter.
+
+    Attempt n (counting from 0) is followed by a delay of
+    min(delay * backoff ** n, max_delay) seconds reduced
+    by a random fraction of at most jitter.
+
+    :param max_attempts: maximum number of attempts
+    :param max_time: optional limit of total time in seconds,
+                     no new attempt is made if it would start after this limit
+    :param delay: initial delay in seconds
+    :param backoff: delay multiplier
+    :param max_delay: optional upper bound for a single delay
+    :param jitter: fraction of the delay which can be randomly skipped (0 - 1)
+    :param retry_on: exception classes or a predicate on exceptions
+                     deciding if a failure should be retried
+    :param hedge: optional Hedge used for each attempt
+    :param clock: monotonic clock returning seconds
+    :param sleep: function used to wait
+    :param random: function returning floats from [0, 1)
+
+    >>> attempts = iter([ValueError(), ValueError(), 42])
+    >>> def f():
+    ...     x = next(attempts)
+    ...     if isinstance(x, Exception):
+    ...         raise x
+    ...     return x
+    >>> policy = RetryPolicy(max_attempts=3, delay=0)
+    >>> policy.Try(f)  # doctest:+ELLIPSIS
+    RetryResult(result=Success(42), attempts=3, elapsed=...)
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        max_time=None,
+        delay=0.1,
+        backoff=2.0,
+        max_delay=None,
+        jitter=0.5,
+        retry_on=(Exception,),
+        hedge=None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        random=random.random,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self.max_attempts = max_attempts
+        self.max_time = max_time
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        if isinstance(retry_on, (type, tuple)):
+            self._retry_on = lambda e: isinstance(e, retry_on)
+        else:
+            self._retry_on = retry_on
+        self.hedge = hedge
+        self._clock = clock
+        self._sleep = sleep
+        self._random = random
+
+    def delays(self):
+        """Delays between consecutive attempts
+
+        >>> list(RetryPolicy(max_attempts=4, delay=1, jitter=0).delays())
+        [1.0, 2.0, 4.0]
+        """
+        for n in range(self.max_attempts - 1):
+            d = float(self.delay * self.backoff**n)
+            if self.max_delay is not None:
+                d = min(d, self.max_delay)
+            yield d * (1 - self.jitter * self._random())
+
+    def Try(self, f, *args, **kwargs):
+        """Evaluate Try(f, *args, **kwargs) until it succeeds,
+        the failure is not retryable or the limits are reached.
+
+        :return: RetryResult
+        """
+        start = self._clock()
+        delays = self.delays()
+        attempts = 0
+        while True:
+            if self.hedge is not None:
+                # A hedged attempt can call f more than once
+                hedged = self.hedge.Try(f, *args, **kwargs)
+                result = hedged.result
+                attempts += hedged.attempts
+            else:
+                result = Try(f, *args, **kwargs)
+                attempts += 1
+            if result.isSuccess or not self._retry_on(result._v):
+                break
+            delay = next(delays, None)
+            if delay is None:
+                break
+            elapsed = self._clock() - start
+            if self.max_time is not None and elapsed + delay > self.max_time:
+                break
+            self._sleep(delay)
+        return RetryResult(result, attempts, self._clock() - start)
+
+
+def retry(policy, f, *args, **kwargs):
+    """Evaluate Try(f, *args, **kwargs) with retries.
+
+    :param policy: RetryPolicy or None for the default policy
+    :return: RetryResult
+    """
+    return (policy or RetryPolicy()).Try(f, *args, **kwargs)
+
+
+class Hedge:
+    """Hedged requests.
+
+    If the first attempt doesn't complete within the threshold,
+    a second one is started and the first successful outcome is used.
+    The threshold is the given percentile of recently observed latencies
+    or delay if fewer than min_samples have been observed.
+
+    Attempts run in a thread pool, which is shut down by shutdown()
+    or when the hedge is used as a context manager. An attempt which
+    lost the race is not interrupted.
+
+    :param delay: threshold in seconds used until enough samples are collected
+    :param percentile: latency percentile (0 - 1) used as the threshold
+    :param window: number of recent latencies to keep
+    :param min_samples: number of samples required to use the percentile
+    :param max_workers: size of the thread pool
+    :param clock: monotonic clock returning seconds
+    :param wait: function (future, timeout) waiting up to timeout seconds
+                 for the first attempt, returning True if it has completed
+
+    >>> import time
+    >>> latencies = iter([0.2, 0])
+    >>> def f(): return time.sleep(next(latencies)) or "done"
+    >>> with Hedge(delay=0.01) as hedge:
+    ...     hedge.Try(f)  # doctest:+ELLIPSIS
+    RetryResult(result=Success('done'), attempts=2, elapsed=...)
+    """
+
+    def __init__(
+        self,
+        delay=0.1,
+        percentile=0.95,
+        window=100,
+        min_samples=20,
+        max_workers=None,
+        clock=time.monotonic,
+        wait=None,
+    ):
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = cf.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="tryingsnake-hedge"
+        )
+        self._clock = clock
+        self._wait = _wait if wait is None else wait
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown(wait=True)
+        return False
+
+    def threshold(self):
+        """Current hedging threshold in seconds"""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < self.min_samples:
+            return self.delay
+        return samples[int(self.percentile * (len(samples) - 1))]
+
+    def _observe(self, latency):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _submit(self, f, args, kwargs):
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, Try, f, *args, **kwargs)
+
+    def Try(self, f, *args, **kwargs):
+        """Evaluate Try(f, *args, **kwargs) with a hedged second attempt.
+
+        :return: RetryResult
+        """
+        start = self._clock()
+        first = self._submit(f, args, kwargs)
+        if self._wait(first, self.threshold()):
+            result = first.result()
+            elapsed = self._clock() - start
+            self._observe(elapsed)
+            return RetryResult(result, 1, elapsed)
+
+        second = self._submit(f, args, kwargs)
+        for future in cf.as_completed([first, second]):
+            result = future.result()
+            if result.isSuccess:
+                break
+        elapsed = self._clock() - start
+        self._observe(elapsed)
+        return RetryResult(result, 2, elapsed)
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def close(self):
+        """Equivalent of shutdown(wait=True)"""
+        self.shutdown(wait=True)
+
+
+def _wait(future, timeout):
+    return not cf.wait([future], timeout=timeout).not_done
@@ -0,0 +1,74 @@
+import concurrent.futures as cf
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from tryingsnake import Try_
+
+T = TypeVar("T")
+
+class RetryResult(NamedTuple):
+    result: Try_[Any]
+    attempts: int
+    elapsed: float
+
+class RetryPolicy:
+    max_attempts: int
+    max_time: Optional[float]
+    delay: float
+    backoff: float
+    max_delay: Optional[float]
+    jitter: float
+    hedge: Optional[Hedge]
+    def __init__(
+        self,
+        max_attempts: int = ...,
+        max_time: Optional[float] = ...,
+        delay: float = ...,
+        backoff: float = ...,
+        max_delay: Optional[float] = ...,
+        jitter: float = ...,
+        retry_on: Union[
+            Type[Exception],
+            Tuple[Type[Exception], ...],
+            Callable[[Exception], bool],
+        ] = ...,
+        hedge: Optional[Hedge] = ...,
+        clock: Callable[[], float] = ...,
+        sleep: Callable[[float], Any] = ...,
+        random: Callable[[], float] = ...,
+    ) -> None: ...
+    def delays(self) -> Iterator[float]: ...
+    def Try(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> RetryResult: ...
+
+def retry(
+    policy: Optional[RetryPolicy], f: Callable[..., T], *args: Any, **kwargs: Any
+) -> RetryResult: ...
+
+class Hedge:
+    delay: float
+    percentile: float
+    min_samples: int
+    def __init__(
+        self,
+        delay: float = ...,
+        percentile: float = ...,
+        window: int = ...,
+        min_samples: int = ...,
+        max_workers: Optional[int] = ...,
+        clock: Callable[[], float] = ...,
+        wait: Optional[Callable[[cf.Future[Try_[Any]], float], bool]] = ...,
+    ) -> None: ...
+    def __enter__(self) -> Hedge: ...
+    def __exit__(self, *exc_info: Any) -> bool: ...
+    def threshold(self) -> float: ...
+    def Try(self, f: Callable[..., T], *args: Any, **kwargs: Any) -> RetryResult: ...
+    def shutdown(self, wait: bool = ...) -> None: ...
+    def close(self) -> None: ...
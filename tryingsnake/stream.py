@@ -0,0 +1,171 @@
+from collections import deque
+from itertools import islice
+from tryingsnake import Try_, Success, Failure, _unhandled_exceptions
+
+
+def try_iter(it):
+    """Lazily evaluate an iterator wrapping each item with Try_.
+
+    Iteration stops after the first exception raised
+    by the iterator, which is yielded as a Failure.
+
+    :param it: an iterable
+    :return: Iterator[Try_]
+
+    >>> def f():
+    ...     yield 1
+    ...     raise ValueError("e")
+    >>> list(try_iter(f()))
+    [Success(1), Failure(ValueError('e'))]
+    """
+    it = iter(it)
+    while True:
+        try:
+            v = next(it)
+        except StopIteration:
+            return
+        except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+            raise e
+        except Exception as e:
+            yield Failure(e)
+            return
+        yield Success(v)
+
+
+def try_imap(f, *iterables):
+    """Lazy equivalent of map(curried.Try(f), *iterables).
+
+    :param f: function to be applied
+    :param iterables: iterables of arguments
+    :return: Iterator[Try_]
+
+    >>> list(try_imap(int, ["1", "a"]))
+    [Success(1), Failure(ValueError("invalid literal for int() with base 10: 'a'"))]
+    """
+    for args in zip(*iterables):
+        try:
+            v = f(*args)
+        except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+            raise e
+        except Exception as e:
+            yield Failure(e)
+        else:
+            yield Success(v)
+
+
+def try_ifilter(f, iterable):
+    """Lazily filter iterable with a predicate which may fail.
+
+    Yields Success(x) if f(x) is true, Failure if f(x) raised an exception
+    and skips x otherwise.
+
+    :param f: predicate
+    :param iterable: an iterable
+    :return: Iterator[Try_]
+
+    >>> list(try_ifilter(lambda x: 1 / x > 0.5, [1, 0, 3]))  # doctest:+ELLIPSIS
+    [Success(1), Failure(ZeroDivisionError(...))]
+    """
+    for x in iterable:
+        try:
+            keep = f(x)
+        except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+            raise e
+        except Exception as e:
+            yield Failure(e)
+        else:
+            if keep:
+                yield Success(x)
+
+
+_missing = object()
+
+
+class _Partition:
+    __slots__ = ("_it", "_successes", "_failures", "_maxbuffer")
+
+    def __init__(self, tries, maxbuffer):
+        self._it = iter(tries)
+        self._successes = deque()
+        self._failures = deque()
+        self._maxbuffer = maxbuffer
+
+    def _pull(self, own, other, want_success):
+        while True:
+            if own:
+                yield own.popleft()
+                continue
+            t = next(self._it, _missing)
+            if t is _missing:
+                return
+            t = Try_._identity_if_try_or_raise(t, "Invalid type for element: {0}")
+            if t.isSuccess is want_success:
+                yield t._v
+            elif len(other) >= self._maxbuffer:
+                raise BufferError(
+                    "Partition buffer exceeded {0} elements".format(self._maxbuffer)
+                )
+            else:
+                other.append(t._v)
+
+    def successes(self):
+        return self._pull(self._successes, self._failures, True)
+
+    def failures(self):
+        return self._pull(self._failures, self._successes, False)
+
+
+def partition(tries, maxbuffer=1024):
+    """Lazily split a stream of Try_ into successful values and exceptions.
+
+    Elements consumed on behalf of one side are buffered for the other.
+    If the buffer grows beyond maxbuffer elements BufferError is raised.
+
+    :param tries: Iterable[Try_]
+    :param maxbuffer: maximum number of buffered elements per side
+    :return: a pair of iterators (values, exceptions)
+
+    >>> values, errors = partition(try_imap(int, ["1", "a", "3"]))
+    >>> list(values)
+    [1, 3]
+    >>> list(errors)
+    [ValueError("invalid literal for int() with base 10: 'a'")]
+    """
+    p = _Partition(tries, maxbuffer)
+    return p.successes(), p.failures()
+
+
+def chunked(iterable, n):
+    """Lazily split iterable into lists of at most n elements.
+
+    :param iterable: an iterable
+    :param n: chunk size
+    :return: Iterator[List]
+
+    >>> list(chunked(try_imap(int, "123"), 2))
+    [[Success(1), Success(2)], [Success(3)]]
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+def take_until_failure(tries):
+    """Lazily take elements of a Try_ stream up to and including
+    the first Failure.
+
+    :param tries: Iterable[Try_]
+    :return: Iterator[Try_]
+
+    >>> list(take_until_failure(try_imap(int, ["1", "a", "3"])))  # doctest:+ELLIPSIS
+    [Success(1), Failure(ValueError(...))]
+    """
+    for t in tries:
+        yield t
+        if not Try_._identity_if_try_or_raise(t, "Invalid type for element: {0}"):
+            return
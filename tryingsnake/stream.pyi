@@ -0,0 +1,13 @@
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, TypeVar
+from tryingsnake import Try_
+
+T = TypeVar("T")
+
+def try_iter(it: Iterable[T]) -> Iterator[Try_[T]]: ...
+def try_imap(f: Callable[..., T], *iterables: Iterable[Any]) -> Iterator[Try_[T]]: ...
+def try_ifilter(f: Callable[[T], Any], iterable: Iterable[T]) -> Iterator[Try_[T]]: ...
+def partition(
+    tries: Iterable[Try_[T]], maxbuffer: int = ...
+) -> Tuple[Iterator[T], Iterator[Exception]]: ...
+def chunked(iterable: Iterable[T], n: int) -> Iterator[List[T]]: ...
+def take_until_failure(tries: Iterable[Try_[T]]) -> Iterator[Try_[T]]: ...
@@ -0,0 +1,166 @@
+import collections
+import json
+import os
+import pickle
+import random
+import tempfile
+import tracemalloc
+import unittest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.aggregate import FailureAggregator
+
+
+def lookup(key):
+    return {}[key]
+
+
+def parse(x):
+    return int(x)
+
+
+class FailureAggregatorTestCase(unittest.TestCase):
+    def test_should_group_by_type_message_and_site(self):
+        aggregator = FailureAggregator()
+        aggregator.update(Try(lookup, i) for i in range(10))
+        aggregator.update(Try(parse, "x{0}".format(i)) for i in range(5))
+        aggregator.update([Try(lookup, "a"), Success(1)])
+        groups = aggregator.groups()
+        self.assertEqual(
+            [(g["type"], g["message"], g["count"]) for g in groups],
+            [
+                ("KeyError", "<*>", 11),
+                ("ValueError", "invalid literal for int() with base <*>: <*>", 5),
+            ],
+        )
+        self.assertIn("in lookup", groups[0]["site"])
+        self.assertEqual((aggregator.failures, aggregator.successes), (16, 1))
+
+    def test_sites_should_be_distinguished(self):
+        def other(key):
+            return {}[key]
+
+        aggregator = FailureAggregator().update([Try(lookup, 1), Try(other, 1)])
+        self.assertEqual(len(aggregator.groups()), 2)
+
+    def test_should_use_summary_stack(self):
+        with Try_.capture("summary"):
+            summary = Try(lookup, 1)
+        with Try_.capture("none"):
+            none = Try(lookup, 1)
+        aggregator = FailureAggregator().update([summary, Try(lookup, 1), none])
+        self.assertEqual(sorted(g["count"] for g in aggregator.groups()), [1, 2])
+        self.assertEqual(aggregator.groups()[1]["site"], "<unknown>")
+
+    def test_samples_should_be_bounded(self):
+        aggregator = FailureAggregator(samples=3, random=random.Random(0).random)
+        failures = [Failure(KeyError(i)) for i in range(1000)]
+        aggregator.update(failures)
+        [group] = aggregator.groups()
+        self.assertEqual(group["count"], 1000)
+        self.assertEqual(len(group["samples"]), 3)
+        self.assertTrue(all(f in failures for f in group["samples"]))
+        # Sampled uniformly, not just the first ones
+        self.assertGreater(max(f._v.args[0] for f in group["samples"]), 3)
+        [group] = FailureAggregator(samples=0).update(failures).groups()
+        self.assertEqual(group["samples"], [])
+
+    def test_groups_should_be_bounded(self):
+        aggregator = FailureAggregator(max_groups=3)
+        exceptions = [KeyError, ValueError, TypeError, IndexError, OSError]
+        ts = [Failure(KeyError())] * 50 + [Failure(ValueError())] * 30
+        ts += [Failure(cls()) for cls in exceptions for _ in range(5)]
+        aggregator.update(ts)
+        groups = aggregator.groups()
+        self.assertEqual(len(groups), 3)
+        self.assertEqual([g["type"] for g in groups[:2]], ["KeyError", "ValueError"])
+        for g in groups:
+            true_count = sum(1 for t in ts if type(t._v).__name__ == g["type"])
+            self.assertLessEqual(g["count"] - g["error"], true_count)
+            self.assertGreaterEqual(g["count"], true_count)
+
+    def test_memory_should_be_bounded(self):
+        aggregator = FailureAggregator(max_groups=10, samples=2)
+        tracemalloc.start()
+        try:
+            aggregator.update(Try(lookup, i % 50) for i in range(2_000))
+            first = tracemalloc.get_traced_memory()[0]
+            aggregator.update(Try(lookup, i % 50) for i in range(20_000))
+            second = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(second, first * 1.5 + 10_000)
+
+    def test_merge(self):
+        a = FailureAggregator(samples=2).update(
+            [Failure(KeyError(1)), Failure(KeyError(2)), Success(1)]
+        )
+        b = FailureAggregator(samples=2).update(
+            [Failure(KeyError(3)), Failure(ValueError(4))]
+        )
+        merged = a.merge(pickle.loads(pickle.dumps(b)))
+        self.assertIs(merged, a)
+        groups = merged.groups()
+        self.assertEqual(
+            [(g["type"], g["count"]) for g in groups],
+            [("KeyError", 3), ("ValueError", 1)],
+        )
+        self.assertEqual(len(groups[0]["samples"]), 2)
+        self.assertEqual((merged.failures, merged.successes), (4, 1))
+
+    def test_merge_should_respect_max_groups(self):
+        a = FailureAggregator(max_groups=2).update([Failure(KeyError())] * 3)
+        b = FailureAggregator(max_groups=2).update(
+            [Failure(ValueError())] * 2 + [Failure(TypeError())]
+        )
+        groups = a.merge(b).groups()
+        self.assertEqual(
+            [(g["type"], g["count"], g["error"]) for g in groups],
+            [("KeyError", 4, 1), ("ValueError", 2, 0)],
+        )
+
+    def test_merge_should_overestimate_counts(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            parts, true_counts = [], collections.Counter()
+            for _ in range(3):
+                keys = [
+                    "error " + "abcdefghijklm"[min(int(rng.expovariate(0.3)), 12)]
+                    for _ in range(rng.randrange(1, 40))
+                ]
+                true_counts.update(keys)
+                part = FailureAggregator(max_groups=3, samples=1, random=rng.random)
+                parts.append(part.update(Failure(ValueError(k)) for k in keys))
+            merged = parts[0]
+            for part in parts[1:]:
+                merged.merge(part)
+            for (_, message, _), group in merged._groups.items():
+                true_count = true_counts[message]
+                self.assertLessEqual(group.count - group.error, true_count)
+                self.assertLessEqual(true_count, group.count)
+
+    def test_exporters(self):
+        aggregator = FailureAggregator().update([Try(lookup, 1), Success(1)])
+        report = json.loads(aggregator.to_json())
+        self.assertEqual(report["failures"], 1)
+        [sample] = report["groups"][0]["samples"]
+        self.assertEqual(sample["repr"], "KeyError(1)")
+        self.assertTrue(sample["stack"])
+        self.assertIn("KeyError: <*>", aggregator.to_text())
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "failures.txt")
+            aggregator.write(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), aggregator.to_text())
+            aggregator.write(path, format="json")
+            with open(path) as f:
+                self.assertEqual(json.load(f), aggregator.report())
+            self.assertRaises(ValueError, aggregator.write, path, format="xml")
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, FailureAggregator, max_groups=0)
+        self.assertRaises(ValueError, FailureAggregator, samples=-1)
+        self.assertRaises(TypeError, FailureAggregator().add, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
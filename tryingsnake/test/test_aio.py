@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+import pytest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.aio import AsyncTry, gather_tries
+
+
+def run(aw):
+    return asyncio.run(_await(aw))
+
+
+async def _await(aw):
+    return await aw
+
+
+async def ainv(x):
+    await asyncio.sleep(0)
+    return 1 / x
+
+
+def inv(x):
+    return 1 / x
+
+
+class AsyncTryTestCase(unittest.TestCase):
+    def test_coroutine_function_failure_should_be_failure(self):
+        self.assertTrue(run(AsyncTry(ainv, 0)).isFailure)
+        self.assertEqual(run(AsyncTry(ainv, 2)), Success(0.5))
+
+    def test_sync_function(self):
+        self.assertEqual(run(AsyncTry(inv, 2)), Try(inv, 2))
+        self.assertEqual(run(AsyncTry(inv, 0)), Try(inv, 0))
+
+    def test_awaitable(self):
+        self.assertEqual(run(AsyncTry(ainv(2))), Success(0.5))
+
+    def test_should_be_evaluated_once(self):
+        calls = []
+
+        async def f():
+            calls.append(1)
+            return 1
+
+        async def main():
+            t = AsyncTry(f)
+            return [await t, await t]
+
+        self.assertEqual(asyncio.run(main()), [Success(1), Success(1)])
+        self.assertEqual(calls, [1])
+
+    def test_map(self):
+        self.assertEqual(run(AsyncTry(ainv, 2).map(ainv)), Success(2.0))
+        self.assertEqual(run(AsyncTry(ainv, 2).map(inv)), Success(2.0))
+        self.assertTrue(run(AsyncTry(ainv, 0).map(inv)).isFailure)
+
+    def test_flatmap(self):
+        self.assertEqual(
+            run(AsyncTry(ainv, 2).flatMap(lambda x: AsyncTry(ainv, x))), Success(2.0)
+        )
+        self.assertEqual(
+            run(AsyncTry(ainv, 2).flatMap(lambda x: Try(inv, x))), Success(2.0)
+        )
+        self.assertTrue(
+            run(AsyncTry(ainv, 2).flatMap(lambda x: AsyncTry(ainv, 0))).isFailure
+        )
+
+    def test_flatmap_should_fail_if_f_doesnt_return_try(self):
+        with pytest.raises(TypeError):
+            run(AsyncTry(ainv, 2).flatMap(ainv))
+
+    def test_recover(self):
+        self.assertEqual(run(AsyncTry(ainv, 0).recover(lambda e: 0)), Success(0))
+        self.assertEqual(run(AsyncTry(ainv, 1).recover(lambda e: 0)), Success(1.0))
+        self.assertTrue(run(AsyncTry(ainv, 0).recover(ainv)).isFailure)
+
+    def test_recover_with(self):
+        self.assertEqual(
+            run(AsyncTry(ainv, 0).recoverWith(lambda e: AsyncTry(ainv, 1))),
+            Success(1.0),
+        )
+        self.assertEqual(
+            run(AsyncTry(ainv, 1).recoverWith(lambda e: AsyncTry(ainv, 2))),
+            Success(1.0),
+        )
+
+    def test_gather_tries_should_not_cancel_on_failure(self):
+        done = []
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            done.append(1)
+            return 1
+
+        result = asyncio.run(gather_tries(ainv(0), slow(), AsyncTry(ainv, 1)))
+        self.assertTrue(result[0].isFailure)
+        self.assertEqual(result[1:], [Success(1), Success(1.0)])
+        self.assertEqual(done, [1])
+
+    def test_unhandled_should_be_raised(self):
+        Try_.set_unhandled([ZeroDivisionError])
+        try:
+            with pytest.raises(ZeroDivisionError):
+                run(AsyncTry(ainv, 0))
+        finally:
+            Try_.set_unhandled()
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,173 @@
+import unittest
+import pytest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.batch import TryBatch, map_batch
+
+
+def inv(x):
+    return 1 / x
+
+
+def checked_inv(xs):
+    if (xs == 0).any():
+        raise ZeroDivisionError("division by zero")
+    return 1 / xs
+
+
+class TryBatchTestCase(unittest.TestCase):
+    def test_map_batch_should_match_try(self):
+        xs = [1, 0, 2, "a", 4]
+        self.assertEqual(list(map_batch(inv, xs)), [Try(inv, x) for x in xs])
+
+    def test_failures_should_be_sparse(self):
+        batch = map_batch(inv, [1, 0, 2, 0])
+        self.assertEqual(sorted(batch.failures), [1, 3])
+        self.assertEqual(list(batch.mask), [1, 0, 1, 0])
+
+    def test_getitem(self):
+        batch = map_batch(inv, [1, 0])
+        self.assertEqual(batch[0], Success(1.0))
+        self.assertTrue(batch[1].isFailure)
+        self.assertTrue(batch[-1].isFailure)
+
+    def test_map_should_skip_failures(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return x * 2
+
+        batch = map_batch(inv, [1, 0, 2]).map(f)
+        self.assertEqual(calls, [1.0, 0.5])
+        self.assertEqual(list(batch.successes()), [2.0, 1.0])
+        self.assertEqual(sorted(batch.failures), [1])
+
+    def test_map_should_collect_new_failures(self):
+        batch = map_batch(int, ["1", "0"]).map(inv)
+        self.assertEqual(sorted(batch.failures), [1])
+
+    def test_filter(self):
+        batch = map_batch(int, ["1", "-1", "a"]).filter(
+            lambda x: x > 0, ValueError, "negative"
+        )
+        self.assertEqual(batch[1], Failure(ValueError("negative")))
+        self.assertEqual(sorted(batch.failures), [1, 2])
+
+    def test_recover_should_only_touch_failures(self):
+        original = map_batch(int, ["1", "a"])
+        recovered = original.recover(lambda e: -1)
+        self.assertEqual(list(recovered), [Success(1), Success(-1)])
+        self.assertEqual(sorted(original.failures), [1])
+
+    def test_recover_can_fail(self):
+        original = map_batch(int, ["1", "a"])
+        batch = original.recover(inv)
+        self.assertTrue(isinstance(batch.failures[1], TypeError))
+        self.assertIs(batch.values, original.values)
+
+    def test_from_tries(self):
+        tries = [Success(1), Failure(Exception("e"))]
+        self.assertEqual(list(TryBatch.from_tries(tries)), tries)
+        self.assertRaises(TypeError, TryBatch.from_tries, [1])
+
+    def test_unhandled_should_be_raised(self):
+        Try_.set_unhandled([ZeroDivisionError])
+        try:
+            self.assertRaises(ZeroDivisionError, map_batch, inv, [0])
+        finally:
+            Try_.set_unhandled()
+
+
+class VectorizedTryBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.np = pytest.importorskip("numpy")
+
+    def test_vectorized_path_should_call_f_once(self):
+        np = self.np
+        calls = []
+
+        def f(xs):
+            calls.append(xs)
+            return xs * 2
+
+        batch = map_batch(f, np.arange(3))
+        self.assertEqual(len(calls), 1)
+        self.assertIsInstance(batch.values, np.ndarray)
+        self.assertEqual(list(batch.successes()), [0, 2, 4])
+
+    def test_vectorized_path_should_fall_back_on_error(self):
+        np = self.np
+        xs = np.array([1.0, 0.0, 2.0])
+        batch = map_batch(checked_inv, xs)
+        self.assertEqual(list(batch), [Try(checked_inv, x) for x in xs])
+        self.assertIsInstance(batch.failures[1], ZeroDivisionError)
+        self.assertIsInstance(batch.values, np.ndarray)
+        self.assertEqual(batch.values.dtype, np.float64)
+        self.assertEqual(list(batch.mask), [True, False, True])
+
+    def test_fallback_should_bisect(self):
+        np = self.np
+        calls = []
+
+        def f(xs):
+            calls.append(xs)
+            return checked_inv(xs)
+
+        xs = np.arange(1, 1025, dtype=float)
+        xs[[100, 700]] = 0
+        batch = map_batch(f, xs)
+        self.assertEqual(sorted(batch.failures), [100, 700])
+        self.assertLess(len(calls), 4 * 10 + 1)
+        self.assertEqual(batch.values[[0, 1023]].tolist(), [1.0, 1 / 1024])
+
+    def test_fallback_should_not_mix_incompatible_values(self):
+        np = self.np
+
+        def f(xs):
+            if np.ndim(xs):
+                raise TypeError()
+            return "a" if xs == 1 else xs
+
+        batch = map_batch(f, np.array([1, 2]))
+        self.assertEqual(list(batch), [Success("a"), Success(2)])
+        self.assertEqual(batch.values.dtype, object)
+
+    def test_filter_should_use_vectorized_mask(self):
+        np = self.np
+        calls = []
+
+        def positive(xs):
+            calls.append(xs)
+            return xs > 0
+
+        batch = map_batch(checked_inv, np.array([1.0, 0.0, -1.0, 2.0]))
+        filtered = batch.filter(positive, ValueError, "negative")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(filtered.failures), [1, 2])
+        self.assertIsInstance(filtered.failures[1], ZeroDivisionError)
+        self.assertEqual(filtered[2], Failure(ValueError("negative")))
+
+    def test_filter_should_fall_back_to_elements(self):
+        np = self.np
+        batch = map_batch(lambda x: x, np.array([1, 2, 3]))
+        filtered = batch.filter(lambda x: x in {1, 3})
+        self.assertEqual(sorted(filtered.failures), [1])
+
+    def test_recover_on_array(self):
+        np = self.np
+        batch = map_batch(checked_inv, np.array([1.0, 0.0])).map(lambda x: x)
+        self.assertEqual(list(batch.recover(lambda e: "inf").successes()), [1.0, "inf"])
+
+    def test_recover_should_upcast(self):
+        np = self.np
+        batch = map_batch(lambda x: x * 2, np.array([1, 2, 3])).filter(lambda x: x < 5)
+        recovered = batch.recover(lambda e: 0.5)
+        self.assertEqual(list(recovered), [Success(2), Success(4), Success(0.5)])
+        self.assertEqual(recovered.values.dtype, np.float64)
+        self.assertEqual(batch.values.dtype, np.int64)
+        same = batch.recover(lambda e: 0)
+        self.assertEqual(same.values.dtype, np.int64)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,105 @@
+import unittest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.block import try_block
+
+
+def inv(x):
+    return 1 / x
+
+
+class TryBlockTestCase(unittest.TestCase):
+    def test_should_match_nested_flat_map(self):
+        @try_block
+        def block(x, y):
+            a = yield Try(inv, x)
+            b = yield Try(inv, y)
+            return a + b
+
+        def nested(x, y):
+            return Try(inv, x).flatMap(
+                lambda a: Try(inv, y).flatMap(lambda b: Success(a + b))
+            )
+
+        for x, y in [(1, 2), (0, 2), (1, 0), (0, 0)]:
+            self.assertEqual(block(x, y), nested(x, y))
+
+    def test_failure_should_short_circuit(self):
+        steps = []
+
+        @try_block
+        def block():
+            try:
+                steps.append(1)
+                yield Failure(ValueError("e"))
+                steps.append(2)  # pragma: no cover
+            finally:
+                steps.append("closed")
+
+        self.assertEqual(block(), Failure(ValueError("e")))
+        self.assertEqual(steps, [1, "closed"])
+
+    def test_failure_should_be_returned_as_is(self):
+        failure = Failure(ValueError("e"))
+
+        @try_block
+        def block():
+            yield failure
+
+        self.assertIs(block(), failure)
+
+    def test_exceptions_should_be_wrapped(self):
+        @try_block
+        def block():
+            x = yield Success(0)
+            return 1 / x
+
+        self.assertIsInstance(block()._v, ZeroDivisionError)
+
+    def test_block_without_yield_result(self):
+        @try_block
+        def block():
+            yield Success(1)
+
+        self.assertEqual(block(), Success(None))
+
+    def test_unhandled_should_be_raised(self):
+        @try_block
+        def block():
+            yield Success(1)
+            raise KeyError()
+
+        with Try_.unhandled(KeyError):
+            self.assertRaises(KeyError, block)
+
+    def test_should_reject_invalid_yield(self):
+        @try_block
+        def block():
+            yield 1
+
+        self.assertRaises(TypeError, block)
+
+    def test_should_reject_functions(self):
+        self.assertRaises(TypeError, try_block, inv)
+
+    def test_should_keep_metadata(self):
+        @try_block
+        def block(x):
+            """Docstring"""
+            yield Success(x)
+
+        self.assertEqual(block.__name__, "block")
+        self.assertEqual(block.__doc__, "Docstring")
+
+    def test_should_handle_long_blocks(self):
+        @try_block
+        def block(n):
+            total = 0
+            for i in range(n):
+                total += yield Success(i)
+            return total
+
+        self.assertEqual(block(100_000), Success(sum(range(100_000))))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
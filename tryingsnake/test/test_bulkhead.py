@@ -0,0 +1,230 @@
+import asyncio
+import threading
+import time
+import unittest
+from tryingsnake import Success
+from tryingsnake.curried import Try as CurriedTry
+from tryingsnake.bulkhead import AsyncBulkhead, Bulkhead, BulkheadFullError
+from tryingsnake.circuit import CircuitBreaker
+
+
+class Blocker:
+    """Function blocking until released, recording the number of calls"""
+
+    def __init__(self):
+        self.entered = threading.Semaphore(0)
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self, x=None):
+        self.calls += 1
+        self.entered.release()
+        self.release.wait(5)
+        return x
+
+
+def run_in_thread(f, *args):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(f(*args)))
+    thread.start()
+    return thread, results
+
+
+class BulkheadTestCase(unittest.TestCase):
+    def test_should_limit_concurrent_calls(self):
+        bulkhead = Bulkhead(max_concurrent=2)
+        blocker = Blocker()
+        threads = [run_in_thread(bulkhead.Try, blocker, i) for i in range(2)]
+        for _ in threads:
+            blocker.entered.acquire()
+        result = bulkhead.Try(blocker, 2)
+        self.assertTrue(result.isFailure)
+        self.assertIsInstance(result._v, BulkheadFullError)
+        self.assertEqual(blocker.calls, 2)
+        blocker.release.set()
+        for thread, results in threads:
+            thread.join()
+        self.assertEqual(sorted(r.get() for _, [r] in threads), [0, 1])
+        stats = bulkhead.stats()
+        self.assertEqual(stats.active, 0)
+        self.assertEqual(stats.peak_active, 2)
+        self.assertEqual(stats.accepted, 2)
+        self.assertEqual(stats.rejected, 1)
+
+    def test_queued_calls_should_wait_for_slot(self):
+        bulkhead = Bulkhead(max_concurrent=1, max_queued=1)
+        blocker = Blocker()
+        first, _ = run_in_thread(bulkhead.Try, blocker, 0)
+        blocker.entered.acquire()
+        second, results = run_in_thread(bulkhead.Try, lambda: "queued")
+        while bulkhead.stats().queued < 1:
+            pass
+        self.assertIsInstance(bulkhead.Try(abs, -1)._v, BulkheadFullError)
+        blocker.release.set()
+        for thread in first, second:
+            thread.join()
+        self.assertEqual(results, [Success("queued")])
+        stats = bulkhead.stats()
+        self.assertEqual(stats.peak_queued, 1)
+        self.assertEqual(stats.accepted, 2)
+        self.assertEqual(stats.rejected, 1)
+        self.assertGreater(stats.total_wait, 0)
+        self.assertEqual(stats.max_wait, stats.total_wait)
+
+    def test_queued_calls_should_time_out(self):
+        bulkhead = Bulkhead(max_concurrent=1, max_queued=1, timeout=0.01)
+        blocker = Blocker()
+        thread, _ = run_in_thread(bulkhead.Try, blocker)
+        blocker.entered.acquire()
+        result = bulkhead.Try(abs, -1)
+        blocker.release.set()
+        thread.join()
+        self.assertIsInstance(result._v, BulkheadFullError)
+        stats = bulkhead.stats()
+        self.assertEqual((stats.queued, stats.timed_out), (0, 1))
+        self.assertEqual(bulkhead.Try(abs, -1), Success(1))
+
+    def test_slot_should_be_released_on_unhandled_exception(self):
+        bulkhead = Bulkhead(max_concurrent=1)
+
+        def interrupt():
+            raise KeyboardInterrupt()
+
+        self.assertRaises(KeyboardInterrupt, bulkhead.Try, interrupt)
+        self.assertEqual(bulkhead.stats().active, 0)
+        self.assertEqual(bulkhead.Try(abs, -1), Success(1))
+
+    def test_bulkhead_should_be_shared_by_curried_functions(self):
+        bulkhead = Bulkhead(max_concurrent=1)
+        blocker = Blocker()
+        try_block = CurriedTry(blocker, bulkhead=bulkhead)
+        try_abs = CurriedTry(abs, bulkhead=bulkhead)
+        thread, _ = run_in_thread(try_block)
+        blocker.entered.acquire()
+        self.assertRaises(BulkheadFullError, try_abs(-1).get)
+        blocker.release.set()
+        thread.join()
+        self.assertEqual(try_abs(-1), Success(1))
+
+    def test_timed_out_calls_should_keep_slot(self):
+        bulkhead = Bulkhead(max_concurrent=1)
+        lock = threading.Lock()
+        running, peak = [0], [0]
+        release = threading.Event()
+
+        def backend():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            release.wait(5)
+            with lock:
+                running[0] -= 1
+
+        try_backend = CurriedTry(backend, timeout=0.02, bulkhead=bulkhead)
+        results = [try_backend() for _ in range(4)]
+        self.assertIsInstance(results[0]._v, TimeoutError)
+        for result in results[1:]:
+            self.assertIsInstance(result._v, BulkheadFullError)
+        self.assertEqual(peak[0], 1)
+        self.assertEqual(bulkhead.stats().active, 1)
+        release.set()
+        while bulkhead.stats().active:
+            time.sleep(0.001)
+        self.assertEqual(CurriedTry(abs, timeout=1, bulkhead=bulkhead)(-1), Success(1))
+        self.assertEqual(bulkhead.stats().peak_active, 1)
+
+    def test_expired_timeout_should_release_slot(self):
+        bulkhead = Bulkhead(max_concurrent=1)
+        result = CurriedTry(abs, timeout=0, bulkhead=bulkhead)(-1)
+        self.assertIsInstance(result._v, TimeoutError)
+        self.assertEqual(bulkhead.stats().active, 0)
+
+    def test_rejections_should_not_open_circuit(self):
+        bulkhead = Bulkhead(max_concurrent=1)
+        breaker = CircuitBreaker(window=2, min_calls=2)
+        blocker = Blocker()
+        try_block = CurriedTry(blocker, bulkhead=bulkhead, breaker=breaker)
+        thread, _ = run_in_thread(try_block)
+        blocker.entered.acquire()
+        for _ in range(4):
+            self.assertIsInstance(try_block()._v, BulkheadFullError)
+        blocker.release.set()
+        thread.join()
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(try_block(1), Success(1))
+
+    def test_async_bulkhead_should_be_rejected_by_curried(self):
+        self.assertRaises(TypeError, CurriedTry, abs, bulkhead=AsyncBulkhead())
+        self.assertRaises(
+            TypeError, CurriedTry, abs, timeout=1, bulkhead=AsyncBulkhead()
+        )
+
+    def test_invalid_arguments(self):
+        for cls in Bulkhead, AsyncBulkhead:
+            self.assertRaises(ValueError, cls, max_concurrent=0)
+            self.assertRaises(ValueError, cls, max_queued=-1)
+            self.assertRaises(ValueError, cls, timeout=-1)
+
+
+class AsyncBulkheadTestCase(unittest.TestCase):
+    def test_should_limit_concurrent_calls(self):
+        bulkhead = AsyncBulkhead(max_concurrent=2, max_queued=1)
+        active = []
+
+        async def call(x):
+            active.append(bulkhead.stats().active)
+            await asyncio.sleep(0.01)
+            return x
+
+        async def main():
+            calls = (bulkhead.AsyncTry(call, i) for i in range(4))
+            return await asyncio.gather(*calls)
+
+        results = asyncio.run(main())
+        self.assertEqual(results[:3], [Success(0), Success(1), Success(2)])
+        self.assertIsInstance(results[3]._v, BulkheadFullError)
+        self.assertEqual(max(active), 2)
+        stats = bulkhead.stats()
+        self.assertEqual(stats.active, 0)
+        self.assertEqual(stats.peak_queued, 1)
+        self.assertEqual((stats.accepted, stats.rejected), (3, 1))
+        self.assertGreater(stats.max_wait, 0)
+
+    def test_queued_calls_should_time_out(self):
+        bulkhead = AsyncBulkhead(max_concurrent=1, max_queued=1, timeout=0.01)
+
+        async def main():
+            return await asyncio.gather(
+                bulkhead.AsyncTry(asyncio.sleep, 0.1),
+                bulkhead.AsyncTry(abs, -1),
+            )
+
+        _, result = asyncio.run(main())
+        self.assertIsInstance(result._v, BulkheadFullError)
+        stats = bulkhead.stats()
+        self.assertEqual((stats.queued, stats.timed_out), (0, 1))
+
+    def test_cancelled_waiter_should_leave_queue(self):
+        bulkhead = AsyncBulkhead(max_concurrent=1, max_queued=1)
+
+        async def main():
+            release = asyncio.Event()
+            first = asyncio.ensure_future(bulkhead.AsyncTry(release.wait))
+            while bulkhead.stats().active < 1:
+                await asyncio.sleep(0)
+            second = asyncio.ensure_future(bulkhead.AsyncTry(abs, -1))
+            while bulkhead.stats().queued < 1:
+                await asyncio.sleep(0)
+            second.cancel()
+            await asyncio.gather(second, return_exceptions=True)
+            self.assertEqual(bulkhead.stats().queued, 0)
+            release.set()
+            await first
+            return await bulkhead.AsyncTry(abs, -1)
+
+        self.assertEqual(asyncio.run(main()), Success(1))
+        self.assertEqual(bulkhead.stats().active, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,148 @@
+from operator import getitem
+import threading
+import unittest
+import pytest
+from tryingsnake import Try_, Success, Failure
+from tryingsnake.curried import Try as CurriedTry
+from tryingsnake.cache import TryCache, CacheStats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Counter:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, x, y=0):
+        self.calls.append((x, y))
+        return 1 / x
+
+
+class TryCacheTestCase(unittest.TestCase):
+    def cache(self, **kwargs):
+        self.clock = FakeClock()
+        return TryCache(clock=self.clock, **kwargs)
+
+    def test_should_cache_successes(self):
+        f, cache = Counter(), self.cache()
+        self.assertEqual(cache.Try(f, 1), Success(1.0))
+        self.assertEqual(cache.Try(f, 1), Success(1.0))
+        self.assertEqual(f.calls, [(1, 0)])
+        self.assertEqual(cache.stats(), CacheStats(1, 1, 0, 0, 1))
+
+    def test_kwargs_should_be_part_of_the_key(self):
+        f, cache = Counter(), self.cache()
+        cache.Try(f, 1, y=1)
+        cache.Try(f, 1, y=2)
+        cache.Try(f, 1, y=1)
+        self.assertEqual(f.calls, [(1, 1), (1, 2)])
+
+    def test_argument_types_should_be_part_of_the_key(self):
+        cache = self.cache()
+        self.assertEqual(cache.Try(repr, 1), Success("1"))
+        self.assertEqual(cache.Try(repr, True), Success("True"))
+        self.assertEqual(cache.Try(repr, 1.0), Success("1.0"))
+        self.assertEqual(cache.Try(repr, 1), Success("1"))
+        f = Counter()
+        cache.Try(f, 1, y=1)
+        cache.Try(f, 1, y=True)
+        self.assertEqual(f.calls, [(1, 1), (1, True)])
+
+    def test_should_not_cache_failures_by_default(self):
+        f, cache = Counter(), self.cache()
+        self.assertTrue(cache.Try(f, 0).isFailure)
+        self.assertTrue(cache.Try(f, 0).isFailure)
+        self.assertEqual(len(f.calls), 2)
+
+    def test_should_cache_failures_with_failure_ttl(self):
+        f, cache = Counter(), self.cache(ttl=100, failure_ttl=1)
+        cache.Try(f, 0)
+        cache.Try(f, 0)
+        self.assertEqual(len(f.calls), 1)
+        self.clock.now = 1
+        cache.Try(f, 0)
+        self.assertEqual(len(f.calls), 2)
+
+    def test_successes_should_expire(self):
+        f, cache = Counter(), self.cache(ttl=10)
+        cache.Try(f, 1)
+        self.clock.now = 5
+        cache.Try(f, 1)
+        self.clock.now = 10
+        cache.Try(f, 1)
+        self.assertEqual(len(f.calls), 2)
+
+    def test_should_evict_least_recently_used(self):
+        f, cache = Counter(), self.cache(maxsize=2)
+        cache.Try(f, 1)
+        cache.Try(f, 2)
+        cache.Try(f, 1)
+        cache.Try(f, 3)
+        self.assertEqual(len(cache), 2)
+        cache.Try(f, 1)
+        cache.Try(f, 2)
+        self.assertEqual([x for x, _ in f.calls], [1, 2, 3, 2])
+        self.assertEqual(cache.stats().evictions, 2)
+
+    def test_unhashable_arguments_should_bypass_cache(self):
+        cache = self.cache()
+        self.assertEqual(cache.Try(len, [1, 2]), Success(2))
+        self.assertEqual(cache.stats().bypasses, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_calls_should_be_deduplicated(self):
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow(x):
+            calls.append(x)
+            started.set()
+            release.wait(1)
+            return x
+
+        cache = self.cache()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.Try(slow, 1)))
+            for _ in range(4)
+        ]
+        threads[0].start()
+        started.wait(1)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, [Success(1)] * 4)
+
+    def test_unhandled_should_be_raised_and_not_cached(self):
+        cache = self.cache()
+        Try_.set_unhandled([IndexError])
+        try:
+            self.assertRaises(IndexError, cache.Try, getitem, (), 0)
+        finally:
+            Try_.set_unhandled()
+        self.assertTrue(cache.Try(getitem, (), 0).isFailure)
+
+    def test_curried(self):
+        f, cache = Counter(), self.cache()
+        try_f = CurriedTry(f, cache=cache)
+        try_f(1)
+        try_f(1)
+        self.assertEqual(len(f.calls), 1)
+        # Different functions don't share entries
+        self.assertEqual(CurriedTry(abs, cache=cache)(1), Success(1))
+
+    def test_invalid_maxsize(self):
+        self.assertRaises(ValueError, TryCache, maxsize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
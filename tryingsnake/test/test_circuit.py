@@ -0,0 +1,206 @@
+import asyncio
+from operator import getitem
+import threading
+import unittest
+import pytest
+from tryingsnake import Try_, Success, Failure
+from tryingsnake.curried import Try as CurriedTry
+from tryingsnake.circuit import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def inv(x):
+    return 1 / x
+
+
+class CircuitBreakerTestCase(unittest.TestCase):
+    def breaker(self, **kwargs):
+        self.clock = FakeClock()
+        kwargs.setdefault("window", 4)
+        kwargs.setdefault("min_calls", 4)
+        kwargs.setdefault("cooldown", 10)
+        return CircuitBreaker(clock=self.clock, **kwargs)
+
+    def test_should_stay_closed_below_failure_rate(self):
+        breaker = self.breaker()
+        for x in [1, 1, 1, 0]:
+            breaker.Try(inv, x)
+        self.assertEqual(breaker.state, "closed")
+
+    def test_should_open_at_failure_rate(self):
+        breaker = self.breaker()
+        for x in [1, 0, 1, 0]:
+            breaker.Try(inv, x)
+        self.assertEqual(breaker.state, "open")
+
+    def test_should_require_min_calls(self):
+        breaker = self.breaker()
+        for x in [0, 0, 0]:
+            breaker.Try(inv, x)
+        self.assertEqual(breaker.state, "closed")
+
+    def test_window_should_forget_old_outcomes(self):
+        breaker = self.breaker(failure_rate=0.75)
+        for x in [0, 0, 1, 1, 1, 0]:
+            breaker.Try(inv, x)
+        self.assertEqual(breaker.state, "closed")
+
+    def test_open_circuit_should_fail_fast(self):
+        breaker = self.breaker()
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        calls = []
+        result = breaker.Try(calls.append, 1)
+        self.assertRaises(CircuitOpenError, result.get)
+        self.assertEqual(calls, [])
+        self.assertEqual(breaker.rejected, 1)
+
+    def test_half_open_success_should_close(self):
+        breaker = self.breaker()
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        self.clock.now = 10
+        self.assertEqual(breaker.state, "half-open")
+        self.assertEqual(breaker.Try(inv, 1), Success(1.0))
+        self.assertEqual(breaker.state, "closed")
+
+    def test_half_open_failure_should_open(self):
+        breaker = self.breaker()
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        self.clock.now = 10
+        self.assertTrue(breaker.Try(inv, 0).isFailure)
+        self.assertEqual(breaker.state, "open")
+        self.clock.now = 15
+        self.assertRaises(CircuitOpenError, breaker.Try(inv, 1).get)
+
+    def test_half_open_should_limit_probes(self):
+        breaker = self.breaker()
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        self.clock.now = 10
+        probe_started, release = threading.Event(), threading.Event()
+
+        def probe():
+            probe_started.set()
+            release.wait(1)
+
+        thread = threading.Thread(target=breaker.Try, args=(probe,))
+        thread.start()
+        probe_started.wait(1)
+        self.assertRaises(CircuitOpenError, breaker.Try(inv, 1).get)
+        release.set()
+        thread.join()
+        self.assertEqual(breaker.state, "closed")
+
+    def test_cancelled_probe_should_be_released(self):
+        breaker = self.breaker()
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        self.clock.now = 10
+
+        def interrupt():
+            raise KeyboardInterrupt()
+
+        self.assertRaises(KeyboardInterrupt, breaker.Try, interrupt)
+        self.assertEqual(breaker.Try(inv, 1), Success(1.0))
+
+    def test_stale_outcomes_should_be_ignored(self):
+        breaker = self.breaker(half_open_calls=1)
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(1)
+            return 1
+
+        thread = threading.Thread(target=breaker.Try, args=(slow,))
+        thread.start()
+        started.wait(1)
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        self.clock.now = 10
+        probe_started, probe_release = threading.Event(), threading.Event()
+
+        def probe():
+            probe_started.set()
+            probe_release.wait(1)
+            return 1 / 0
+
+        probe_thread = threading.Thread(target=breaker.Try, args=(probe,))
+        probe_thread.start()
+        probe_started.wait(1)
+        # The call admitted while closed neither closes the circuit
+        # nor frees the probe slot
+        release.set()
+        thread.join()
+        self.assertEqual(breaker.state, "half-open")
+        self.assertRaises(CircuitOpenError, breaker.Try(inv, 1).get)
+        probe_release.set()
+        probe_thread.join()
+        self.assertEqual(breaker.state, "open")
+
+    def test_rejections_should_share_failure(self):
+        breaker = self.breaker()
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        first = breaker.Try(inv, 1)
+        self.assertRaises(CircuitOpenError, first.get)
+        second = breaker.Try(inv, 1)
+        self.assertIs(second, first)
+        self.assertIsNone(second._v.__traceback__)
+        self.clock.now = 10
+        breaker.Try(inv, 0)
+        self.assertIsNot(breaker.Try(inv, 1), first)
+
+    def test_should_only_record_selected_exceptions(self):
+        breaker = self.breaker(record=(KeyError,))
+        for _ in range(4):
+            breaker.Try(inv, 0)
+        self.assertEqual(breaker.state, "closed")
+
+    def test_unhandled_should_be_recorded_and_raised(self):
+        breaker = self.breaker(window=1, min_calls=1)
+        Try_.set_unhandled([IndexError])
+        try:
+            self.assertRaises(IndexError, breaker.Try, getitem, [], 0)
+        finally:
+            Try_.set_unhandled()
+        self.assertEqual(breaker.state, "open")
+
+    def test_breaker_should_be_shared_by_curried_functions(self):
+        breaker = self.breaker()
+        try_inv = CurriedTry(inv, breaker=breaker)
+        try_abs = CurriedTry(abs, breaker=breaker)
+        for _ in range(4):
+            try_inv(0)
+        self.assertRaises(CircuitOpenError, try_abs(-1).get)
+
+    def test_async(self):
+        breaker = self.breaker()
+
+        async def ainv(x):
+            return 1 / x
+
+        async def main():
+            results = [await breaker.AsyncTry(ainv, 0) for _ in range(4)]
+            return results + [await breaker.AsyncTry(ainv, 1)]
+
+        results = asyncio.run(main())
+        self.assertTrue(all(r.isFailure for r in results))
+        self.assertIsInstance(results[-1]._v, CircuitOpenError)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, CircuitBreaker, failure_rate=0)
+        self.assertRaises(ValueError, CircuitBreaker, window=1, min_calls=2)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,164 @@
+import multiprocessing
+import pickle
+import unittest
+import pytest
+from tryingsnake import Try_, Try, Success, Failure, RemoteFailure
+from tryingsnake import codec
+
+
+def inv(x):
+    return 1 / x
+
+
+class Unpicklable(Exception):
+    def __init__(self):
+        super().__init__(multiprocessing.Lock())
+
+
+class CustomInit(Exception):
+    def __init__(self, a, b):
+        super().__init__(a)
+
+
+class CustomError(Exception):
+    pass
+
+
+class PickleTestCase(unittest.TestCase):
+    def roundtrip(self, t):
+        return pickle.loads(pickle.dumps(t))
+
+    def test_success(self):
+        self.assertEqual(self.roundtrip(Success([1, "a"])), Success([1, "a"]))
+
+    def test_failure_should_keep_stack(self):
+        failure = Try(inv, 0)
+        restored = self.roundtrip(failure)
+        self.assertEqual(restored, failure)
+        self.assertEqual(
+            [frame.name for frame in restored.stack],
+            [frame.name for frame in failure.stack],
+        )
+        self.assertIsNone(restored._v.__traceback__)
+
+    def test_should_respect_capture_policy(self):
+        with Try_.capture("none"):
+            failure = Try(inv, 0)
+        self.assertEqual(list(self.roundtrip(failure).stack), [])
+        with Try_.capture("summary"):
+            failure = Try(inv, 0)
+        self.assertEqual(len(self.roundtrip(failure).stack), 2)
+
+    def test_unpicklable_exception(self):
+        restored = self.roundtrip(Failure(Unpicklable()))
+        self.assertIsInstance(restored._v, RemoteFailure)
+        self.assertEqual(
+            restored._v.type_name, "tryingsnake.test.test_codec.Unpicklable"
+        )
+        self.assertEqual(self.roundtrip(restored), restored)
+
+    def test_exception_which_cannot_be_restored(self):
+        restored = self.roundtrip(Failure(CustomInit("a", "b")))
+        self.assertIsInstance(restored._v, RemoteFailure)
+        self.assertEqual(
+            restored._v.type_name, "tryingsnake.test.test_codec.CustomInit"
+        )
+
+    def test_should_not_mutate_original(self):
+        failure = Try(inv, 0)
+        pickle.dumps(failure)
+        self.assertIsNotNone(failure._v.__traceback__)
+
+
+class CodecTestCase(unittest.TestCase):
+    backend = "pickle"
+
+    def roundtrip(self, t):
+        return codec.loads(codec.dumps(t, self.backend), self.backend)
+
+    def test_success(self):
+        self.assertEqual(self.roundtrip(Success(1)), Success(1))
+        self.assertEqual(self.roundtrip(Success("a")), Success("a"))
+
+    def test_failure(self):
+        failure = Try(inv, 0)
+        restored = self.roundtrip(failure)
+        self.assertEqual(restored, failure)
+        self.assertEqual(len(restored.stack), len(failure.stack))
+
+    def test_custom_exception(self):
+        failure = Failure(KeyError("k"))
+        self.assertEqual(self.roundtrip(failure), failure)
+
+    def test_unpicklable_exception(self):
+        restored = self.roundtrip(Failure(Unpicklable()))
+        self.assertIsInstance(restored._v, RemoteFailure)
+        self.assertTrue(restored._v.args[1].startswith("<Lock"))
+
+    def test_batch(self):
+        ts = [Success(1), Try(inv, 0), Failure(Unpicklable()), Success(None)]
+        data = codec.dumps_batch(iter(ts), self.backend)
+        restored = codec.loads_batch(data, self.backend)
+        self.assertEqual(restored[:2] + restored[3:], ts[:2] + ts[3:])
+        self.assertIsInstance(restored[2]._v, RemoteFailure)
+
+    def test_failure_without_frames(self):
+        restored = self.roundtrip(Failure(ValueError("e")))
+        self.assertIsNone(restored._tb)
+        with self.assertRaises(ValueError) as cm:
+            restored.get()
+        self.assertFalse(getattr(cm.exception, "__notes__", None))
+
+    def test_invalid_input(self):
+        self.assertRaises(TypeError, codec.dumps, 1, self.backend)
+        self.assertRaises(ValueError, codec.dumps, Success(1), "xml")
+
+
+class MsgpackCodecTestCase(CodecTestCase):
+    backend = "msgpack"
+
+    def setUp(self):
+        pytest.importorskip("msgpack")
+
+    def test_unknown_type(self):
+        data = codec.dumps(Failure(CustomInit("a", "b")), self.backend)
+        restored = codec.loads(data, self.backend)
+        self.assertEqual(
+            restored,
+            Failure(RemoteFailure("tryingsnake.test.test_codec.CustomInit", "'a'")),
+        )
+
+    def test_types_should_be_allowed_explicitly(self):
+        data = codec.dumps(Failure(CustomError("a")), self.backend)
+        restored = codec.loads(data, self.backend)
+        self.assertIsInstance(restored._v, RemoteFailure)
+        restored = codec.loads(data, self.backend, types=[CustomError])
+        self.assertIsInstance(restored._v, CustomError)
+        [restored] = codec.loads_batch(
+            codec.dumps_batch([Failure(CustomError("a"))], self.backend),
+            self.backend,
+            types=[CustomError],
+        )
+        self.assertEqual(restored._v.args, ("a",))
+
+    def test_should_not_import_modules(self):
+        import msgpack
+        import sys
+
+        data = msgpack.packb([1, "antigravity.X", [], True, []])
+        sys.modules.pop("antigravity", None)
+        restored = codec.loads(data, self.backend)
+        self.assertNotIn("antigravity", sys.modules)
+        self.assertEqual(restored, Failure(RemoteFailure("antigravity.X")))
+        data = msgpack.packb([1, "print", [], True, []])
+        self.assertIsInstance(codec.loads(data, self.backend)._v, RemoteFailure)
+
+    def test_unsupported_args(self):
+        restored = self.roundtrip(Failure(ValueError(object)))
+        self.assertEqual(
+            restored, Failure(RemoteFailure("ValueError", "<class 'object'>"))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -1,7 +1,11 @@
 from operator import add, truediv
+import inspect
+import typing
 import unittest
 import pytest
-from tryingsnake.curried import Try as CurriedTry
+from tryingsnake import Try_, Success, Failure
+from tryingsnake.curried import Try as CurriedTry, try_
+from tryingsnake.metrics import MetricsRegistry
 
 
 class CurriedTryTestCase(unittest.TestCase):
@@ -27,6 +31,125 @@ class CurriedTryTestCase(unittest.TestCase):
         try_f = CurriedTry(f)
         self.assertTrue(try_f(a=1, b=3).isSuccess)
 
+    def test_can_set_capture_policy_per_call(self):
+        try_trudiv = CurriedTry(truediv, capture="none")
+        self.assertIsNone(try_trudiv(1, 0)._v.__traceback__)
+        self.assertIsNotNone(CurriedTry(truediv)(1, 0)._v.__traceback__)
+
+    def test_invalid_capture_policy_should_be_rejected(self):
+        self.assertRaises(ValueError, CurriedTry, truediv, capture="partial")
+
+
+class TryDecoratorTestCase(unittest.TestCase):
+    def test_should_wrap_results(self):
+        @try_
+        def div(a, b):
+            return a / b
+
+        self.assertEqual(div(1, 2), Success(0.5))
+        self.assertEqual(div(b=2, a=1), Success(0.5))
+        self.assertIsInstance(div(1, 0)._v, ZeroDivisionError)
+
+    def test_should_keep_signature_and_metadata(self):
+        def f(a: int, /, b: str = "b", *args: int, c: float, d=None, **kwargs) -> str:
+            """Docstring"""
+            return "{0} {1} {2} {3} {4} {5}".format(a, b, args, c, d, kwargs)
+
+        g = try_(f)
+        self.assertEqual(inspect.signature(g), inspect.signature(f))
+        self.assertEqual(typing.get_type_hints(g), typing.get_type_hints(f))
+        self.assertEqual((g.__name__, g.__doc__), ("f", "Docstring"))
+        self.assertEqual(
+            g(1, "x", 2, 3, c=4.0, e=5), Success(f(1, "x", 2, 3, c=4.0, e=5))
+        )
+        self.assertEqual(g(1, c=0), Success(f(1, c=0)))
+
+    def test_keyword_only_and_mutable_defaults(self):
+        @try_
+        def f(*, xs=[]):
+            xs.append(1)
+            return xs
+
+        self.assertEqual(f(), Success([1]))
+        self.assertEqual(f(), Success([1, 1]))
+
+    def test_callables_without_signature(self):
+        self.assertEqual(try_(int)("1"), Success(1))
+        self.assertTrue(try_(int)("a").isFailure)
+
+    def test_parameters_clashing_with_wrapper_names(self):
+        @try_
+        def f(_try_f):
+            return _try_f
+
+        self.assertEqual(f(1), Success(1))
+
+    def test_methods(self):
+        class A:
+            @try_
+            def inv(self, x):
+                return 1 / x
+
+        self.assertEqual(A().inv(2), Success(0.5))
+        self.assertTrue(A().inv(0).isFailure)
+
+    def test_unhandled_should_be_fixed_on_decoration(self):
+        def f():
+            raise KeyError()
+
+        with Try_.unhandled(KeyError):
+            g = try_(f)
+        h = try_(f)
+        self.assertRaises(KeyError, g)
+        with Try_.unhandled(KeyError):
+            self.assertTrue(h().isFailure)
+        self.assertRaises(KeyError, try_(unhandled=[KeyError])(f))
+
+    def test_dynamic_unhandled(self):
+        @try_(dynamic=True)
+        def f():
+            raise KeyError()
+
+        self.assertTrue(f().isFailure)
+        with Try_.unhandled(KeyError):
+            self.assertRaises(KeyError, f)
+        self.assertRaises(ValueError, try_, f, unhandled=[KeyError], dynamic=True)
+
+    def test_generator_functions(self):
+        @try_(unhandled=[KeyError])
+        def items(n):
+            yield from range(n)
+            raise ValueError("e")
+
+        self.assertEqual(
+            list(items(2)), [Success(0), Success(1), Failure(ValueError("e"))]
+        )
+
+        @try_(unhandled=[KeyError])
+        def fail():
+            yield 1
+            raise KeyError()
+
+        self.assertRaises(KeyError, list, fail())
+
+        @try_(dynamic=True)
+        def dynamic():
+            yield 1
+            raise KeyError()
+
+        with Try_.unhandled(KeyError):
+            self.assertRaises(KeyError, list, dynamic())
+
+    def test_should_be_observed(self):
+        @try_
+        def inv(x):
+            return 1 / x
+
+        with MetricsRegistry() as registry:
+            inv(0)
+        [s] = registry.snapshot()["series"]
+        self.assertEqual((s["stage"], s["failures"]), ("Try", 1))
+
 
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
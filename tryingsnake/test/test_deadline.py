@@ -0,0 +1,94 @@
+import asyncio
+from operator import getitem
+import time
+import unittest
+import pytest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.curried import Try as CurriedTry
+from tryingsnake.deadline import Deadline, with_deadline
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def inv(x):
+    return 1 / x
+
+
+class DeadlineTestCase(unittest.TestCase):
+    def test_should_return_result_within_deadline(self):
+        self.assertEqual(with_deadline(1, inv, 2), Success(0.5))
+        self.assertEqual(with_deadline(1, inv, 0), Try(inv, 0))
+
+    def test_should_fail_with_timeout_error(self):
+        result = with_deadline(0.01, time.sleep, 1)
+        self.assertTrue(result.isFailure)
+        self.assertRaises(TimeoutError, result.get)
+
+    def test_expired_deadline_should_fail_without_calling_f(self):
+        clock = FakeClock()
+        d = Deadline(1, clock=clock)
+        self.assertEqual(d.remaining(), 1)
+        clock.now = 2
+        self.assertTrue(d.expired)
+        self.assertEqual(d.remaining(), 0)
+        calls = []
+        self.assertRaises(TimeoutError, d.Try(calls.append, 1).get)
+        self.assertEqual(calls, [])
+
+    def test_chain_should_share_deadline(self):
+        d = Deadline(0.1)
+        result = d.Try(time.sleep, 0.2).recoverWith(d.wrap(lambda e: 1))
+        self.assertRaises(TimeoutError, result.get)
+
+    def test_unhandled_should_be_raised(self):
+        Try_.set_unhandled([IndexError])
+        try:
+            self.assertRaises(IndexError, with_deadline, 1, getitem, [], 0)
+        finally:
+            Try_.set_unhandled()
+
+    def test_context_should_be_propagated_to_thread(self):
+        with Try_.capture("none"):
+            result = with_deadline(1, inv, 0)
+        self.assertIsNone(result._v.__traceback__)
+
+    def test_coroutine_should_be_cancelled(self):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def main():
+            return await Deadline(0.01).AsyncTry(slow)
+
+        self.assertRaises(TimeoutError, asyncio.run(main()).get)
+        self.assertEqual(cancelled, [True])
+
+    def test_coroutine_within_deadline(self):
+        async def ainv(x):
+            return 1 / x
+
+        async def main():
+            d = Deadline(1)
+            return await d.AsyncTry(ainv, 2).flatMap(lambda x: d.AsyncTry(ainv, x))
+
+        self.assertEqual(asyncio.run(main()), Success(2.0))
+
+    def test_curried_timeout(self):
+        try_sleep = CurriedTry(time.sleep, timeout=0.01)
+        self.assertRaises(TimeoutError, try_sleep(1).get)
+        self.assertEqual(CurriedTry(inv, timeout=1)(2), Success(0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
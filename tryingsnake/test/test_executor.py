@@ -0,0 +1,95 @@
+from operator import getitem, truediv
+import unittest
+import pytest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.executor import ThreadTryExecutor, ProcessTryExecutor, TryExecutor
+
+
+def inv(x):
+    return 1 / x
+
+
+class ThreadTryExecutorTestCase(unittest.TestCase):
+    executor_cls = ThreadTryExecutor
+
+    def test_submit_should_return_try(self):
+        with self.executor_cls(2) as ex:
+            self.assertEqual(ex.submit(truediv, 1, 2).result(), Success(0.5))
+            self.assertTrue(ex.submit(truediv, 1, 0).result().isFailure)
+
+    def test_map_should_match_try(self):
+        xs = [1, 0, 2, "a"] * 5
+        for chunksize in [1, 3]:
+            with self.executor_cls(2) as ex:
+                self.assertEqual(
+                    list(ex.map(inv, xs, chunksize=chunksize)),
+                    [Try(inv, x) for x in xs],
+                )
+
+    def test_map_with_multiple_iterables(self):
+        with self.executor_cls(2) as ex:
+            self.assertEqual(list(ex.map(truediv, [1, 2], [2, 4])), [Success(0.5)] * 2)
+
+    def test_unordered_map(self):
+        xs = list(range(-5, 5))
+        with self.executor_cls(2) as ex:
+            result = list(ex.map(inv, xs, chunksize=2, ordered=False))
+        self.assertEqual(len(result), len(xs))
+        self.assertEqual(sum(t.isFailure for t in result), 1)
+
+    def test_map_should_reject_invalid_chunksize(self):
+        with self.executor_cls(1) as ex:
+            self.assertRaises(ValueError, ex.map, inv, [1], chunksize=0)
+
+    def test_as_completed(self):
+        with self.executor_cls(2) as ex:
+            fs = [ex.submit(inv, x) for x in [1, 0]]
+            result = list(TryExecutor.as_completed(fs))
+        self.assertEqual(sorted(t.isSuccess for t in result), [False, True])
+
+    def test_unhandled_should_be_raised(self):
+        Try_.set_unhandled([IndexError])
+        try:
+            with self.executor_cls(1) as ex:
+                with pytest.raises(IndexError):
+                    ex.submit(getitem, [], 0).result()
+                with pytest.raises(IndexError):
+                    list(ex.map(getitem, [[]], [0]))
+        finally:
+            Try_.set_unhandled()
+
+    def test_unhandled_scope_should_be_propagated(self):
+        with self.executor_cls(1) as ex:
+            with Try_.unhandled(IndexError):
+                with pytest.raises(IndexError):
+                    ex.submit(getitem, [], 0).result()
+                with pytest.raises(IndexError):
+                    list(ex.map(getitem, [[]], [0], chunksize=2))
+
+    def test_unhandled_should_follow_submission_scope(self):
+        with self.executor_cls(1) as ex:
+            with Try_.unhandled(IndexError):
+                it = ex.map(getitem, [[]], [0])
+                fs = [ex.submit(getitem, [], 0)]
+            with pytest.raises(IndexError):
+                list(it)
+            with pytest.raises(IndexError):
+                list(TryExecutor.as_completed(fs))
+            fs = [ex.submit(getitem, [], 0)]
+            with Try_.unhandled(IndexError):
+                self.assertTrue(next(TryExecutor.as_completed(fs)).isFailure)
+
+
+class ProcessTryExecutorTestCase(ThreadTryExecutorTestCase):
+    executor_cls = ProcessTryExecutor
+
+    def test_executor_errors_should_be_converted_to_failure(self):
+        with self.executor_cls(1) as ex:
+            fs = [ex.submit(lambda x: x, 1)]
+            (result,) = TryExecutor.as_completed(fs)
+            self.assertTrue(result.isFailure)
+            self.assertTrue(all(t.isFailure for t in ex.map(lambda x: x, [1, 2])))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
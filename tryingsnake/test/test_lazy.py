@@ -0,0 +1,125 @@
+import threading
+import time
+import unittest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.lazy import LazyTry
+
+
+class Counter:
+    def __init__(self, value=1, delay=0):
+        self.calls = 0
+        self.value = value
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return 1 / self.value
+
+
+class LazyTryTestCase(unittest.TestCase):
+    def test_should_defer_evaluation(self):
+        f = Counter()
+        t = LazyTry(f)
+        self.assertFalse(t.evaluated)
+        self.assertEqual(f.calls, 0)
+        self.assertEqual(repr(t), "LazyTry(<pending>)")
+        self.assertEqual(t.get(), 1.0)
+        self.assertTrue(t.evaluated)
+        self.assertEqual(repr(t), "LazyTry(Success(1.0))")
+
+    def test_should_memoize_outcome(self):
+        f = Counter(0)
+        t = LazyTry(f)
+        self.assertTrue(t.isFailure)
+        self.assertIs(t.force(), t.force())
+        self.assertEqual(f.calls, 1)
+
+    def test_should_evaluate_once_across_threads(self):
+        f = Counter(delay=0.05)
+        t = LazyTry(f)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(t.force())) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(f.calls, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_should_match_eager_results(self):
+        for x in [0, 1, 2]:
+            lazy = (
+                LazyTry(lambda: 1 / x)
+                .map(lambda v: v * 2)
+                .filter(lambda v: v > 1)
+                .flatMap(lambda v: LazyTry(lambda: v + 1))
+                .recover(lambda e: -1.0)
+            )
+            eager = (
+                Try(lambda: 1 / x)
+                .map(lambda v: v * 2)
+                .filter(lambda v: v > 1)
+                .flatMap(lambda v: Try(lambda: v + 1))
+                .recover(lambda e: -1.0)
+            )
+            self.assertEqual(lazy, eager)
+
+    def test_chains_should_be_deferred(self):
+        f = Counter()
+        t = LazyTry(f).map(str).recoverWith(lambda e: Success("x")).failed()
+        self.assertEqual(f.calls, 0)
+        self.assertTrue(t.isFailure)
+        self.assertEqual(f.calls, 1)
+
+    def test_unhandled_should_not_be_memoized(self):
+        f = Counter(0)
+        t = LazyTry(f)
+        with Try_.unhandled(ZeroDivisionError):
+            self.assertRaises(ZeroDivisionError, t.force)
+        self.assertFalse(t.evaluated)
+        self.assertTrue(t.isFailure)
+
+    def test_recursive_force_should_fail(self):
+        t = LazyTry(lambda: t.force().get())
+        result = t.force()
+        self.assertIsInstance(result._v, RuntimeError)
+        self.assertEqual(str(result._v), "recursive force")
+        self.assertIs(t.force(), result)
+        t = LazyTry(int, "1")
+        chained = t.flatMap(lambda v: chained)
+        self.assertIsInstance(chained.force()._v, RuntimeError)
+
+    def test_or_else_should_be_eager(self):
+        f = Counter()
+        self.assertEqual(LazyTry(f).orElse(Success(0)), Success(1.0))
+        self.assertEqual(f.calls, 1)
+
+    def test_lazy_fallbacks(self):
+        f = Counter()
+        self.assertEqual(LazyTry(int, "1").getOrElseLazy(f), 1)
+        self.assertEqual(LazyTry(int, "1").orElseLazy(lambda: LazyTry(f)), Success(1))
+        self.assertEqual(f.calls, 0)
+        self.assertEqual(LazyTry(int, "a").getOrElseLazy(f), 1.0)
+        self.assertEqual(LazyTry(int, "a").orElseLazy(lambda: LazyTry(f)).get(), 1.0)
+        self.assertEqual(f.calls, 2)
+
+
+class LazyFallbackTestCase(unittest.TestCase):
+    def test_success_should_not_evaluate_fallback(self):
+        f = Counter()
+        self.assertEqual(Success(0).getOrElseLazy(f), 0)
+        self.assertEqual(Success(0).orElseLazy(lambda: Try(f)), Success(0))
+        self.assertEqual(f.calls, 0)
+
+    def test_failure_should_evaluate_fallback(self):
+        failure = Failure(ValueError())
+        self.assertEqual(failure.getOrElseLazy(lambda: 0), 0)
+        self.assertEqual(failure.orElseLazy(lambda: Success(0)), Success(0))
+        self.assertRaises(TypeError, failure.orElseLazy, lambda: 0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
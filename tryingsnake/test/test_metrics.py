@@ -0,0 +1,150 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.curried import Try as CurriedTry
+from tryingsnake.metrics import MetricsRegistry, DEFAULT_BUCKETS
+import tryingsnake
+
+
+def inv(x):
+    return 1 / x
+
+
+def series(registry, stage, function="tryingsnake.test.test_metrics.inv"):
+    for s in registry.snapshot()["series"]:
+        if s["stage"] == stage and s["function"] == function:
+            return s
+    raise KeyError((stage, function))
+
+
+class MetricsRegistryTestCase(unittest.TestCase):
+    def test_should_record_try_outcomes(self):
+        with MetricsRegistry() as registry:
+            Try(inv, 1)
+            Try(inv, 0)
+            Try(inv, 0)
+        s = series(registry, "Try")
+        self.assertEqual((s["successes"], s["failures"]), (1, 2))
+        self.assertEqual(s["exceptions"], {"ZeroDivisionError": 2})
+
+    def test_should_record_combinators(self):
+        with MetricsRegistry() as registry:
+            Success(1).map(inv)
+            Success(0).flatMap(lambda x: Try(inv, x))
+            Success(0).filter(bool)
+            Failure(ValueError()).recover(lambda e: inv(0))
+            Failure(ValueError()).recoverWith(lambda e: Success(1))
+        stages = {
+            s["stage"]: (s["successes"], s["failures"])
+            for s in registry.snapshot()["series"]
+        }
+        self.assertEqual(
+            stages,
+            {
+                "map": (1, 0),
+                "Try": (0, 1),
+                "flatMap": (0, 1),
+                "filter": (1, 0),
+                "recover": (0, 1),
+                "recoverWith": (1, 0),
+            },
+        )
+
+    def test_combinators_should_be_recorded_once(self):
+        with MetricsRegistry() as registry:
+            Success(1).map(inv)
+        self.assertEqual(len(registry.snapshot()["series"]), 1)
+
+    def test_should_record_curried(self):
+        try_inv = CurriedTry(inv)
+        with MetricsRegistry() as registry:
+            try_inv(0)
+        self.assertEqual(series(registry, "Try")["failures"], 1)
+
+    def test_filter_message_should_not_change(self):
+        with MetricsRegistry():
+            failure = Success(0).filter(bool)
+        self.assertEqual(failure, Success(0).filter(bool))
+
+    def test_should_not_record_when_disabled(self):
+        registry = MetricsRegistry().enable()
+        registry.disable()
+        Try(inv, 1)
+        self.assertEqual(registry.snapshot()["series"], [])
+        self.assertEqual(tryingsnake._observers, ())
+
+    def test_unhandled_should_be_recorded_and_raised(self):
+        with MetricsRegistry() as registry:
+            with Try_.unhandled(ZeroDivisionError):
+                self.assertRaises(ZeroDivisionError, Try, inv, 0)
+        self.assertEqual(series(registry, "Try")["failures"], 1)
+
+    def test_sampling(self):
+        draws = iter([0.1, 0.9, 0.1, 0.9])
+        with MetricsRegistry(sample=0.5, random=lambda: next(draws)) as registry:
+            for _ in range(4):
+                Try(inv, 1)
+        self.assertEqual(series(registry, "Try")["successes"], 2)
+        self.assertRaises(ValueError, MetricsRegistry, sample=0)
+
+    def test_latency_histogram(self):
+        with MetricsRegistry(buckets=DEFAULT_BUCKETS) as registry:
+            Try(inv, 1)
+            Try(inv, 2)
+        latency = series(registry, "Try")["latency"]
+        self.assertEqual(sum(latency["counts"]), 2)
+        self.assertEqual(len(latency["counts"]), len(DEFAULT_BUCKETS) + 1)
+        text = registry.to_prometheus()
+        self.assertIn('le="+Inf"} 2', text)
+        self.assertIn("tryingsnake_call_duration_seconds_count{", text)
+
+    def test_call_sites(self):
+        with MetricsRegistry(call_sites=True) as registry:
+            Try(inv, 1)
+        site = series(registry, "Try")["site"]
+        self.assertTrue(site.startswith(__file__.rstrip("c")))
+
+    def test_should_be_thread_safe(self):
+        with MetricsRegistry() as registry:
+            threads = [
+                threading.Thread(target=lambda: [Try(inv, 1) for _ in range(500)])
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(series(registry, "Try")["successes"], 2000)
+
+    def test_exporters(self):
+        with MetricsRegistry() as registry:
+            Try(inv, 0)
+        self.assertEqual(json.loads(registry.to_json()), registry.snapshot())
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "metrics.prom")
+            registry.write(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), registry.to_prometheus())
+            registry.write(path, format="json")
+            with open(path) as f:
+                self.assertEqual(json.load(f), registry.snapshot())
+            self.assertRaises(ValueError, registry.write, path, format="xml")
+            self.assertEqual(os.listdir(d), ["metrics.prom"])
+
+    def test_label_values_should_be_escaped(self):
+        registry = MetricsRegistry()
+        f = lambda: None  # noqa: E731
+        f.__qualname__ = 'a"b\\c'
+        with registry:
+            Try(f)
+        self.assertIn(
+            'function="tryingsnake.test.test_metrics.a\\"b\\\\c"',
+            registry.to_prometheus(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
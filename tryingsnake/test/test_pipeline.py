@@ -0,0 +1,101 @@
+from operator import truediv
+import unittest
+import pytest
+from tryingsnake import Try, Success, Failure
+from tryingsnake.pipeline import TryPipeline
+
+
+def inc(x):
+    return x + 1
+
+
+def inv(x):
+    return 1 / x
+
+
+class PipelineTestCase(unittest.TestCase):
+    def assertSameAsEager(self, pipeline, eager, inputs):
+        for x in inputs:
+            self.assertEqual(pipeline(x), eager(Success(x)))
+            self.assertEqual(pipeline.apply(Success(x)), eager(Success(x)))
+
+    def test_map_chain_should_match_eager(self):
+        self.assertSameAsEager(
+            TryPipeline().map(inc).map(inv),
+            lambda t: t.map(inc).map(inv),
+            [1, -1, "a"],
+        )
+
+    def test_flatmap_should_match_eager(self):
+        self.assertSameAsEager(
+            TryPipeline().flatMap(lambda x: Try(truediv, 1, x)).map(inc),
+            lambda t: t.flatMap(lambda x: Try(truediv, 1, x)).map(inc),
+            [1, 0, None],
+        )
+
+    def test_filter_should_match_eager(self):
+        self.assertSameAsEager(
+            TryPipeline().filter(lambda x: x > 0, ValueError, "neg").map(inc),
+            lambda t: t.filter(lambda x: x > 0, ValueError, "neg").map(inc),
+            [1, -1],
+        )
+
+    def test_recover_should_match_eager(self):
+        self.assertSameAsEager(
+            TryPipeline().map(inv).recover(lambda e: 0).map(inc),
+            lambda t: t.map(inv).recover(lambda e: 0).map(inc),
+            [1, 0],
+        )
+
+    def test_recover_with_should_match_eager(self):
+        self.assertSameAsEager(
+            TryPipeline().map(inv).recoverWith(lambda e: Success(0)).recover(str),
+            lambda t: t.map(inv).recoverWith(lambda e: Success(0)).recover(str),
+            [1, 0],
+        )
+
+    def test_failing_recover_should_match_eager(self):
+        self.assertSameAsEager(
+            TryPipeline().map(inv).recover(inv).recover(lambda e: type(e).__name__),
+            lambda t: t.map(inv).recover(inv).recover(lambda e: type(e).__name__),
+            [0],
+        )
+
+    def test_apply_on_failure(self):
+        e = Exception("e")
+        self.assertEqual(TryPipeline().map(inc).apply(Failure(e)), Failure(e))
+        self.assertTrue(TryPipeline().recover(str).apply(Failure(e)).isSuccess)
+
+    def test_apply_should_fail_on_non_try(self):
+        self.assertRaises(TypeError, TryPipeline().apply, 1)
+
+    def test_filter_predicate_errors_should_escape(self):
+        with pytest.raises(ZeroDivisionError):
+            TryPipeline().filter(lambda x: 1 / 0)(1)
+
+    def test_flatmap_should_fail_if_f_doesnt_return_try(self):
+        self.assertRaises(TypeError, TryPipeline().flatMap(lambda x: x), 1)
+        self.assertRaises(TypeError, TryPipeline().map(inv).recoverWith(lambda e: e), 0)
+
+    def test_pipeline_is_immutable_and_reusable(self):
+        base = TryPipeline().map(inc)
+        extended = base.map(inc)
+        self.assertEqual(len(base), 1)
+        self.assertEqual(len(extended), 2)
+        self.assertEqual([base(i).get() for i in range(3)], [1, 2, 3])
+
+    def test_empty_pipeline_is_identity(self):
+        self.assertEqual(TryPipeline()(1), Success(1))
+
+    def test_unhandled_should_be_raised(self):
+        from tryingsnake import Try_
+
+        Try_.set_unhandled([ZeroDivisionError])
+        try:
+            self.assertRaises(ZeroDivisionError, TryPipeline().map(inv), 0)
+        finally:
+            Try_.set_unhandled()
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,139 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from tryingsnake import Try, Success, Failure
+from tryingsnake.curried import Try as CurriedTry
+from tryingsnake.metrics import MetricsRegistry
+from tryingsnake.profile import Profiler
+import tryingsnake
+
+
+def inv(x):
+    return 1 / x
+
+
+def slow(x):
+    time.sleep(0.01)
+    return x
+
+
+def stage(profiler, stage, function="tryingsnake.test.test_profile.inv"):
+    for s in profiler.stats():
+        if s["stage"] == stage and s["function"] == function:
+            return s
+    raise KeyError((stage, function))
+
+
+def collapsed(profiler):
+    return dict(
+        (frames, int(value))
+        for frames, value in (
+            line.rsplit(" ", 1) for line in profiler.to_collapsed().splitlines()
+        )
+    )
+
+
+class ProfilerTestCase(unittest.TestCase):
+    def test_should_aggregate_across_executions(self):
+        with Profiler() as profiler:
+            for x in [1, 0, 2]:
+                Success(x).map(inv).recover(lambda e: 0)
+        s = stage(profiler, "map")
+        self.assertEqual((s["calls"], s["failures"]), (3, 1))
+        self.assertEqual(len(profiler.stats()), 2)
+
+    def test_should_blame_slow_stage(self):
+        with Profiler() as profiler:
+            Success(1).map(inv).map(slow).flatMap(lambda x: Success(x))
+        slowest = profiler.stats()[0]
+        self.assertEqual(
+            (slowest["stage"], slowest["function"]),
+            ("map", "tryingsnake.test.test_profile.slow"),
+        )
+        self.assertGreaterEqual(slowest["time"], 0.01)
+
+    def test_flat_stages_should_count_returned_failures(self):
+        with Profiler() as profiler:
+            Success(0).flatMap(lambda x: Try(inv, x))
+            Failure(ValueError()).recoverWith(lambda e: Failure(e))
+        for s in profiler.stats():
+            self.assertEqual((s["calls"], s["failures"]), (1, 1))
+
+    def test_should_profile_curried(self):
+        try_inv = CurriedTry(inv)
+        with Profiler() as profiler:
+            try_inv(0)
+            try_inv(1)
+        s = stage(profiler, "Try")
+        self.assertEqual((s["calls"], s["failures"]), (2, 1))
+
+    def test_collapsed_stacks(self):
+        def outer(x):
+            return Try(slow, x)
+
+        with Profiler() as profiler:
+            Success(1).flatMap(outer)
+        stacks = collapsed(profiler)
+        nested = (
+            "flatMap:tryingsnake.test.test_profile.ProfilerTestCase."
+            "test_collapsed_stacks.<locals>.outer;"
+            "Try:tryingsnake.test.test_profile.slow"
+        )
+        self.assertEqual(len(stacks), 2)
+        # Nested time is attributed to the inner frame only
+        self.assertGreaterEqual(stacks[nested], 10_000_000)
+        self.assertLess(stacks[nested.split(";")[0]], stacks[nested])
+
+    def test_stacks_should_be_per_thread(self):
+        def nested(x):
+            return Success(x).flatMap(lambda x: Try(inv, x))
+
+        with Profiler() as profiler:
+            threads = [
+                threading.Thread(target=lambda: [nested(1) for _ in range(100)])
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(stage(profiler, "Try")["calls"], 400)
+        self.assertEqual(len(collapsed(profiler)), 2)
+
+    def test_should_not_profile_when_disabled(self):
+        profiler = Profiler()
+        with profiler:
+            pass
+        Try(inv, 1)
+        self.assertEqual(profiler.stats(), [])
+        self.assertEqual(tryingsnake._observers, ())
+
+    def test_should_work_with_metrics(self):
+        with Profiler() as profiler, MetricsRegistry() as registry:
+            Success(1).map(inv)
+        self.assertEqual(stage(profiler, "map")["calls"], 1)
+        [s] = registry.snapshot()["series"]
+        self.assertEqual(s["function"], "tryingsnake.test.test_profile.inv")
+        self.assertEqual(s["successes"], 1)
+
+    def test_reset(self):
+        with Profiler() as profiler:
+            Try(inv, 1)
+        profiler.reset()
+        self.assertEqual(profiler.stats(), [])
+        self.assertEqual(profiler.to_collapsed(), "")
+
+    def test_write(self):
+        with Profiler() as profiler:
+            Try(inv, 1)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "stacks.txt")
+            profiler.write(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), profiler.to_collapsed())
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,88 @@
+import unittest
+from tryingsnake import Try, Success, Failure
+from tryingsnake.recovery import RecoveryTable
+
+
+class NotFound(KeyError):
+    pass
+
+
+class RecoveryTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self.table = RecoveryTable(
+            {
+                KeyError: lambda e: "key",
+                (OSError, TimeoutError): lambda e: "io",
+                Exception: lambda e: "other",
+            }
+        )
+
+    def test_should_resolve_nearest_class_in_mro(self):
+        self.assertEqual(Failure(NotFound()).recoverBy(self.table), Success("key"))
+        self.assertEqual(Failure(TimeoutError()).recoverBy(self.table), Success("io"))
+        self.assertEqual(
+            Failure(FileNotFoundError()).recoverBy(self.table), Success("io")
+        )
+        self.assertEqual(Failure(ValueError()).recoverBy(self.table), Success("other"))
+
+    def test_should_cache_resolution(self):
+        self.table.resolve(NotFound)
+        self.assertIn(NotFound, self.table._cache)
+        self.assertIs(self.table.resolve(NotFound), self.table._handlers[KeyError])
+
+    def test_modified_dict_should_be_used(self):
+        handlers = {KeyError: repr}
+        self.assertEqual(
+            Failure(KeyError("a")).recoverBy(handlers), Success("KeyError('a')")
+        )
+        handlers[KeyError] = str
+        self.assertEqual(Failure(KeyError("a")).recoverBy(handlers), Success("'a'"))
+
+    def test_unmatched_failure_should_be_returned(self):
+        failure = Failure(ValueError())
+        self.assertIs(failure.recoverBy({KeyError: repr}), failure)
+        self.assertIsNone(RecoveryTable({KeyError: repr}).resolve(ValueError))
+
+    def test_success_should_be_returned(self):
+        success = Success(1)
+        self.assertIs(success.recoverBy(self.table), success)
+
+    def test_should_match_recover(self):
+        def handler(e):
+            raise ValueError("again")
+
+        failure = Failure(KeyError("a"))
+        self.assertEqual(
+            failure.recoverBy({KeyError: handler}), failure.recover(handler)
+        )
+        self.assertEqual(self.table.recover(failure), Success("key"))
+
+    def test_invalid_handlers(self):
+        self.assertRaises(TypeError, RecoveryTable, {int: repr})
+        self.assertRaises(TypeError, RecoveryTable, {"KeyError": repr})
+        self.assertRaises(ValueError, RecoveryTable, {KeyError: repr, (KeyError,): str})
+
+    def test_route(self):
+        keys, ios, values, unmatched = [], [], [], []
+        table = RecoveryTable({KeyError: keys.append, OSError: ios.append})
+        ts = iter(
+            [
+                Success(1),
+                Failure(NotFound("a")),
+                Try(open, "/nonexistent"),
+                Failure(ValueError("b")),
+                Success(2),
+            ]
+        )
+        n = table.route(ts, on_success=values.append, on_unmatched=unmatched.append)
+        self.assertEqual(n, 1)
+        self.assertEqual(values, [1, 2])
+        self.assertEqual([e.args for e in keys], [("a",)])
+        self.assertIsInstance(ios[0], FileNotFoundError)
+        self.assertEqual([type(e) for e in unmatched], [ValueError])
+        self.assertEqual(table.route([Failure(ValueError())]), 1)
+        self.assertRaises(TypeError, table.route, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
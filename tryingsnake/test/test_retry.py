@@ -0,0 +1,208 @@
+from operator import getitem
+import threading
+import time
+import unittest
+import pytest
+from tryingsnake import Try_, Success, Failure
+from tryingsnake.retry import RetryPolicy, Hedge, RetryResult, retry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def time_out(self, future, timeout):
+        # Hedge wait which never sees the first attempt complete in time
+        self.sleep(timeout)
+        return False
+
+    def complete(self, future, timeout):
+        # Hedge wait which always sees the first attempt complete in time
+        future.result()
+        self.now += timeout / 2
+        return True
+
+
+def flaky(outcomes):
+    outcomes = iter(outcomes)
+
+    def f():
+        x = next(outcomes)
+        if isinstance(x, Exception):
+            raise x
+        return x
+
+    return f
+
+
+class RetryPolicyTestCase(unittest.TestCase):
+    def policy(self, **kwargs):
+        self.clock = FakeClock()
+        kwargs.setdefault("jitter", 0)
+        return RetryPolicy(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_should_retry_until_success(self):
+        policy = self.policy(max_attempts=5, delay=1)
+        result = policy.Try(flaky([ValueError(), ValueError(), 1]))
+        self.assertEqual(result, RetryResult(Success(1), 3, 3.0))
+        self.assertEqual(self.clock.sleeps, [1.0, 2.0])
+
+    def test_should_stop_after_max_attempts(self):
+        policy = self.policy(max_attempts=2, delay=1)
+        result = policy.Try(flaky([ValueError("a"), ValueError("b"), 1]))
+        self.assertEqual(result.result, Failure(ValueError("b")))
+        self.assertEqual(result.attempts, 2)
+
+    def test_should_respect_max_time(self):
+        policy = self.policy(max_attempts=10, delay=1, max_time=4)
+        result = policy.Try(flaky([ValueError()] * 10))
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(self.clock.sleeps, [1.0, 2.0])
+
+    def test_should_respect_max_delay(self):
+        policy = self.policy(max_attempts=4, delay=1, backoff=10, max_delay=5)
+        self.assertEqual(list(policy.delays()), [1.0, 5.0, 5.0])
+
+    def test_jitter(self):
+        policy = RetryPolicy(max_attempts=3, delay=1, jitter=0.5, random=lambda: 1.0)
+        self.assertEqual(list(policy.delays()), [0.5, 1.0])
+
+    def test_should_not_retry_other_exceptions(self):
+        policy = self.policy(retry_on=KeyError)
+        result = policy.Try(flaky([ValueError(), 1]))
+        self.assertEqual(result.attempts, 1)
+        self.assertTrue(result.result.isFailure)
+
+    def test_should_accept_predicate(self):
+        policy = self.policy(retry_on=lambda e: e.args == ("retry",))
+        result = policy.Try(flaky([ValueError("retry"), ValueError("stop"), 1]))
+        self.assertEqual(result.result, Failure(ValueError("stop")))
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, RetryPolicy, max_attempts=0)
+        self.assertRaises(ValueError, RetryPolicy, jitter=2)
+
+    def test_retry_function(self):
+        result = retry(RetryPolicy(delay=0), flaky([ValueError(), 1]))
+        self.assertEqual(result.result, Success(1))
+
+    def test_unhandled_should_be_raised(self):
+        Try_.set_unhandled([IndexError])
+        try:
+            self.assertRaises(IndexError, self.policy().Try, getitem, [], 0)
+        finally:
+            Try_.set_unhandled()
+
+
+class HedgeTestCase(unittest.TestCase):
+    def test_fast_call_should_not_be_hedged(self):
+        hedge = Hedge(delay=1)
+        result = hedge.Try(abs, -1)
+        self.assertEqual(result.result, Success(1))
+        self.assertEqual(result.attempts, 1)
+
+    def test_slow_call_should_be_hedged(self):
+        release = threading.Event()
+        calls = []
+
+        def f():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(1)
+                return "slow"
+            return "fast"
+
+        hedge = Hedge(delay=0.01)
+        try:
+            result = hedge.Try(f)
+        finally:
+            release.set()
+        self.assertEqual(result.result, Success("fast"))
+        self.assertEqual(result.attempts, 2)
+
+    def test_should_wait_for_success_if_first_outcome_failed(self):
+        calls = []
+
+        def f():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                return "slow"
+            raise ValueError()
+
+        result = Hedge(delay=0.01).Try(f)
+        self.assertEqual(result.result, Success("slow"))
+
+    def test_wait_should_decide_hedging(self):
+        clock = FakeClock()
+        release = threading.Event()
+        calls = []
+
+        def f():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(1)
+                return "slow"
+            return "fast"
+
+        with Hedge(delay=2, clock=clock, wait=clock.time_out) as hedge:
+            try:
+                result = hedge.Try(f)
+            finally:
+                release.set()
+        self.assertEqual(result, RetryResult(Success("fast"), 2, 2))
+        self.assertEqual(clock.sleeps, [2])
+        with Hedge(delay=2, clock=clock, wait=clock.complete) as hedge:
+            result = hedge.Try(f)
+        self.assertEqual(result, RetryResult(Success("fast"), 1, 1))
+
+    def test_context_manager_should_shut_down_executor(self):
+        with Hedge(delay=1) as hedge:
+            hedge.Try(abs, -1)
+        self.assertRaises(RuntimeError, hedge.Try, abs, -1)
+        hedge = Hedge(delay=1)
+        hedge.close()
+        self.assertRaises(RuntimeError, hedge.Try, abs, -1)
+
+    def test_threshold_should_follow_percentile(self):
+        clock = FakeClock()
+        hedge = Hedge(delay=1, percentile=0.5, min_samples=3, clock=clock)
+        self.assertEqual(hedge.threshold(), 1)
+        for latency in [0.1, 0.2, 0.3]:
+            hedge._observe(latency)
+        self.assertEqual(hedge.threshold(), 0.2)
+
+    def test_retry_with_hedge(self):
+        policy = RetryPolicy(delay=0, hedge=Hedge(delay=1))
+        result = policy.Try(flaky([ValueError(), 1]))
+        self.assertEqual(result.result, Success(1))
+        self.assertEqual(result.attempts, 2)
+
+    def test_retry_should_count_hedged_attempts(self):
+        calls = []
+
+        def f():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+            if len(calls) < 3:
+                raise ValueError()
+            return 1
+
+        policy = RetryPolicy(delay=0, hedge=Hedge(delay=0.01))
+        result = policy.Try(f)
+        self.assertEqual(result.result, Success(1))
+        self.assertEqual(result.attempts, len(calls))
+        self.assertEqual(result.attempts, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
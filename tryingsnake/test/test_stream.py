@@ -0,0 +1,82 @@
+from itertools import count, islice
+from operator import truediv
+import unittest
+import pytest
+from tryingsnake import Try, Success, Failure
+from tryingsnake.stream import (
+    try_iter,
+    try_imap,
+    try_ifilter,
+    partition,
+    chunked,
+    take_until_failure,
+)
+
+
+class StreamTestCase(unittest.TestCase):
+    def test_try_iter_should_stop_after_failure(self):
+        def f():
+            yield 1
+            raise ValueError()
+            yield 2  # pragma: no cover
+
+        result = list(try_iter(f()))
+        self.assertEqual(result, [Success(1), Failure(ValueError())])
+
+    def test_try_iter_should_be_lazy(self):
+        self.assertEqual(next(try_iter(count())), Success(0))
+
+    def test_try_imap_should_match_try(self):
+        xs, ys = [1, 2, 3], [1, 0, "a"]
+        self.assertEqual(
+            list(try_imap(truediv, xs, ys)),
+            [Try(truediv, x, y) for x, y in zip(xs, ys)],
+        )
+
+    def test_try_imap_should_be_lazy(self):
+        self.assertEqual(
+            list(islice(try_imap(lambda x: -x, count()), 2)), [Success(0), Success(-1)]
+        )
+
+    def test_try_ifilter(self):
+        result = list(try_ifilter(lambda x: 1 / x > 0, [1, -1, 0]))
+        self.assertEqual(result[0], Success(1))
+        self.assertEqual(len(result), 2)
+        self.assertTrue(result[1].isFailure)
+
+    def test_partition(self):
+        values, errors = partition(try_imap(int, ["1", "a", "2", "b"]))
+        self.assertEqual(list(values), [1, 2])
+        self.assertEqual([type(e) for e in errors], [ValueError, ValueError])
+
+    def test_partition_should_interleave_without_buffering(self):
+        values, errors = partition(try_imap(int, ["1", "a"] * 10), maxbuffer=1)
+        for _ in range(10):
+            self.assertEqual(next(values), 1)
+            self.assertIsInstance(next(errors), ValueError)
+
+    def test_partition_should_bound_buffer(self):
+        values, _ = partition(try_imap(int, ["a", "b", "1"]), maxbuffer=1)
+        with pytest.raises(BufferError):
+            next(values)
+
+    def test_partition_should_reject_non_try(self):
+        values, _ = partition([1])
+        self.assertRaises(TypeError, next, values)
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 2)), [])
+        self.assertRaises(ValueError, next, chunked([], 0))
+
+    def test_take_until_failure(self):
+        tries = try_imap(int, ["1", "a", "2"])
+        result = list(take_until_failure(tries))
+        self.assertEqual(len(result), 2)
+        self.assertTrue(result[-1].isFailure)
+        # Remaining elements are not consumed
+        self.assertEqual(next(tries), Success(2))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
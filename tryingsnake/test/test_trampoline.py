@@ -0,0 +1,122 @@
+from itertools import repeat
+import unittest
+from tryingsnake import Try_, Try, Success, Failure
+from tryingsnake.metrics import MetricsRegistry
+from tryingsnake.trampoline import Trampoline
+
+N = 10**6
+# Enough to overflow the stack if evaluated recursively
+M = 10**4
+
+
+def inc(x):
+    return Success(x + 1)
+
+
+def inv(x):
+    return 1 / x
+
+
+class ChainTestCase(unittest.TestCase):
+    def test_long_chain(self):
+        self.assertEqual(Success(0).chain(repeat(inc, N)), Success(N))
+
+    def test_should_match_flat_map(self):
+        steps = [inc, lambda x: Try(inv, x - 2), inc]
+        expected = Success(1).flatMap(steps[0]).flatMap(steps[1]).flatMap(steps[2])
+        self.assertEqual(Success(1).chain(steps), expected)
+
+    def test_should_stop_at_first_failure(self):
+        steps = iter([inc, lambda x: Failure(ValueError()), inc])
+        self.assertEqual(Success(0).chain(steps), Failure(ValueError()))
+        self.assertEqual(list(steps), [inc])
+
+    def test_failure_should_not_consume_steps(self):
+        steps = iter([inc])
+        failure = Failure(ValueError())
+        self.assertIs(failure.chain(steps), failure)
+        self.assertEqual(list(steps), [inc])
+
+
+class TrampolineTestCase(unittest.TestCase):
+    def test_deep_recursion(self):
+        def count(n, acc):
+            if n == 0:
+                return Success(acc)
+            return Trampoline(Success(acc + 1)).flatMap(lambda x: count(n - 1, x))
+
+        self.assertEqual(count(N, 0).run(), Success(N))
+
+    def test_mutual_recursion_with_suspend(self):
+        def even(n):
+            return Success(True) if n == 0 else Trampoline.suspend(lambda: odd(n - 1))
+
+        def odd(n):
+            return Success(False) if n == 0 else Trampoline.suspend(lambda: even(n - 1))
+
+        self.assertEqual(even(M).run(), Success(True))
+
+    def test_long_left_nested_chain(self):
+        t = Trampoline(Success(0))
+        for _ in range(M):
+            t = t.flatMap(inc)
+        self.assertEqual(t.run(), Success(M))
+
+    def test_recover_with_recursion(self):
+        def retry(n):
+            t = Trampoline(Failure(ValueError(n)))
+            if n == 0:
+                return t.recover(lambda e: "done")
+            return t.recoverWith(lambda e: retry(n - 1))
+
+        self.assertEqual(retry(M).run(), Success("done"))
+
+    def test_should_match_eager_chain(self):
+        stages = [
+            ("map", inv),
+            ("flatMap", lambda x: Try(inv, x - 1)),
+            ("recover", lambda e: 0),
+            ("map", lambda x: x + 1),
+            ("recoverWith", lambda e: Success(-1)),
+        ]
+        for x in [1, 0, 2, 0.5]:
+            eager = Success(x)
+            lazy = Trampoline(Success(x))
+            for name, f in stages:
+                eager = getattr(eager, name)(f)
+                lazy = getattr(lazy, name)(f)
+            self.assertEqual(lazy.run(), eager)
+
+    def test_failure_should_skip_stages(self):
+        failure = Failure(ValueError())
+        t = Trampoline(failure)
+        for _ in range(M):
+            t = t.map(inv)
+        self.assertIs(t.run(), failure)
+
+    def test_exceptions_should_be_wrapped(self):
+        t = Trampoline.suspend(lambda: inv(0)).recover(lambda e: type(e))
+        self.assertEqual(t.run(), Success(ZeroDivisionError))
+
+    def test_unhandled_should_be_raised(self):
+        t = Trampoline(Success(0)).map(inv)
+        with Try_.unhandled(ZeroDivisionError):
+            self.assertRaises(ZeroDivisionError, t.run)
+
+    def test_invalid_types(self):
+        self.assertRaises(TypeError, Trampoline, 1)
+        self.assertRaises(TypeError, Trampoline(Success(1)).flatMap(str).run)
+
+    def test_should_be_reusable(self):
+        t = Trampoline(Success(1)).flatMap(inc)
+        self.assertEqual(t.run(), t.run())
+
+    def test_should_be_observed(self):
+        with MetricsRegistry() as registry:
+            Trampoline(Success(0)).map(inv).run()
+        [s] = registry.snapshot()["series"]
+        self.assertEqual((s["stage"], s["failures"]), ("map", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -1,7 +1,11 @@
 from operator import add, truediv
+import platform
+import sys
+import tracemalloc
 import unittest
 import pytest
 from tryingsnake import Try_, Try, Success, Failure
+import tryingsnake
 
 
 class TryTestCase(unittest.TestCase):
@@ -45,6 +49,17 @@ class TryTestCase(unittest.TestCase):
     def test_flatmap_should_fail_if_f_doesnt_return_try(self):
         self.assertRaises(TypeError, Success(1).flatMap, lambda x: x)
 
+    def test_short_circuit_on_failure_should_not_allocate(self):
+        failure = Failure(Exception("e"))
+        self.assertIs(failure.map(lambda x: 1), failure)
+        self.assertIs(failure.flatMap(lambda x: Success(1)), failure)
+        self.assertIs(failure.filter(lambda x: True), failure)
+
+    def test_flatmap_should_return_result_of_f(self):
+        success = Success(1)
+        self.assertIs(Success(0).flatMap(lambda x: success), success)
+        self.assertIs(Failure(Exception("e")).recoverWith(lambda x: success), success)
+
     def test_map_on_failure_should_return_failure(self):
         self.assertTrue(Failure(Exception("")).map(lambda x: 1).isFailure)
 
@@ -147,6 +162,105 @@ class TryTestCase(unittest.TestCase):
         Try_.set_unhandled()
         self.assertTrue(Try(getitem, [1], 3).isFailure)
 
+    def test_unhandled_scope_should_override_default(self):
+        from operator import getitem
+
+        with Try_.unhandled(IndexError):
+            self.assertRaises(IndexError, Try, getitem, [1], 3)
+            with Try_.unhandled():
+                self.assertTrue(Try(getitem, [1], 3).isFailure)
+            self.assertRaises(IndexError, Success([1]).flatMap, lambda x: x[3])
+        self.assertTrue(Try(getitem, [1], 3).isFailure)
+
+        Try_.set_unhandled([IndexError])
+        try:
+            with Try_.unhandled(KeyError):
+                self.assertTrue(Try(getitem, [1], 3).isFailure)
+            self.assertRaises(IndexError, Try, getitem, [1], 3)
+        finally:
+            Try_.set_unhandled()
+
+    def test_unhandled_scope_should_be_local_to_thread(self):
+        import threading
+        from operator import getitem
+
+        results = []
+        with Try_.unhandled(IndexError):
+            thread = threading.Thread(
+                target=lambda: results.append(Try(getitem, [], 0))
+            )
+            thread.start()
+            thread.join()
+        self.assertTrue(results[0].isFailure)
+
+    def test_unhandled_scope_should_be_local_to_task(self):
+        import asyncio
+
+        async def scoped(es):
+            with Try_.unhandled(*es):
+                await asyncio.sleep(0)
+                return Try(int, "a")
+
+        async def main():
+            return await asyncio.gather(
+                scoped([ValueError]), scoped([]), return_exceptions=True
+            )
+
+        raised, failure = asyncio.run(main())
+        self.assertIsInstance(raised, ValueError)
+        self.assertTrue(failure.isFailure)
+
+    def test_full_capture_should_keep_traceback(self):
+        failure = Try(truediv, 1, 0)
+        self.assertIsNotNone(failure._v.__traceback__)
+        self.assertEqual(failure.stack[-1].name, "Try")
+
+    def test_summary_capture_should_keep_only_stack_summary(self):
+        def f():
+            try:
+                {}["a"]
+            except KeyError:
+                raise ValueError("e")
+
+        with Try_.capture("summary"):
+            failure = Try(f)
+        e = failure._v
+        self.assertIsNone(e.__traceback__)
+        self.assertIsNone(e.__context__.__traceback__)
+        self.assertEqual(failure.stack[-1].name, "f")
+        self.assertRaises(ValueError, failure.get)
+        if sys.version_info >= (3, 11):
+            self.assertRaises(ValueError, failure.get)
+            (note,) = e.__notes__
+            self.assertIn("in f", note)
+
+    def test_none_capture_should_drop_traceback(self):
+        with Try_.capture("none"):
+            failure = Try(truediv, 1, 0)
+        self.assertIsNone(failure._v.__traceback__)
+        self.assertEqual(len(failure.stack), 0)
+        self.assertRaises(ZeroDivisionError, failure.get)
+
+    def test_capture_should_be_restored_after_context(self):
+        with Try_.capture("none"):
+            pass
+        self.assertIsNotNone(Try(truediv, 1, 0)._v.__traceback__)
+
+    def test_set_capture_should_set_global_policy(self):
+        Try_.set_capture("none")
+        try:
+            self.assertIsNone(Try(truediv, 1, 0)._v.__traceback__)
+            with Try_.capture("full"):
+                self.assertIsNotNone(Try(truediv, 1, 0)._v.__traceback__)
+        finally:
+            Try_.set_capture()
+
+    def test_invalid_capture_policy_should_be_rejected(self):
+        self.assertRaises(ValueError, Try_.set_capture, "partial")
+        with pytest.raises(ValueError):
+            with Try_.capture("partial"):
+                pass  # pragma: no cover
+
     def test_truthness(self):
         self.assertFalse(Failure(Exception("e")))
         self.assertTrue(Success(1))
@@ -168,6 +282,27 @@ class TryTestCase(unittest.TestCase):
         with pytest.raises(TypeError):
             hash(Failure(UnhashableException()))
 
+    def test_instances_should_be_slotted(self):
+        for t in [Success(1), Failure(Exception("e"))]:
+            self.assertFalse(hasattr(t, "__dict__"))
+            self.assertFalse(hasattr(t, "__weakref__"))
+
+    @pytest.mark.skipif(
+        platform.python_implementation() != "CPython", reason="Requires tracemalloc"
+    )
+    def test_memory_per_instance(self):
+        n = 10_000
+        xs = [None] * n
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for i in range(n):
+                xs[i] = Success(None)
+            per_instance = (tracemalloc.get_traced_memory()[0] - before) / n
+        finally:
+            tracemalloc.stop()
+        self.assertLessEqual(per_instance, sys.getsizeof(Success(None)) + 1)
+
     def test_generator_without_arguments(self):
         g = (lambda: (yield 1))()
         self.assertEqual(Try(g).map(lambda x: x + 1), Success(2))
@@ -182,11 +317,74 @@ class TryTestCase(unittest.TestCase):
         g.send(None)
         self.assertEqual(Try(g, 41).map(lambda x: x + 1), Success(42))
 
+    def test_flatMap_and_recoverWith_should_send_to_generator(self):
+        def primed(f):
+            def gen():
+                x = yield
+                while True:
+                    x = yield Success(f(x))
+
+            g = gen()
+            next(g)
+            return g
+
+        self.assertEqual(Success(3).flatMap(primed(lambda x: x * 2)), Success(6))
+        g = primed(lambda e: e.args[0])
+        self.assertEqual(Failure(Exception(4)).recoverWith(g), Success(4))
+        self.assertTrue(Success(3).flatMap(iter([])).isFailure)
+
+    def test_iterator_without_arguments(self):
+        it = iter([1])
+        self.assertEqual(Try(it), Success(1))
+        self.assertTrue(Try(it).isFailure)
+
     def test_generator_failure_with_arguments(self):
         g = (lambda: (yield 1))()
 
         self.assertTrue(Try(g, a=1).map(lambda x: x + 1).isFailure)
 
+    def test_sequence_should_short_circuit(self):
+        consumed = []
+
+        def ts():
+            for t in [Success(1), Failure(ValueError("a")), Success(2)]:
+                consumed.append(t)
+                yield t
+
+        self.assertEqual(Try_.sequence(ts()), Failure(ValueError("a")))
+        self.assertEqual(len(consumed), 2)
+        self.assertEqual(Try_.sequence(iter([Success(1), Success(2)])), Success([1, 2]))
+        self.assertEqual(Try_.sequence([]), Success([]))
+
+    def test_sequence_should_accumulate_failures(self):
+        ts = [Failure(ValueError("a")), Success(1), Failure(KeyError("b"))]
+        group = Try_.sequence(iter(ts), accumulate=True).failed().get()
+        self.assertIsInstance(group, tryingsnake.ExceptionGroup)
+        self.assertEqual(group.exceptions, (ts[0]._v, ts[2]._v))
+        self.assertEqual(Try_.sequence([Success(1)], accumulate=True), Success([1]))
+
+    def test_sequence_should_reject_invalid_elements(self):
+        self.assertRaises(TypeError, Try_.sequence, [Success(1), 2])
+
+    def test_traverse(self):
+        xs = iter(["1", "a", "2"])
+        self.assertEqual(
+            Try_.traverse(int, xs), Try_.sequence(Try(int, x) for x in ["1", "a"])
+        )
+        self.assertEqual(list(xs), ["2"])
+        self.assertEqual(Try_.traverse(int, ["1", "2"]), Success([1, 2]))
+
+    def test_traverse_should_accumulate_failures(self):
+        failure = Try_.traverse(int, ["a", "1", "b"], accumulate=True)
+        self.assertEqual(
+            [type(e) for e in failure.failed().get().exceptions],
+            [ValueError, ValueError],
+        )
+
+    def test_traverse_should_raise_unhandled(self):
+        with Try_.unhandled(ValueError):
+            self.assertRaises(ValueError, Try_.traverse, int, ["a"], True)
+
 
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
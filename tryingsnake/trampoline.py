@@ -0,0 +1,156 @@
+import tryingsnake
+from tryingsnake import Try_, Success, Failure, _unhandled_exceptions
+
+_PURE, _SUSPEND, _MAP, _FLATMAP, _RECOVER, _RECOVER_WITH = range(6)
+_STAGES = (None, None, "map", "flatMap", "recover", "recoverWith")
+
+
+class Trampoline:
+    """A lazily evaluated chain of Try_ combinators.
+
+    Combinators only record the stage, and run evaluates the whole chain
+    in a loop with an explicit stack of continuations.
+    Functions passed to flatMap and recoverWith can return either Try_
+    or another Trampoline, so recursive definitions and chains of any
+    length run in constant stack depth and linear time.
+
+    Results are the same as for the equivalent chain of eager calls.
+
+    :param t: Try_ at the start of the chain
+
+    >>> from tryingsnake import Success
+    >>> def count(n, acc=0):
+    ...     if n == 0:
+    ...         return Success(acc)
+    ...     return Trampoline(Success(acc + 1)).flatMap(lambda x: count(n - 1, x))
+    >>> count(100_000).run()
+    Success(100000)
+    """
+
+    __slots__ = ("_kind", "_source", "_f")
+
+    def __init__(self, t):
+        self._kind = _PURE
+        self._source = Try_._identity_if_try_or_raise(t, "Invalid type for t: {0}")
+        self._f = None
+
+    @staticmethod
+    def _node(kind, source, f):
+        node = Trampoline.__new__(Trampoline)
+        node._kind = kind
+        node._source = source
+        node._f = f
+        return node
+
+    @staticmethod
+    def suspend(f):
+        """Start a chain with a deferred call.
+
+        :param f: function without arguments returning Try_ or Trampoline
+        :return: Trampoline
+
+        >>> from tryingsnake import Success
+        >>> Trampoline.suspend(lambda: Trampoline.suspend(lambda: Success(1))).run()
+        Success(1)
+        """
+        return Trampoline._node(_SUSPEND, None, f)
+
+    def __repr__(self):
+        if self._kind == _PURE:
+            return "Trampoline({0!r})".format(self._source)
+        return "Trampoline(...)"
+
+    def map(self, f):
+        """Add Try_.map stage.
+
+        >>> from tryingsnake import Success
+        >>> Trampoline(Success(1)).map(str).run()
+        Success('1')
+        """
+        return Trampoline._node(_MAP, self, f)
+
+    def flatMap(self, f):
+        """Add Try_.flatMap stage.
+
+        :param f: function returning Try_ or Trampoline
+        """
+        return Trampoline._node(_FLATMAP, self, f)
+
+    def recover(self, f):
+        """Add Try_.recover stage."""
+        return Trampoline._node(_RECOVER, self, f)
+
+    def recoverWith(self, f):
+        """Add Try_.recoverWith stage.
+
+        :param f: function returning Try_ or Trampoline
+        """
+        return Trampoline._node(_RECOVER_WITH, self, f)
+
+    def run(self):
+        """Evaluate the chain.
+
+        :return: Try_
+
+        >>> from tryingsnake import Success
+        >>> (Trampoline(Success(0))
+        ...     .map(lambda x: 1 / x)
+        ...     .recoverWith(lambda e: Trampoline(Success(-1)))
+        ...     .run())
+        Success(-1)
+        """
+        # Pending stages, the next one last
+        stack = []
+        pop = stack.pop
+        node = self
+        while True:
+            while node._kind != _PURE:
+                if node._kind == _SUSPEND:
+                    r = _call(node._f)
+                    if isinstance(r, Trampoline):
+                        node = r
+                        continue
+                    t = Try_._identity_if_try_or_raise(r)
+                    break
+                stack.append(node)
+                node = node._source
+            else:
+                t = node._source
+
+            while stack:
+                node = pop()
+                kind = node._kind
+                if (kind < _RECOVER) is not isinstance(t, Success):
+                    continue
+                f = node._f
+                if tryingsnake._observers:
+                    f = tryingsnake._observe(_STAGES[kind], f)
+                try:
+                    r = f(t._v)
+                except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+                    raise e
+                except Exception as e:
+                    t = Failure(e)
+                    continue
+                if kind == _MAP or kind == _RECOVER:
+                    t = Success(r)
+                elif isinstance(r, Try_):
+                    t = r
+                elif isinstance(r, Trampoline):
+                    node = r
+                    break
+                else:
+                    Try_._identity_if_try_or_raise(r)
+            else:
+                return t
+
+
+def _call(f):
+    if tryingsnake._observers:
+        f = tryingsnake._observe("Try", f)
+    try:
+        return f()
+    except _unhandled_exceptions.get(Try_._unhandled) as e:  # type: ignore
+        raise e
+    except Exception as e:
+        return Failure(e)
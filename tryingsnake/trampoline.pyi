@@ -0,0 +1,19 @@
+from typing import Any, Callable, Generic, TypeVar, Union
+from tryingsnake import Try_
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+class Trampoline(Generic[T]):
+    def __init__(self, t: Try_[T]) -> None: ...
+    @staticmethod
+    def suspend(f: Callable[[], Union[Try_[T], Trampoline[T]]]) -> Trampoline[T]: ...
+    def map(self, f: Callable[[T], U]) -> Trampoline[U]: ...
+    def flatMap(
+        self, f: Callable[[T], Union[Try_[U], Trampoline[U]]]
+    ) -> Trampoline[U]: ...
+    def recover(self, f: Callable[[Exception], T]) -> Trampoline[T]: ...
+    def recoverWith(
+        self, f: Callable[[Exception], Union[Try_[T], Trampoline[T]]]
+    ) -> Trampoline[T]: ...
+    def run(self) -> Try_[T]: ...